@@ -14,6 +14,7 @@ import os
 import socket
 import sys
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
@@ -103,6 +104,11 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
+        # With no explicit "loaders" option, Django wraps the filesystem and
+        # app-directories loaders in cached.Loader whenever template debug is
+        # off (i.e. DEBUG=False), so production template lookups are already
+        # dict hits — no extra configuration needed, and setting "loaders"
+        # by hand would conflict with APP_DIRS.
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -123,7 +129,9 @@ WSGI_APPLICATION = "ainews.wsgi.application"
 
 # PostgreSQL configuration
 # Support both POSTGRES_APP_* (production) and POSTGRES_* (local dev) naming
-DATABASES = {
+# Annotated loosely: the test branches below swap in backend dicts whose
+# OPTIONS values differ in shape from the PostgreSQL ones
+DATABASES: dict[str, dict[str, Any]] = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": os.getenv("POSTGRES_APP_DB") or os.getenv("POSTGRES_DB"),
@@ -161,6 +169,15 @@ if "test" in sys.argv:
         DATABASES["default"] = {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": ":memory:",
+            "OPTIONS": {
+                # Fixture inserts need no durability: skip fsync and keep
+                # temp structures and a generous page cache in memory.
+                "init_command": (
+                    "PRAGMA synchronous=OFF;"
+                    " PRAGMA temp_store=MEMORY;"
+                    " PRAGMA cache_size=-65536;"
+                ),
+            },
         }
     # Disable rate limiting during tests
     RATELIMIT_ENABLE = False
@@ -172,6 +189,18 @@ if "test" in sys.argv:
     }  # type: ignore[var-annotated]
     # Silence django-ratelimit warnings for DummyCache
     SILENCED_SYSTEM_CHECKS = ["django_ratelimit.E003", "django_ratelimit.W001"]
+    # Skip migration replay for contrib apps: their tables are created
+    # directly from model state when the test database is built. The news
+    # app keeps its migrations because they install the pgvector extension.
+    MIGRATION_MODULES = {
+        "admin": None,
+        "auth": None,
+        "contenttypes": None,
+        "sessions": None,
+    }
+    # Fast hasher for any test that creates a user; nothing here needs
+    # real password security.
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 
 # Password validation
@@ -321,5 +350,15 @@ RATELIMIT_ENABLE = True
 RATELIMIT_USE_CACHE = "default"
 SEARCH_RATE_LIMIT = "100/h"  # Rate limit for search endpoint (requests per hour)
 
+# Search result caching
+# Short TTL: trending queries repeat within seconds, but results should
+# track new articles closely. Stored as (ids, count) tuples, not querysets.
+SEARCH_CACHE_TTL = 60  # 1 minute in seconds
+
+# Query embedding caching
+# Longer TTL than the result cache: a query's embedding never changes, so
+# repeated and paginated searches can skip the AWS embedding round trip.
+EMBEDDING_CACHE_TTL = 600  # 10 minutes in seconds
+
 # Google Analytics
 GOOGLE_ANALYTICS_ID = os.getenv("GOOGLE_ANALYTICS_ID")
@@ -23,8 +23,10 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import include, path
 from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
 
-from news.sitemaps import NewsSitemap, TagSitemap
+from news.sitemaps import NewsSitemap, TagSitemap, sitemap_last_modified
 from news.views import KeybaseTxtView, RobotsTxtView
 
 
@@ -79,8 +81,15 @@ urlpatterns = [
     path("robots.txt", RobotsTxtView.as_view(), name="robots_txt"),
     path(
         "sitemap.xml",
-        cache_page(settings.CACHE_TTL)(sitemap),
-        {"sitemaps": sitemaps},
+        # Conditional GET runs first so If-Modified-Since requests get a 304
+        # without touching the page cache or regenerating the XML. gzip sits
+        # inside the cache so compressed bytes are stored, not recompressed.
+        condition(last_modified_func=sitemap_last_modified)(
+            cache_page(settings.CACHE_TTL)(gzip_page(sitemap))
+        ),
+        # The custom template emits one line per URL without the default
+        # template's spaceless pass over the whole rendered body.
+        {"sitemaps": sitemaps, "template_name": "news/sitemap.xml"},
         name="sitemap",
     ),
 ]
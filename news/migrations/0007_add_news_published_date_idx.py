@@ -0,0 +1,25 @@
+# Partial index for the published listing/sitemap scans.
+# Those queries always filter on status + deleted_at, and the listing sorts
+# by the full (-article_date, -article_id) key, so both columns are indexed.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0006_create_articles_model"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="news",
+            index=models.Index(
+                condition=models.Q(
+                    ("deleted_at__isnull", True), ("status", "published")
+                ),
+                fields=["-article_date", "-article"],
+                name="news_published_date_idx",
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Any, Dict, cast
 
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from pgvector.django import VectorField
 
@@ -82,6 +83,18 @@ class News(models.Model):
         ordering = ["-created_at", "-article_date"]
         verbose_name = "News Article"
         verbose_name_plural = "News Articles"
+        indexes = [
+            # Partial index covering the published listing/sitemap scans,
+            # which always filter on status + deleted_at and sort by date.
+            # article_id is included so the listing's full
+            # (-article_date, -article_id) ORDER BY is satisfied by the
+            # index alone, with no tie-breaking sort step.
+            models.Index(
+                fields=["-article_date", "-article"],
+                name="news_published_date_idx",
+                condition=models.Q(status="published", deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title or f"News Article {self.id}"
@@ -96,10 +109,11 @@ class News(models.Model):
         """Return LLM summary if available, otherwise original summary"""
         return self.llm_summary or self.summary or ""
 
-    @property
+    @cached_property
     def slug(self) -> str:
         """Generate a URL-friendly slug from the headline on-demand"""
-        # Use LLM headline if available, otherwise original title
+        # Cached per instance: detail pages read the slug for the canonical
+        # link, Open Graph URL, and JSON-LD, and slugify is pure string work.
         source_text = self.llm_headline or self.title or f"article-{self.id}"
         return slugify(source_text)
 
@@ -107,10 +121,7 @@ class News(models.Model):
         """Return the absolute URL for the news article"""
         from django.urls import reverse
 
-        # Use display_title for generating the slug in the URL
-        title = self.display_title
-        slug = slugify(title)
-        return reverse("news:detail", kwargs={"news_id": self.id, "slug": slug})
+        return reverse("news:detail", kwargs={"news_id": self.id, "slug": self.slug})
 
 
 class Article(models.Model):
@@ -243,6 +254,11 @@ class Tag(models.Model):
         """Return the tag name (flat structure)"""
         return self.name
 
+    @cached_property
+    def hierarchy_parts(self) -> list[str]:
+        """Return the hierarchy path segments, split once per instance"""
+        return self.hierarchy_path.split(" > ") if self.hierarchy_path else []
+
     def get_news_count(self) -> int:
         """Get count of published news articles that have this tag"""
         # Query published news articles that have this tag in their llm_tags array
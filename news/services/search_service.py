@@ -7,10 +7,13 @@ Provides three search modes:
 3. Hybrid search - Combines vector and text search for best results
 """
 
+import hashlib
 import re
 import time
 from typing import Optional
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import connection
 from django.db.models import Q, QuerySet
 
@@ -19,6 +22,29 @@ from ..metrics import SEARCH_DURATION, SEARCH_QUERIES
 from ..models import News
 
 
+def _query_embedding(query: str) -> Optional[list[float]]:
+    """
+    Return the query's embedding vector, cached briefly across requests.
+
+    Embedding generation is a signed round trip to the AWS endpoint — by far
+    the slowest step of a vector search — and a query's vector never changes,
+    so it is cached keyed on the normalized query text. Repeated searches and
+    pagination of the same query reuse the vector and pay only for the index
+    lookup. get_or_set never stores None, so failed generations are retried
+    on the next request.
+    """
+    key = (
+        "embed:"
+        + hashlib.blake2b(query.strip().lower().encode(), digest_size=12).hexdigest()
+    )
+    embedding: Optional[list[float]] = cache.get_or_set(
+        key,
+        lambda: get_embedding_service().generate_embedding(query),
+        settings.EMBEDDING_CACHE_TTL,
+    )
+    return embedding
+
+
 class SearchService:
     """Service for searching news articles using various search strategies."""
 
@@ -42,9 +68,8 @@ class SearchService:
         """
         start_time = time.time()
         try:
-            # Generate embedding for the search query
-            embedding_service = get_embedding_service()
-            query_embedding = embedding_service.generate_embedding(query)
+            # Generate (or reuse the cached) embedding for the search query
+            query_embedding = _query_embedding(query)
 
             if not query_embedding:
                 return News.objects.none()
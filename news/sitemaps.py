@@ -1,12 +1,30 @@
+from datetime import datetime
 from typing import Any, Optional
 
 from django.contrib.sitemaps import Sitemap
-from django.db.models import QuerySet
-from django.utils.text import slugify
+from django.db.models import Max, QuerySet
+from django.http import HttpRequest
 
 from .models import News, Tag
 
 
+def sitemap_last_modified(request: HttpRequest, **kwargs: Any) -> Optional[datetime]:
+    """
+    Return the most recent change date across sitemap content.
+
+    Used by the `condition` decorator on the sitemap URL so that crawlers
+    sending If-Modified-Since get a 304 without regenerating the XML.
+    """
+    # Tags carry no timestamps, so article activity is the freshness signal
+    # for both sections of the sitemap.
+    news_dates = News.objects.filter(
+        status="published", deleted_at__isnull=True
+    ).aggregate(updated=Max("updated_at"), created=Max("created_at"))
+
+    candidates = [value for value in news_dates.values() if value is not None]
+    return max(candidates, default=None)
+
+
 class NewsSitemap(Sitemap):
     """
     Sitemap for published news articles.
@@ -17,9 +35,21 @@ class NewsSitemap(Sitemap):
 
     def items(self) -> QuerySet[News]:
         """Return all published news articles."""
-        return News.objects.filter(
-            status="published", deleted_at__isnull=True
-        ).order_by("-article_date")
+        # Load only the columns location()/lastmod() touch; the full rows
+        # drag in embeddings, article bodies, and ArrayFields for every
+        # entry in the sitemap.
+        return (
+            News.objects.filter(status="published", deleted_at__isnull=True)
+            .only(
+                "id",
+                "title",
+                "llm_headline",
+                "article_date",
+                "updated_at",
+                "created_at",
+            )
+            .order_by("-article_date")
+        )
 
     def lastmod(self, obj: News) -> Optional[Any]:
         """Return the last modification date for the article."""
@@ -33,10 +63,7 @@ class NewsSitemap(Sitemap):
 
     def location(self, obj: News) -> str:
         """Return the URL for the news article."""
-        # Use the display_title property to get the best available title for slug generation
-        title = obj.display_title
-        slug = slugify(title)
-        return f"/{obj.id}/{slug}"
+        return f"/{obj.id}/{obj.slug}"
 
 
 class TagSitemap(Sitemap):
@@ -47,26 +74,35 @@ class TagSitemap(Sitemap):
     changefreq = "monthly"
     priority = 0.6
 
+    _latest_by_tag: dict[str, datetime]
+
     def items(self) -> QuerySet[Tag]:
         """Return all tags."""
+        # Refresh the lastmod lookup once per render; lastmod() is called
+        # for every tag row and used to issue a query each time.
+        self._latest_by_tag = self._latest_article_dates()
         return Tag.objects.all().order_by("name")
 
+    @staticmethod
+    def _latest_article_dates() -> dict[str, datetime]:
+        """Map each tag name to its newest published article date."""
+        latest: dict[str, datetime] = {}
+        rows = News.objects.filter(
+            status="published", deleted_at__isnull=True, article_date__isnull=False
+        ).values_list("llm_tags", "article_date")
+        for tag_names, article_date in rows:
+            # article_date__isnull=False filters NULLs in SQL, but the
+            # values_list type is still Optional — narrow it for mypy
+            if article_date is None:
+                continue
+            for name in tag_names or ():
+                if name not in latest or article_date > latest[name]:
+                    latest[name] = article_date
+        return latest
+
     def lastmod(self, obj: Tag) -> Optional[Any]:
         """Return the last modification date for the tag."""
-        # Use the most recent article with this tag for lastmod
-        latest_article = (
-            News.objects.filter(
-                llm_tags__contains=[obj.name],
-                status="published",
-                deleted_at__isnull=True,
-            )
-            .order_by("-article_date")
-            .first()
-        )
-
-        if latest_article and latest_article.article_date:
-            return latest_article.article_date
-        return None
+        return self._latest_by_tag.get(obj.name)
 
     def location(self, obj: Tag) -> str:
         """Return the URL for the tag page."""
@@ -13,9 +13,64 @@ from django.utils import timezone
 from news.models import News, Tag
 
 
+def _bare_news(
+    title: str | None = None,
+    llm_headline: str | None = None,
+    summary: str | None = None,
+    llm_summary: str | None = None,
+) -> News:
+    """
+    Build an unsaved News instance without going through the ORM save path.
+
+    Property tests only evaluate display_title/display_summary/slug, which
+    read a handful of attributes. Bypassing ``News.objects.create`` (which
+    walks ``_meta.fields`` and issues an INSERT) keeps these tests free of
+    DB work. Not suitable for tests that rely on defaults or ``id``.
+    """
+    obj = News.__new__(News)
+    obj.title = title
+    obj.llm_headline = llm_headline
+    obj.summary = summary
+    obj.llm_summary = llm_summary
+    return obj
+
+
 class NewsModelTests(TestCase):
     """Test cases for the News model."""
 
+    databases = {"default"}
+
+    no_title_article: News
+    basic_article: News
+    llm_headline_article: News
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create shared exemplar articles for URL/slug behavior tests."""
+        cls.no_title_article = News.objects.create(
+            title=None,
+            llm_headline=None,
+            status="published",
+            deleted_at=None,
+            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
+            llm_tags=["Test", "News"],
+        )
+        cls.basic_article = News.objects.create(
+            title="Test Article",
+            status="published",
+            deleted_at=None,
+            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
+            llm_tags=["Test", "News"],
+        )
+        cls.llm_headline_article = News.objects.create(
+            title="Original Title",
+            llm_headline="AI Headline",
+            status="published",
+            deleted_at=None,
+            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
+            llm_tags=["Test", "News"],
+        )
+
     def setUp(self) -> None:
         """Set up test data for News model tests."""
         self.article_date = timezone.now()
@@ -91,26 +146,14 @@ class NewsModelTests(TestCase):
 
     def test_display_title_uses_llm_headline(self) -> None:
         """Test that display_title prefers llm_headline over title."""
-        article = News.objects.create(
-            title="Original Title",
-            llm_headline="AI-Generated Headline",
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
+        article = _bare_news(
+            title="Original Title", llm_headline="AI-Generated Headline"
         )
         self.assertEqual(article.display_title, "AI-Generated Headline")
 
     def test_display_title_fallback_to_title(self) -> None:
         """Test that display_title falls back to title when llm_headline is empty."""
-        article = News.objects.create(
-            title="Original Title",
-            llm_headline=None,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
+        article = _bare_news(title="Original Title", llm_headline=None)
         self.assertEqual(article.display_title, "Original Title")
 
     def test_display_title_fallback_to_article_id(self) -> None:
@@ -127,41 +170,19 @@ class NewsModelTests(TestCase):
 
     def test_display_summary_uses_llm_summary(self) -> None:
         """Test that display_summary prefers llm_summary over summary."""
-        article = News.objects.create(
-            title="Test",
-            summary="Original summary",
-            llm_summary="AI-generated summary",
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
+        article = _bare_news(
+            summary="Original summary", llm_summary="AI-generated summary"
         )
         self.assertEqual(article.display_summary, "AI-generated summary")
 
     def test_display_summary_fallback_to_summary(self) -> None:
         """Test that display_summary falls back to summary when llm_summary is empty."""
-        article = News.objects.create(
-            title="Test",
-            summary="Original summary",
-            llm_summary=None,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
+        article = _bare_news(summary="Original summary", llm_summary=None)
         self.assertEqual(article.display_summary, "Original summary")
 
     def test_display_summary_fallback_to_empty_string(self) -> None:
         """Test that display_summary returns empty string when both are empty."""
-        article = News.objects.create(
-            title="Test",
-            summary=None,
-            llm_summary=None,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
+        article = _bare_news(summary=None, llm_summary=None)
         self.assertEqual(article.display_summary, "")
 
     def test_slug_property_generates_url_safe_slug(self) -> None:
@@ -175,25 +196,12 @@ class NewsModelTests(TestCase):
         ]
 
         for title, expected_slug in test_cases:
-            article = News.objects.create(
-                title=title,
-                status="published",
-                deleted_at=None,
-                llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-                llm_tags=["Test", "News"],
-            )
+            article = _bare_news(title=title)
             self.assertEqual(article.slug, expected_slug)
-            article.delete()
 
     def test_slug_handles_special_characters(self) -> None:
         """Test that slug handles special characters properly."""
-        article = News.objects.create(
-            title="Test @ Article: with (special) [chars]!",
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
+        article = _bare_news(title="Test @ Article: with (special) [chars]!")
         # Should remove or convert special characters
         self.assertNotIn("@", article.slug)
         self.assertNotIn(":", article.slug)
@@ -208,91 +216,52 @@ class NewsModelTests(TestCase):
         long_title = (
             "This is an extremely long article title that goes on and on and on " * 5
         )
-        article = News.objects.create(
-            title=long_title,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
+        article = _bare_news(title=long_title)
         # Slug should be generated (may be truncated)
         self.assertIsNotNone(article.slug)
         self.assertTrue(len(article.slug) > 0)
 
     # Method Tests
 
-    def test_get_absolute_url_returns_correct_format(self) -> None:
-        """Test that get_absolute_url returns correct URL format."""
-        article = News.objects.create(
-            title="Test Article",
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
-        url = article.get_absolute_url()
-        self.assertTrue(url.startswith("/"))
-        self.assertIn(str(article.id), url)
-        self.assertIn(article.slug, url)
-        self.assertEqual(url, f"/{article.id}/{article.slug}")
-
-    def test_get_absolute_url_uses_display_title_for_slug(self) -> None:
-        """Test that get_absolute_url uses display_title for slug generation."""
-        article = News.objects.create(
-            title="Original Title",
-            llm_headline="AI Headline",
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
-        url = article.get_absolute_url()
-        # Should use llm_headline (display_title) for slug
-        self.assertIn("ai-headline", url)
-        self.assertNotIn("original-title", url)
+    def test_url_and_crash_behaviors(self) -> None:
+        """Test get_absolute_url format, slug source, and no-title handling."""
+        with self.subTest("no-title"):
+            # Articles with no title or headline should not cause crashes
+            article = self.no_title_article
+            _ = article.display_title
+            _ = article.slug
+            _ = article.get_absolute_url()
+
+        with self.subTest("basic"):
+            # get_absolute_url returns the correct URL format
+            article = self.basic_article
+            url = article.get_absolute_url()
+            self.assertTrue(url.startswith("/"))
+            self.assertIn(str(article.id), url)
+            self.assertIn(article.slug, url)
+            self.assertEqual(url, f"/{article.id}/{article.slug}")
+
+        with self.subTest("llm-headline"):
+            # get_absolute_url uses llm_headline (display_title) for the slug
+            url = self.llm_headline_article.get_absolute_url()
+            self.assertIn("ai-headline", url)
+            self.assertNotIn("original-title", url)
 
     # Edge Cases
 
-    def test_article_with_no_title_or_headline_does_not_crash(self) -> None:
-        """Test that articles with no title or headline don't cause crashes."""
-        article = News.objects.create(
-            title=None,
-            llm_headline=None,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
-        # Should not raise exceptions
-        _ = article.display_title
-        _ = article.slug
-        _ = article.get_absolute_url()
-        self.assertTrue(True)  # If we got here, no crashes occurred
-
-    def test_article_with_empty_llm_tags_array(self) -> None:
-        """Test article with empty llm_tags array."""
-        article = News.objects.create(
-            title="Test Empty Tags",
+    def test_default_field_values(self) -> None:
+        """Test null image_url and empty llm_tags on an unsaved instance."""
+        article = News(
+            title="Test",
+            image_url=None,
             llm_tags=[],
             llm_bullets=[],
             status="published",
-            deleted_at=None,
         )
+        self.assertIsNone(article.image_url)
         self.assertEqual(article.llm_tags, [])
         self.assertIsInstance(article.llm_tags, list)
 
-    def test_article_with_null_image_url(self) -> None:
-        """Test article with null/empty image_url."""
-        article = News.objects.create(
-            title="Test",
-            image_url=None,
-            status="published",
-            deleted_at=None,
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "News"],
-        )
-        self.assertIsNone(article.image_url)
-
     def test_article_with_very_long_title(self) -> None:
         """Test article with very long title (>200 chars)."""
         long_title = "A" * 300
@@ -314,6 +283,8 @@ class NewsModelTests(TestCase):
 class TagModelTests(TestCase):
     """Test cases for the Tag model."""
 
+    databases = {"default"}
+
     # Slug Generation Tests
 
     def test_auto_generates_slug_on_save(self) -> None:
@@ -406,6 +377,8 @@ class TagModelTests(TestCase):
 class TagManagerTests(TestCase):
     """Test cases for the Tag manager."""
 
+    databases = {"default"}
+
     def setUp(self) -> None:
         """Set up test data."""
         self.tag1 = Tag.objects.create(name="Python", slug="python")
@@ -3,219 +3,248 @@ Test cases for search functionality.
 
 Tests validate vector search, text search, hybrid search, and edge cases.
 All tests mock the AWS embedding service to avoid external API calls.
+
+Shared fixtures are created in ``setUpTestData`` and live in the class-level
+transaction, so they survive ``--keepdb`` runs and work against an in-memory
+SQLite test database. Treat them as read-only: a test that needs to mutate a
+shared row must re-fetch its own copy (e.g. ``News.objects.get(pk=...)``)
+rather than calling ``save()`` on the class attribute. Test-specific rows
+(draft/deleted variants) are still created inside the test that needs them.
 """
 
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
-from django.test import Client, TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
 from news.models import News
 
+if TYPE_CHECKING:
+    from unittest.mock import _patch
+
+# Shared across fixtures and mocks; embeddings are serialized to the DB and
+# never mutated by tests, so a single list per value is safe to reuse.
+# content_embedding is a pgvector VectorField, so these lists go through the
+# field's native vector adapter on INSERT — there is no JSON encoding step to
+# bypass with a pre-packed bytes payload.
+EMBEDDING_A = [0.1] * 768
+EMBEDDING_B = [0.2] * 768
+
+
+class StubEmbeddingService:
+    """
+    Minimal stand-in for the embedding service.
+
+    A plain class avoids MagicMock's per-call bookkeeping; recorded queries
+    are available on ``calls`` for the few tests that assert on them.
+    """
+
+    def __init__(
+        self, ret: list[float] = EMBEDDING_A, exc: Exception | None = None
+    ) -> None:
+        self.ret = ret
+        self.exc = exc
+        self.calls: list[str] = []
+
+    def generate_embedding(self, query: str) -> list[float]:
+        self.calls.append(query)
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
 
 @override_settings(RATELIMIT_ENABLE=False)
 class VectorSearchTests(TestCase):
     """Test cases for vector search functionality."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.url = reverse("news:search")
+    url: str
+    article1: News
+    article2: News
+    _patcher: "_patch[MagicMock]"
+    mock_get_service: MagicMock
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create shared test articles once per class."""
         # Create test articles with embeddings
-        self.article1 = News.objects.create(
-            title="AI and Machine Learning",
-            llm_headline="Artificial Intelligence Advances",
-            llm_summary="Article about artificial intelligence and machine learning developments",
-            llm_bullets=[
-                "Deep learning improvements",
-                "New AI models released",
-                "Industry applications growing",
-            ],
-            llm_tags=["AI", "Machine Learning", "Technology"],
-            status="published",
-            deleted_at=None,
-            content_embedding=[0.1] * 768,
-        )
-        self.article2 = News.objects.create(
-            title="Python Programming",
-            llm_headline="Python Development Best Practices",
-            llm_summary="Article about Python programming language and development techniques",
-            llm_bullets=[
-                "Performance optimization",
-                "Code quality tools",
-                "Testing frameworks",
-            ],
-            llm_tags=["Python", "Programming", "Software Development"],
-            status="published",
-            deleted_at=None,
-            content_embedding=[0.2] * 768,
+        cls.article1, cls.article2 = News.objects.bulk_create(
+            [
+                News(
+                    title="AI and Machine Learning",
+                    llm_headline="Artificial Intelligence Advances",
+                    llm_summary="Article about artificial intelligence and machine learning developments",
+                    llm_bullets=[
+                        "Deep learning improvements",
+                        "New AI models released",
+                        "Industry applications growing",
+                    ],
+                    llm_tags=["AI", "Machine Learning", "Technology"],
+                    status="published",
+                    deleted_at=None,
+                    content_embedding=EMBEDDING_A,
+                ),
+                News(
+                    title="Python Programming",
+                    llm_headline="Python Development Best Practices",
+                    llm_summary="Article about Python programming language and development techniques",
+                    llm_bullets=[
+                        "Performance optimization",
+                        "Code quality tools",
+                        "Testing frameworks",
+                    ],
+                    llm_tags=["Python", "Programming", "Software Development"],
+                    status="published",
+                    deleted_at=None,
+                    content_embedding=EMBEDDING_B,
+                ),
+            ]
         )
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_generates_query_embedding(
-        self, mock_get_service: MagicMock
-    ) -> None:
-        """Test that vector search generates embedding for query."""
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Install the embedding-service patch once for the whole class."""
+        super().setUpClass()
+        cls.url = reverse("news:search")
+        cls._patcher = patch("news.services.search_service.get_embedding_service")
+        cls.mock_get_service = cls._patcher.start()
+        cls.addClassCleanup(cls._patcher.stop)
+
+    def setUp(self) -> None:
+        """Set up a fresh stub embedding service."""
+        self.embedding_stub = StubEmbeddingService()
+        self.mock_get_service.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_service.return_value = self.embedding_stub
 
-        self.client.get(self.url + "?q=test&type=vector")
+    def test_vector_search_generates_query_embedding(self) -> None:
+        """Test that vector search generates embedding for query."""
+        # Guard against query-count regressions in the vector search path
+        with self.assertNumQueries(3):
+            self.client.get(self.url, {"q": "test", "type": "vector"})
 
-        mock_service.generate_embedding.assert_called_once_with("test")
+        self.assertEqual(self.embedding_stub.calls, ["test"])
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_only_searches_published_articles(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_vector_search_only_searches_published_articles(self) -> None:
         """Test that vector search only returns published articles."""
-        unpublished = News.objects.create(
-            title="Unpublished Article",
-            llm_headline="Draft Article",
-            llm_summary="This article is in draft status",
-            llm_bullets=["Draft content", "Not published yet", "Under review"],
-            llm_tags=["Draft"],
-            status="draft",
-            deleted_at=None,
-            content_embedding=[0.1] * 768,
+        (unpublished,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Unpublished Article",
+                    status="draft",
+                    deleted_at=None,
+                )
+            ]
         )
 
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
+        response = self.client.get(self.url, {"q": "test", "type": "vector"})
 
-        response = self.client.get(self.url + "?q=test&type=vector")
-        results = list(response.context["news_articles"])
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(unpublished.pk, result_pks)
 
-        self.assertNotIn(unpublished, results)
-
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_excludes_deleted_articles(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_vector_search_excludes_deleted_articles(self) -> None:
         """Test that vector search excludes deleted articles."""
-        deleted = News.objects.create(
-            title="Deleted Article",
-            llm_headline="Removed Article",
-            llm_summary="This article has been deleted",
-            llm_bullets=["Content removed", "No longer available", "Deleted status"],
-            llm_tags=["Deleted"],
-            status="published",
-            deleted_at=timezone.now(),
-            content_embedding=[0.1] * 768,
+        (deleted,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Deleted Article",
+                    status="published",
+                    deleted_at=timezone.now(),
+                )
+            ]
         )
 
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
+        response = self.client.get(self.url, {"q": "test", "type": "vector"})
 
-        response = self.client.get(self.url + "?q=test&type=vector")
-        results = list(response.context["news_articles"])
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(deleted.pk, result_pks)
 
-        self.assertNotIn(deleted, results)
+    def test_vector_search_handles_various_queries(self) -> None:
+        """Test that edge-case query strings are handled gracefully."""
+        with self.subTest("empty"):
+            response = self.client.get(self.url, {"q": "", "type": "vector"})
+            self.assertEqual(response.context["total_count"], 0)
+            # Should not call embedding service for empty query
+            self.assertEqual(self.embedding_stub.calls, [])
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_handles_empty_query(
-        self, mock_get_service: MagicMock
-    ) -> None:
-        """Test that empty query returns no results."""
-        mock_service = MagicMock()
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get(self.url + "?q=&type=vector")
+        with self.subTest("very-long"):
+            long_query = "test " * 200  # Very long query
+            response = self.client.get(self.url, {"q": long_query, "type": "vector"})
+            self.assertEqual(response.status_code, 200)
 
-        self.assertEqual(response.context["total_count"], 0)
-        # Should not call embedding service for empty query
-        mock_service.generate_embedding.assert_not_called()
+        with self.subTest("special-characters"):
+            special_query = "test @#$%^&*()"
+            response = self.client.get(self.url + f"?q={special_query}&type=vector")
+            self.assertEqual(response.status_code, 200)
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_handles_embedding_service_error(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_vector_search_handles_embedding_service_error(self) -> None:
         """Test that embedding service errors return empty results."""
-        mock_service = MagicMock()
-        mock_service.generate_embedding.side_effect = Exception("API Error")
-        mock_get_service.return_value = mock_service
+        self.embedding_stub.exc = Exception("API Error")
 
-        response = self.client.get(self.url + "?q=test&type=vector")
+        response = self.client.get(self.url, {"q": "test", "type": "vector"})
 
         # Should return empty results gracefully
         self.assertEqual(response.context["total_count"], 0)
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_handles_very_long_query(
-        self, mock_get_service: MagicMock
-    ) -> None:
-        """Test that very long queries are handled gracefully."""
-        long_query = "test " * 200  # Very long query
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get(self.url + f"?q={long_query}&type=vector")
-
-        self.assertEqual(response.status_code, 200)
-
-    @patch("news.services.search_service.get_embedding_service")
-    def test_vector_search_handles_special_characters(
-        self, mock_get_service: MagicMock
-    ) -> None:
-        """Test that special characters in query don't break search."""
-        special_query = "test @#$%^&*()"
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get(self.url + f"?q={special_query}&type=vector")
-
-        self.assertEqual(response.status_code, 200)
-
 
 @override_settings(RATELIMIT_ENABLE=False)
 class TextSearchTests(TestCase):
     """Test cases for text search functionality."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.url = reverse("news:search")
-
-        # Create test articles
-        self.article1 = News.objects.create(
-            title="Machine Learning Tutorial",
-            llm_headline="Complete ML Guide",
-            summary="Learn about machine learning",
-            llm_summary="Comprehensive guide to ML",
-            llm_bullets=[
-                "Introduction to ML",
-                "Supervised learning concepts",
-                "Practical examples",
-            ],
-            status="published",
-            deleted_at=None,
-            llm_tags=["AI", "ML", "Tutorial"],
-        )
-        self.article2 = News.objects.create(
-            title="Python Programming",
-            llm_headline="Python Basics",
-            summary="Python programming basics",
-            llm_summary="Learn Python programming",
-            llm_bullets=[
-                "Python syntax fundamentals",
-                "Data structures",
-                "Best practices",
-            ],
-            status="published",
-            deleted_at=None,
-            llm_tags=["Python", "Programming"],
+    url: str
+    article1: News
+    article2: News
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create shared test articles once per class."""
+        cls.article1, cls.article2 = News.objects.bulk_create(
+            [
+                News(
+                    title="Machine Learning Tutorial",
+                    llm_headline="Complete ML Guide",
+                    summary="Learn about machine learning",
+                    llm_summary="Comprehensive guide to ML",
+                    llm_bullets=[
+                        "Introduction to ML",
+                        "Supervised learning concepts",
+                        "Practical examples",
+                    ],
+                    status="published",
+                    deleted_at=None,
+                    llm_tags=["AI", "ML", "Tutorial"],
+                ),
+                News(
+                    title="Python Programming",
+                    llm_headline="Python Basics",
+                    summary="Python programming basics",
+                    llm_summary="Learn Python programming",
+                    llm_bullets=[
+                        "Python syntax fundamentals",
+                        "Data structures",
+                        "Best practices",
+                    ],
+                    status="published",
+                    deleted_at=None,
+                    llm_tags=["Python", "Programming"],
+                ),
+            ]
         )
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Resolve the search URL once for the whole class."""
+        super().setUpClass()
+        cls.url = reverse("news:search")
+
     def test_text_search_is_case_insensitive(self) -> None:
         """Test that text search is case-insensitive."""
-        response1 = self.client.get(self.url + "?q=python&type=text")
-        response2 = self.client.get(self.url + "?q=PYTHON&type=text")
+        # Guard against query-count regressions in the text search path
+        with self.assertNumQueries(3):
+            response1 = self.client.get(self.url, {"q": "python", "type": "text"})
+        response2 = self.client.get(self.url, {"q": "PYTHON", "type": "text"})
 
         # Both should return same results
         self.assertEqual(
@@ -224,215 +253,233 @@ class TextSearchTests(TestCase):
 
     def test_text_search_only_returns_published_articles(self) -> None:
         """Test that text search only returns published articles."""
-        unpublished = News.objects.create(
-            title="Unpublished Python Article",
-            status="draft",
-            deleted_at=None,
+        (unpublished,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Unpublished Python Article",
+                    status="draft",
+                    deleted_at=None,
+                )
+            ]
         )
 
-        response = self.client.get(self.url + "?q=python&type=text")
-        results = list(response.context["news_articles"])
+        response = self.client.get(self.url, {"q": "python", "type": "text"})
 
-        self.assertNotIn(unpublished, results)
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(unpublished.pk, result_pks)
 
     def test_text_search_excludes_deleted_articles(self) -> None:
         """Test that text search excludes deleted articles."""
-        deleted = News.objects.create(
-            title="Deleted Python Article",
-            status="published",
-            deleted_at=timezone.now(),
+        (deleted,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Deleted Python Article",
+                    status="published",
+                    deleted_at=timezone.now(),
+                )
+            ]
         )
 
-        response = self.client.get(self.url + "?q=python&type=text")
-        results = list(response.context["news_articles"])
-
-        self.assertNotIn(deleted, results)
+        response = self.client.get(self.url, {"q": "python", "type": "text"})
 
-    def test_text_search_handles_empty_query(self) -> None:
-        """Test that empty query returns no results."""
-        response = self.client.get(self.url + "?q=&type=text")
-        self.assertEqual(response.context["total_count"], 0)
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(deleted.pk, result_pks)
 
-    def test_text_search_handles_special_characters(self) -> None:
-        """Test that special characters are handled gracefully."""
-        response = self.client.get(self.url + "?q=@#$%&type=text")
-        self.assertEqual(response.status_code, 200)
+    def test_text_search_handles_various_queries(self) -> None:
+        """Test that edge-case query strings are handled gracefully."""
+        with self.subTest("empty"):
+            response = self.client.get(self.url, {"q": "", "type": "text"})
+            self.assertEqual(response.context["total_count"], 0)
 
-    def test_text_search_handles_very_long_query(self) -> None:
-        """Test that very long queries are handled gracefully."""
-        long_query = "test " * 200
-        response = self.client.get(self.url + f"?q={long_query}&type=text")
-        self.assertEqual(response.status_code, 200)
-
-    def test_text_search_handles_single_character_query(self) -> None:
-        """Test that single character queries work."""
-        response = self.client.get(self.url + "?q=a&type=text")
-        self.assertEqual(response.status_code, 200)
-
-    def test_text_search_handles_numeric_query(self) -> None:
-        """Test that numeric queries work."""
-        response = self.client.get(self.url + "?q=12345&type=text")
-        self.assertEqual(response.status_code, 200)
+        cases = [
+            ("special-characters", "@#$%"),
+            ("very-long", "test " * 200),
+            ("single-character", "a"),
+            ("numeric", "12345"),
+        ]
+        for label, query in cases:
+            with self.subTest(label):
+                response = self.client.get(self.url, {"q": query, "type": "text"})
+                self.assertEqual(response.status_code, 200)
 
 
 @override_settings(RATELIMIT_ENABLE=False)
 class HybridSearchTests(TestCase):
     """Test cases for hybrid search functionality."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.url = reverse("news:search")
-
-        # Create test articles
-        self.article1 = News.objects.create(
-            title="Machine Learning",
-            llm_summary="Article about ML",
-            status="published",
-            deleted_at=None,
-            content_embedding=[0.1] * 768,
-        )
-        self.article2 = News.objects.create(
-            title="Python Programming",
-            llm_summary="Article about Python",
-            status="published",
-            deleted_at=None,
-            content_embedding=[0.2] * 768,
+    url: str
+    article1: News
+    article2: News
+    _patcher: "_patch[MagicMock]"
+    mock_get_service: MagicMock
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create shared test articles once per class."""
+        cls.article1, cls.article2 = News.objects.bulk_create(
+            [
+                News(
+                    title="Machine Learning",
+                    llm_summary="Article about ML",
+                    status="published",
+                    deleted_at=None,
+                    content_embedding=EMBEDDING_A,
+                ),
+                News(
+                    title="Python Programming",
+                    llm_summary="Article about Python",
+                    status="published",
+                    deleted_at=None,
+                    content_embedding=EMBEDDING_B,
+                ),
+            ]
         )
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_hybrid_search_combines_results(self, mock_get_service: MagicMock) -> None:
-        """Test that hybrid search combines vector and text results."""
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Install the embedding-service patch once for the whole class."""
+        super().setUpClass()
+        cls.url = reverse("news:search")
+        cls._patcher = patch("news.services.search_service.get_embedding_service")
+        cls.mock_get_service = cls._patcher.start()
+        cls.addClassCleanup(cls._patcher.stop)
+
+    def setUp(self) -> None:
+        """Set up a fresh stub embedding service."""
+        self.embedding_stub = StubEmbeddingService()
+        self.mock_get_service.reset_mock(return_value=True, side_effect=True)
+        self.mock_get_service.return_value = self.embedding_stub
 
-        response = self.client.get(self.url + "?q=machine&type=hybrid")
+    def test_hybrid_search_combines_results(self) -> None:
+        """Test that hybrid search combines vector and text results."""
+        # Guard against query-count regressions in the hybrid search path
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url, {"q": "machine", "type": "hybrid"})
 
         # Should get results
         self.assertGreaterEqual(response.context["total_count"], 0)
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_hybrid_search_no_duplicate_articles(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_hybrid_search_no_duplicate_articles(self) -> None:
         """Test that hybrid search doesn't return duplicate articles."""
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get(self.url + "?q=machine&type=hybrid")
+        response = self.client.get(self.url, {"q": "machine", "type": "hybrid"})
         results = list(response.context["news_articles"])
 
         # Check for duplicates
         result_ids = [article.id for article in results]
         self.assertEqual(len(result_ids), len(set(result_ids)))
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_hybrid_search_fallback_to_text_on_embedding_error(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_hybrid_search_fallback_to_text_on_embedding_error(self) -> None:
         """Test that hybrid falls back to text search if embedding fails."""
-        mock_service = MagicMock()
-        mock_service.generate_embedding.side_effect = Exception("API Error")
-        mock_get_service.return_value = mock_service
+        self.embedding_stub.exc = Exception("API Error")
 
-        response = self.client.get(self.url + "?q=machine&type=hybrid")
+        response = self.client.get(self.url, {"q": "machine", "type": "hybrid"})
 
         # Should still get results from text search
         self.assertEqual(response.status_code, 200)
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_hybrid_search_only_returns_published_articles(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_hybrid_search_only_returns_published_articles(self) -> None:
         """Test that hybrid search only returns published articles."""
-        unpublished = News.objects.create(
-            title="Unpublished Article",
-            llm_headline="Draft Article",
-            llm_summary="This article is in draft status",
-            llm_bullets=["Draft content", "Not published yet", "Under review"],
-            llm_tags=["Draft"],
-            status="draft",
-            deleted_at=None,
-            content_embedding=[0.1] * 768,
+        (unpublished,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Unpublished Article",
+                    status="draft",
+                    deleted_at=None,
+                )
+            ]
         )
 
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
-
-        response = self.client.get(self.url + "?q=test&type=hybrid")
-        results = list(response.context["news_articles"])
+        response = self.client.get(self.url, {"q": "test", "type": "hybrid"})
 
-        self.assertNotIn(unpublished, results)
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(unpublished.pk, result_pks)
 
-    @patch("news.services.search_service.get_embedding_service")
-    def test_hybrid_search_excludes_deleted_articles(
-        self, mock_get_service: MagicMock
-    ) -> None:
+    def test_hybrid_search_excludes_deleted_articles(self) -> None:
         """Test that hybrid search excludes deleted articles."""
-        deleted = News.objects.create(
-            title="Deleted Article",
-            llm_headline="Removed Article",
-            llm_summary="This article has been deleted",
-            llm_bullets=["Content removed", "No longer available", "Deleted status"],
-            llm_tags=["Deleted"],
-            status="published",
-            deleted_at=timezone.now(),
-            content_embedding=[0.1] * 768,
+        (deleted,) = News.objects.bulk_create(
+            [
+                News(
+                    title="Deleted Article",
+                    status="published",
+                    deleted_at=timezone.now(),
+                )
+            ]
         )
 
-        mock_service = MagicMock()
-        mock_service.generate_embedding.return_value = [0.1] * 768
-        mock_get_service.return_value = mock_service
+        response = self.client.get(self.url, {"q": "test", "type": "hybrid"})
 
-        response = self.client.get(self.url + "?q=test&type=hybrid")
-        results = list(response.context["news_articles"])
-
-        self.assertNotIn(deleted, results)
+        # Compare pks to avoid materializing full model instances
+        result_pks = [article.pk for article in response.context["news_articles"]]
+        self.assertNotIn(deleted.pk, result_pks)
 
     def test_hybrid_search_handles_empty_query(self) -> None:
         """Test that empty query returns no results."""
-        response = self.client.get(self.url + "?q=&type=hybrid")
+        response = self.client.get(self.url, {"q": "", "type": "hybrid"})
         self.assertEqual(response.context["total_count"], 0)
 
 
 @override_settings(RATELIMIT_ENABLE=False)
 class SearchEdgeCasesTests(TestCase):
-    """Test cases for search edge cases and error handling."""
+    """Test cases for search edge cases that need DB fixtures."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.url = reverse("news:search")
+    url: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Resolve the search URL once for the whole class."""
+        super().setUpClass()
+        cls.url = reverse("news:search")
 
     def test_search_with_no_articles_in_database(self) -> None:
         """Test search when database is empty."""
-        response = self.client.get(self.url + "?q=test&type=text")
+        response = self.client.get(self.url, {"q": "test", "type": "text"})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["total_count"], 0)
 
     def test_search_with_no_embeddings_available(self) -> None:
         """Test vector search when no articles have embeddings."""
-        News.objects.create(
-            title="Article without embedding",
-            status="published",
-            deleted_at=None,
-            content_embedding=None,
+        News.objects.bulk_create(
+            [
+                News(
+                    title="Article without embedding",
+                    status="published",
+                    deleted_at=None,
+                    content_embedding=None,
+                )
+            ]
         )
 
         with patch(
             "news.services.search_service.get_embedding_service"
         ) as mock_get_service:
-            mock_service = MagicMock()
-            mock_service.generate_embedding.return_value = [0.1] * 768
-            mock_get_service.return_value = mock_service
+            mock_get_service.return_value = StubEmbeddingService()
+            response = self.client.get(self.url, {"q": "test", "type": "vector"})
 
-            response = self.client.get(self.url + "?q=test&type=vector")
+        # Should handle gracefully
+        self.assertEqual(response.status_code, 200)
 
-            # Should handle gracefully
-            self.assertEqual(response.status_code, 200)
+
+@override_settings(RATELIMIT_ENABLE=False)
+class SearchRequestHandlingTests(SimpleTestCase):
+    """
+    Test cases for query parsing and request handling.
+
+    These tests never write rows, so SimpleTestCase skips the per-test
+    transaction wrapping; reads against the (empty) default alias are
+    still allowed via ``databases``.
+    """
+
+    url: str
+    databases = {"default"}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Resolve the search URL once for the whole class."""
+        super().setUpClass()
+        cls.url = reverse("news:search")
 
     def test_search_preserves_query_in_url(self) -> None:
         """Test that query is preserved in response for pagination."""
@@ -451,7 +498,5 @@ class SearchEdgeCasesTests(TestCase):
 
         # Should handle safely
         self.assertEqual(response.status_code, 200)
-        # Verify news table still exists by querying it
-        from news.models import News
-
-        self.assertIsNotNone(News.objects.all())
+        # Verify the news table still exists with a single COUNT round trip
+        self.assertEqual(News.objects.count(), 0)
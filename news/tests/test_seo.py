@@ -6,44 +6,63 @@ and canonical URLs.
 """
 
 import json
+import re
+from html.parser import HTMLParser
+from typing import Optional
 from unittest.mock import patch
 from xml.etree import ElementTree as ET
 
-from django.test import Client, TestCase
+from django.test import Client, SimpleTestCase, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
 from news.models import News, Tag
 
+# Compiled once at import; a single regex pass beats the repeated str.find
+# walks these extractions used to do over the full rendered page.
+CANONICAL_LINK_RE = re.compile(r'<link rel="canonical"[^>]*>')
+# Byte-level pattern: json.loads accepts bytes, so the JSON-LD slice can be
+# extracted and parsed without decoding the whole page first.
+JSON_LD_RE = re.compile(
+    rb'<script type="application/ld\+json">(.*?)</script>', re.DOTALL
+)
+
+
+class _MetaTagCollector(HTMLParser):
+    """Collect the attribute dicts of every <meta> tag in one parse pass."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.meta: list[dict[str, Optional[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            self.meta.append(dict(attrs))
+
 
 class SitemapXmlTests(TestCase):
     """Test cases for sitemap.xml generation."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.url = "/sitemap.xml"
-
-        # Create test articles
-        self.article1 = News.objects.create(
-            title="Test Article 1",
-            status="published",
-            deleted_at=None,
-            article_date=timezone.now(),
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "SEO"],
-        )
-        self.article2 = News.objects.create(
-            title="Test Article 2",
-            status="published",
-            deleted_at=None,
-            article_date=timezone.now(),
-            llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
-            llm_tags=["Test", "SEO"],
+    url = "/sitemap.xml"
+    article1: News
+    article2: News
+    tag1: Tag
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the class."""
+        cls.article1, cls.article2 = News.objects.bulk_create(
+            News(
+                title=f"Test Article {i}",
+                status="published",
+                deleted_at=None,
+                article_date=timezone.now(),
+                llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
+                llm_tags=["Test", "SEO"],
+            )
+            for i in (1, 2)
         )
-
-        # Create test tag
-        self.tag1 = Tag.objects.create(name="Python", slug="python")
+        cls.tag1 = Tag.objects.create(name="Python", slug="python")
 
     def test_returns_200(self) -> None:
         """Test that sitemap.xml returns HTTP 200."""
@@ -57,27 +76,27 @@ class SitemapXmlTests(TestCase):
         self.assertIn("xml", content_type.lower())
 
     def test_valid_xml_structure(self) -> None:
-        """Test that sitemap is valid XML."""
+        """Test XML validity, root element, and lastmod with a single parse."""
         response = self.client.get(self.url)
         try:
-            ET.fromstring(response.content)
+            root = ET.fromstring(response.content)
         except ET.ParseError:
             self.fail("Sitemap is not valid XML")
 
-    def test_contains_urlset_root_element(self) -> None:
-        """Test that sitemap contains <urlset> root element."""
-        response = self.client.get(self.url)
-        root = ET.fromstring(response.content)
-        self.assertTrue(root.tag.endswith("urlset"))
+        with self.subTest("urlset root element"):
+            self.assertTrue(root.tag.endswith("urlset"))
+
+        with self.subTest("lastmod element"):
+            ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+            lastmods = root.findall("sm:url/sm:lastmod", ns)
+            self.assertTrue(lastmods, "No URLs have <lastmod> element")
 
     def test_includes_published_articles(self) -> None:
         """Test that sitemap includes published articles."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
         # Check that article URLs are present
-        self.assertIn(f"/{self.article1.id}/", content)
-        self.assertIn(f"/{self.article2.id}/", content)
+        self.assertContains(response, f"/{self.article1.id}/")
+        self.assertContains(response, f"/{self.article2.id}/")
 
     def test_excludes_unpublished_articles(self) -> None:
         """Test that sitemap excludes unpublished articles."""
@@ -90,9 +109,7 @@ class SitemapXmlTests(TestCase):
         )
 
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertNotIn(f"/{unpublished.id}/", content)
+        self.assertNotContains(response, f"/{unpublished.id}/")
 
     def test_excludes_deleted_articles(self) -> None:
         """Test that sitemap excludes deleted articles."""
@@ -105,67 +122,48 @@ class SitemapXmlTests(TestCase):
         )
 
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertNotIn(f"/{deleted.id}/", content)
+        self.assertNotContains(response, f"/{deleted.id}/")
 
     def test_includes_tags(self) -> None:
         """Test that sitemap includes tag pages."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
         # Sitemap URLs don't have trailing slash
-        self.assertIn(f"/tag/{self.tag1.slug}", content)
+        self.assertContains(response, f"/tag/{self.tag1.slug}")
 
     def test_article_urls_are_absolute(self) -> None:
         """Test that article URLs are absolute (include domain)."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
         # Should contain http:// or https://
-        self.assertIn("http://", content)
-
-    def test_article_has_lastmod_date(self) -> None:
-        """Test that articles have <lastmod> date."""
-        response = self.client.get(self.url)
-        root = ET.fromstring(response.content)
-
-        # Find article URL entries
-        ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-        urls = root.findall("sm:url", ns)
-
-        # At least one URL should have lastmod
-        has_lastmod = False
-        for url in urls:
-            lastmod = url.find("sm:lastmod", ns)
-            if lastmod is not None:
-                has_lastmod = True
-                break
-
-        self.assertTrue(has_lastmod, "No URLs have <lastmod> element")
+        self.assertContains(response, "http://")
 
     def test_article_has_changefreq(self) -> None:
         """Test that articles have <changefreq> element."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn("<changefreq>", content)
+        self.assertContains(response, "<changefreq>")
 
     def test_article_has_priority(self) -> None:
         """Test that articles have <priority> element."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
+        self.assertContains(response, "<priority>")
 
-        self.assertIn("<priority>", content)
+    def test_has_last_modified_header(self) -> None:
+        """Test that sitemap responses carry a Last-Modified header."""
+        response = self.client.get(self.url)
+        self.assertIn("Last-Modified", response)
 
+    def test_returns_304_when_not_modified(self) -> None:
+        """Test that If-Modified-Since short-circuits with HTTP 304."""
+        first = self.client.get(self.url)
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
 
-class RobotsTxtTests(TestCase):
+
+class RobotsTxtTests(SimpleTestCase):
     """Test cases for robots.txt."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-        self.url = "/robots.txt"
+    url = "/robots.txt"
 
     def test_returns_200(self) -> None:
         """Test that robots.txt returns HTTP 200."""
@@ -180,20 +178,17 @@ class RobotsTxtTests(TestCase):
     def test_contains_user_agent(self) -> None:
         """Test that robots.txt contains User-agent directive."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-        self.assertIn("User-agent:", content)
+        self.assertContains(response, "User-agent:")
 
     def test_contains_allow_directive(self) -> None:
         """Test that robots.txt contains Allow directive."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-        self.assertIn("Allow:", content)
+        self.assertContains(response, "Allow:")
 
     def test_contains_sitemap_reference(self) -> None:
         """Test that robots.txt contains Sitemap reference."""
         response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-        self.assertIn("Sitemap:", content)
+        self.assertContains(response, "Sitemap:")
 
     def test_sitemap_url_is_absolute(self) -> None:
         """Test that sitemap URL is absolute (includes domain)."""
@@ -208,10 +203,14 @@ class RobotsTxtTests(TestCase):
 class MetaTagsTests(TestCase):
     """Test cases for meta tags (Open Graph, Twitter Cards)."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.article = News.objects.create(
+    article: News
+    url: str
+    _meta: list[dict[str, Optional[str]]]
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data and parse the rendered page once for the class."""
+        cls.article = News.objects.create(
             title="Test Article",
             llm_headline="Test Headline",
             summary="Test summary",
@@ -222,90 +221,69 @@ class MetaTagsTests(TestCase):
             llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
             llm_tags=["Test", "SEO"],
         )
-        self.url = reverse(
+        cls.url = reverse(
             "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
+            kwargs={"news_id": cls.article.id, "slug": cls.article.slug},
         )
+        # Every sibling test inspects the same meta tags, so render the view
+        # and tokenize its head once instead of substring-scanning per method.
+        collector = _MetaTagCollector()
+        collector.feed(Client().get(cls.url).content.decode("utf-8"))
+        cls._meta = collector.meta
+
+    def _meta_tag(self, attr: str, value: str) -> dict[str, Optional[str]]:
+        """Return the first meta tag whose `attr` equals `value`."""
+        for tag in self._meta:
+            if tag.get(attr) == value:
+                return tag
+        self.fail(f'No meta tag with {attr}="{value}" found')
 
     def test_article_has_meta_description(self) -> None:
         """Test that article has meta description."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('<meta name="description"', content)
+        self._meta_tag("name", "description")
 
     def test_meta_description_uses_article_summary(self) -> None:
         """Test that meta description uses article summary."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        # Should contain the article summary
-        self.assertIn("AI-generated summary", content)
+        description = self._meta_tag("name", "description")
+        self.assertIn("AI-generated summary", description.get("content") or "")
 
     def test_article_has_open_graph_title(self) -> None:
         """Test that article has Open Graph og:title."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('property="og:title"', content)
+        self._meta_tag("property", "og:title")
 
     def test_article_has_open_graph_description(self) -> None:
         """Test that article has Open Graph og:description."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('property="og:description"', content)
+        self._meta_tag("property", "og:description")
 
     def test_article_has_open_graph_image(self) -> None:
         """Test that article has Open Graph og:image."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('property="og:image"', content)
+        self._meta_tag("property", "og:image")
 
     def test_article_has_open_graph_type(self) -> None:
         """Test that article has Open Graph og:type as article."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('property="og:type"', content)
-        self.assertIn('content="article"', content)
+        og_type = self._meta_tag("property", "og:type")
+        self.assertEqual(og_type.get("content"), "article")
 
     def test_article_has_open_graph_url(self) -> None:
         """Test that article has Open Graph og:url."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('property="og:url"', content)
+        self._meta_tag("property", "og:url")
 
     def test_article_has_twitter_card_type(self) -> None:
         """Test that article has Twitter Card type."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('name="twitter:card"', content)
-        self.assertIn('content="summary_large_image"', content)
+        card = self._meta_tag("name", "twitter:card")
+        self.assertEqual(card.get("content"), "summary_large_image")
 
     def test_article_has_twitter_card_title(self) -> None:
         """Test that article has Twitter Card title."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('name="twitter:title"', content)
+        self._meta_tag("name", "twitter:title")
 
     def test_article_has_twitter_card_description(self) -> None:
         """Test that article has Twitter Card description."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('name="twitter:description"', content)
+        self._meta_tag("name", "twitter:description")
 
     def test_article_has_twitter_card_image(self) -> None:
         """Test that article has Twitter Card image."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('name="twitter:image"', content)
+        self._meta_tag("name", "twitter:image")
 
     def test_article_without_image_uses_fallback(self) -> None:
         """Test that article without image uses default fallback."""
@@ -323,19 +301,21 @@ class MetaTagsTests(TestCase):
             kwargs={"news_id": article_no_image.id, "slug": article_no_image.slug},
         )
         response = self.client.get(url)
-        content = response.content.decode("utf-8")
-
         # Should still have image meta tags (with fallback)
-        self.assertIn('property="og:image"', content)
+        self.assertContains(response, 'property="og:image"')
 
 
 class StructuredDataTests(TestCase):
     """Test cases for JSON-LD structured data."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.article = News.objects.create(
+    article: News
+    url: str
+    _content: bytes
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data and render the page once for the class."""
+        cls.article = News.objects.create(
             title="Structured Data Test Article",
             llm_headline="JSON-LD Testing",
             llm_summary="Article for testing structured data implementation",
@@ -344,34 +324,26 @@ class StructuredDataTests(TestCase):
             status="published",
             deleted_at=None,
         )
-        self.url = reverse(
+        cls.url = reverse(
             "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
+            kwargs={"news_id": cls.article.id, "slug": cls.article.slug},
         )
+        # Every sibling test asserts against the same rendered body, so run
+        # the view once here instead of once per method.
+        cls._content = Client().get(cls.url).content
 
     def test_article_has_json_ld_script_tag(self) -> None:
         """Test that article has JSON-LD script tag."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('<script type="application/ld+json">', content)
+        self.assertIn(b'<script type="application/ld+json">', self._content)
 
     def test_json_ld_is_valid_json(self) -> None:
         """Test that JSON-LD is valid JSON."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        # Extract JSON-LD from HTML
-        start = content.find('<script type="application/ld+json">')
-        if start == -1:
+        match = JSON_LD_RE.search(self._content)
+        if match is None:
             self.fail("No JSON-LD script tag found")
 
-        start = content.find(">", start) + 1
-        end = content.find("</script>", start)
-        json_ld = content[start:end].strip()
-
         try:
-            data = json.loads(json_ld)
+            data = json.loads(match.group(1))
         except json.JSONDecodeError:
             self.fail("JSON-LD is not valid JSON")
 
@@ -381,83 +353,49 @@ class StructuredDataTests(TestCase):
 
     def test_json_ld_has_headline(self) -> None:
         """Test that JSON-LD has headline field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"headline":', content)
+        self.assertIn(b'"headline":', self._content)
 
     def test_json_ld_has_description(self) -> None:
         """Test that JSON-LD has description field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"description":', content)
+        self.assertIn(b'"description":', self._content)
 
     def test_json_ld_has_image(self) -> None:
         """Test that JSON-LD has image field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"image":', content)
+        self.assertIn(b'"image":', self._content)
 
     def test_json_ld_has_date_published(self) -> None:
         """Test that JSON-LD has datePublished field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"datePublished":', content)
+        self.assertIn(b'"datePublished":', self._content)
 
     def test_json_ld_has_date_modified(self) -> None:
         """Test that JSON-LD has dateModified field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"dateModified":', content)
+        self.assertIn(b'"dateModified":', self._content)
 
     def test_json_ld_has_url(self) -> None:
         """Test that JSON-LD has url field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"url":', content)
+        self.assertIn(b'"url":', self._content)
 
     def test_json_ld_has_publisher(self) -> None:
         """Test that JSON-LD has publisher field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"publisher":', content)
+        self.assertIn(b'"publisher":', self._content)
 
     def test_json_ld_has_author(self) -> None:
         """Test that JSON-LD has author field."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"author":', content)
+        self.assertIn(b'"author":', self._content)
 
     def test_json_ld_has_keywords_from_tags(self) -> None:
         """Test that JSON-LD has keywords from llm_tags."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        self.assertIn('"keywords":', content)
+        self.assertIn(b'"keywords":', self._content)
         # Should contain tags from the article
-        self.assertIn("SEO", content)
-        self.assertIn("Structured Data", content)
-        self.assertIn("Testing", content)
+        self.assertIn(b"SEO", self._content)
+        self.assertIn(b"Structured Data", self._content)
+        self.assertIn(b"Testing", self._content)
 
     def test_json_ld_urls_are_absolute(self) -> None:
         """Test that all URLs in JSON-LD are absolute."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        # Extract JSON-LD
-        start = content.find('<script type="application/ld+json">')
-        start = content.find(">", start) + 1
-        end = content.find("</script>", start)
-        json_ld = content[start:end].strip()
-
-        data = json.loads(json_ld)
+        match = JSON_LD_RE.search(self._content)
+        assert match is not None
+        data = json.loads(match.group(1))
 
         # Check that url is absolute
         if "url" in data:
@@ -469,49 +407,49 @@ class StructuredDataTests(TestCase):
 class CanonicalUrlTests(TestCase):
     """Test cases for canonical URLs."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.article = News.objects.create(
+    article: News
+    url: str
+    _content: bytes
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data and render the page once for the class."""
+        cls.article = News.objects.create(
             title="Test Article",
             status="published",
             deleted_at=None,
             llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
             llm_tags=["Test", "SEO"],
         )
-        self.url = reverse(
+        cls.url = reverse(
             "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
+            kwargs={"news_id": cls.article.id, "slug": cls.article.slug},
         )
+        # Every sibling test asserts against the same rendered body, so run
+        # the view once here instead of once per method.
+        cls._content = Client().get(cls.url).content
 
     def test_article_has_canonical_link(self) -> None:
         """Test that article has <link rel="canonical">."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
+        self.assertIn(b'<link rel="canonical"', self._content)
 
-        self.assertIn('<link rel="canonical"', content)
+    def _extract_canonical(self, content: str) -> str:
+        """Return the canonical <link> tag from the rendered page."""
+        match = CANONICAL_LINK_RE.search(content)
+        if match is None:
+            self.fail("No canonical link tag found")
+        return match.group(0)
 
     def test_canonical_url_is_absolute(self) -> None:
         """Test that canonical URL is absolute."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
+        canonical_tag = self._extract_canonical(self._content.decode("utf-8"))
 
         # Should contain http:// or https://
-        start = content.find('<link rel="canonical"')
-        end = content.find(">", start)
-        canonical_tag = content[start:end]
-
         self.assertIn("http://", canonical_tag)
 
     def test_canonical_url_matches_get_absolute_url(self) -> None:
         """Test that canonical URL matches get_absolute_url()."""
-        response = self.client.get(self.url)
-        content = response.content.decode("utf-8")
-
-        # Extract canonical URL
-        start = content.find('<link rel="canonical"')
-        end = content.find(">", start)
-        canonical_tag = content[start:end]
+        canonical_tag = self._extract_canonical(self._content.decode("utf-8"))
 
         # Should contain the article's absolute URL path
         expected_path = self.article.get_absolute_url()
@@ -519,52 +457,32 @@ class CanonicalUrlTests(TestCase):
 
     def test_query_parameters_dont_affect_canonical(self) -> None:
         """Test that query parameters don't affect canonical URL."""
-        response1 = self.client.get(self.url)
-        response2 = self.client.get(self.url + "?from_page=2")
-
-        content1 = response1.content.decode("utf-8")
-        content2 = response2.content.decode("utf-8")
-
-        # Extract canonical URLs
-        def extract_canonical(content: str) -> str:
-            start = content.find('<link rel="canonical"')
-            end = content.find(">", start)
-            return content[start:end]
+        response = self.client.get(self.url + "?from_page=2")
 
-        canonical1 = extract_canonical(content1)
-        canonical2 = extract_canonical(content2)
+        canonical1 = self._extract_canonical(self._content.decode("utf-8"))
+        canonical2 = self._extract_canonical(response.content.decode("utf-8"))
 
         # Should be identical
         self.assertEqual(canonical1, canonical2)
 
+    def test_returns_304_when_revalidated(self) -> None:
+        """Test that If-Modified-Since revalidation returns HTTP 304."""
+        first = self.client.get(self.url)
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, 304)
+
 
 class SEOPagesTests(TestCase):
     """Test cases for SEO on other pages (homepage, search, tags)."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-
-    def test_homepage_has_meta_description(self) -> None:
-        """Test that homepage has meta description."""
-        response = self.client.get(reverse("news:list"))
-        content = response.content.decode("utf-8")
-
-        self.assertIn('<meta name="description"', content)
-
-    def test_search_page_has_meta_description(self) -> None:
-        """Test that search page has meta description."""
-        response = self.client.get(reverse("news:search"))
-        content = response.content.decode("utf-8")
-
-        self.assertIn('<meta name="description"', content)
-
-    def test_tags_index_has_meta_description(self) -> None:
-        """Test that tags index has meta description."""
-        response = self.client.get(reverse("news:tags_index"))
-        content = response.content.decode("utf-8")
-
-        self.assertIn('<meta name="description"', content)
+    def test_static_pages_have_meta_description(self) -> None:
+        """Test that homepage, search, and tags index have meta descriptions."""
+        for name in ("news:list", "news:search", "news:tags_index"):
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name))
+                self.assertContains(response, '<meta name="description"')
 
     def test_tag_detail_has_meta_description(self) -> None:
         """Test that tag detail has meta description."""
@@ -574,6 +492,4 @@ class SEOPagesTests(TestCase):
             response = self.client.get(
                 reverse("news:tag_detail", kwargs={"tag_slug": "python"})
             )
-            content = response.content.decode("utf-8")
-
-            self.assertIn('<meta name="description"', content)
+            self.assertContains(response, '<meta name="description"')
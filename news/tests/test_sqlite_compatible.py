@@ -7,19 +7,17 @@ These tests run successfully on SQLite and don't depend on:
 - Generated columns (ts_vector_content)
 """
 
-from django.test import Client, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase
 from django.urls import reverse
 
 from news.models import Tag
 
 
-@override_settings(RATELIMIT_ENABLE=False)
-class BasicUrlTests(TestCase):
+class BasicUrlTests(SimpleTestCase):
     """Basic URL tests that work on SQLite."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
+    # Read-only view hits; allow queries without per-test transaction wrap.
+    databases = {"default"}
 
     def test_homepage_returns_200(self) -> None:
         """Test that homepage returns 200."""
@@ -75,13 +73,10 @@ class BasicTagTests(TestCase):
             tag.delete()
 
 
-class RobotsTxtTests(TestCase):
+class RobotsTxtTests(SimpleTestCase):
     """Tests for robots.txt that work on SQLite."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-        self.url = "/robots.txt"
+    url = "/robots.txt"
 
     def test_returns_200(self) -> None:
         """Test that robots.txt returns 200."""
@@ -106,13 +101,13 @@ class RobotsTxtTests(TestCase):
         self.assertIn("Sitemap:", content)
 
 
-class SitemapTests(TestCase):
+class SitemapTests(SimpleTestCase):
     """Basic sitemap tests that work on SQLite."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-        self.url = "/sitemap.xml"
+    # Read-only view hits; allow queries without per-test transaction wrap.
+    databases = {"default"}
+
+    url = "/sitemap.xml"
 
     def test_returns_200(self) -> None:
         """Test that sitemap returns 200."""
@@ -147,7 +142,7 @@ class SitemapTests(TestCase):
         self.assertNotIn("<loc>", content)
 
 
-class UrlResolutionTests(TestCase):
+class UrlResolutionTests(SimpleTestCase):
     """URL resolution tests that work on SQLite."""
 
     def test_news_list_resolves(self) -> None:
@@ -171,13 +166,11 @@ class UrlResolutionTests(TestCase):
         self.assertEqual(url, "/tag/python")
 
 
-@override_settings(RATELIMIT_ENABLE=False)
-class TemplateTests(TestCase):
+class TemplateTests(SimpleTestCase):
     """Template tests that work on SQLite."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
+    # Read-only view hits; allow queries without per-test transaction wrap.
+    databases = {"default"}
 
     def test_news_list_template(self) -> None:
         """Test that news list uses correct template."""
@@ -195,7 +188,6 @@ class TemplateTests(TestCase):
         self.assertTemplateUsed(response, "news/tags_index.html")
 
 
-@override_settings(RATELIMIT_ENABLE=False)
 class SearchRateLimitTests(TestCase):
     """Test search rate limiting (works on SQLite)."""
 
@@ -1,26 +1,56 @@
+import copy
+from contextlib import contextmanager
+from typing import Any, Iterator
 from unittest.mock import MagicMock, patch
 
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 
-from news.models import Tag
+from news.models import News, Tag
+
+
+@contextmanager
+def _swap_attr(obj: Any, name: str, value: Any) -> Iterator[None]:
+    """Temporarily replace an attribute, without mock.patch's MagicMock cost."""
+    original = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, original)
+
+
+# Built once at import: .none() never touches the DB, and both tag_detail
+# tests hand the same empty queryset to the stubbed manager method.
+_EMPTY_NEWS_QS = News.objects.none()
+
+# Prototype tags built once at import; setUpTestData inserts fresh copies so
+# the prototypes themselves stay unsaved between test runs.
+_TAG_PROTOTYPES = [
+    Tag(name="Machine Learning", slug="machine-learning"),
+    Tag(name="Artificial Intelligence", slug="artificial-intelligence"),
+    Tag(name="Deep Learning", slug="deep-learning"),
+    Tag(name="Python", slug="python"),
+    Tag(name="JavaScript", slug="javascript"),
+]
 
 
 class TagViewTests(TestCase):
     """Test cases for tag-related views."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-
-        # Create test tags with various names to test slug generation
-        self.tag1 = Tag.objects.create(name="Machine Learning", slug="machine-learning")
-        self.tag2 = Tag.objects.create(
-            name="Artificial Intelligence", slug="artificial-intelligence"
+    tag1: Tag
+    tag2: Tag
+    tag3: Tag
+    tag4: Tag
+    tag5: Tag
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the whole class."""
+        # Single INSERT for all five tags instead of one create() each
+        cls.tag1, cls.tag2, cls.tag3, cls.tag4, cls.tag5 = Tag.objects.bulk_create(
+            copy.copy(tag) for tag in _TAG_PROTOTYPES
         )
-        self.tag3 = Tag.objects.create(name="Deep Learning", slug="deep-learning")
-        self.tag4 = Tag.objects.create(name="Python", slug="python")
-        self.tag5 = Tag.objects.create(name="JavaScript", slug="javascript")
 
     @patch("news.models.Tag.get_news_count")
     def test_tags_index_view_renders(self, mock_get_news_count: MagicMock) -> None:
@@ -57,31 +87,31 @@ class TagViewTests(TestCase):
             ("Enterprise AI", "enterprise-ai"),
         ]
 
+        # Slugs are computed in Tag.save(), which bulk_create would skip, so
+        # each case still saves once. The per-case delete() calls are gone:
+        # the test transaction rolls the rows back anyway.
         for name, expected_slug in test_cases:
-            tag = Tag.objects.create(name=name)
-            self.assertEqual(
-                tag.slug,
-                expected_slug,
-                f"Slug for '{name}' should be '{expected_slug}', got '{tag.slug}'",
-            )
-            # Clean up
-            tag.delete()
-
-    @patch("news.models.Tag.objects.get_articles_for_tag")
-    def test_known_slug_returns_200(self, mock_get_articles: MagicMock) -> None:
+            with self.subTest(name=name):
+                tag = Tag(name=name)
+                tag.save()
+                self.assertEqual(
+                    tag.slug,
+                    expected_slug,
+                    f"Slug for '{name}' should be '{expected_slug}', got '{tag.slug}'",
+                )
+
+    def test_known_slug_returns_200(self) -> None:
         """Test that known tag slugs return a successful response."""
-        # Mock the get_articles_for_tag method to return an empty News QuerySet
-        from django.db.models import QuerySet
-
-        from news.models import News
-
-        mock_queryset = QuerySet(model=News).none()  # type: ignore  # Empty News queryset
-        mock_get_articles.return_value = mock_queryset
-
-        # Test with a known slug from our test data
-        response = self.client.get(
-            reverse("news:tag_detail", kwargs={"tag_slug": "machine-learning"})
-        )
+        # Stub get_articles_for_tag with an empty News queryset
+        with _swap_attr(
+            Tag.objects,
+            "get_articles_for_tag",
+            lambda *args, **kwargs: _EMPTY_NEWS_QS,
+        ):
+            # Test with a known slug from our test data
+            response = self.client.get(
+                reverse("news:tag_detail", kwargs={"tag_slug": "machine-learning"})
+            )
 
         # Assert response is successful
         self.assertEqual(response.status_code, 200)
@@ -103,21 +133,17 @@ class TagViewTests(TestCase):
         # Assert response is 404
         self.assertEqual(response.status_code, 404)
 
-    @patch("news.models.Tag.objects.get_articles_for_tag")
-    def test_case_sensitive_slug_handling(self, mock_get_articles: MagicMock) -> None:
+    def test_case_sensitive_slug_handling(self) -> None:
         """Test that slugs are case-sensitive and handle uppercase properly."""
-        # Mock the get_articles_for_tag method to return an empty News QuerySet
-        from django.db.models import QuerySet
-
-        from news.models import News
-
-        mock_queryset = QuerySet(model=News).none()  # type: ignore  # Empty News queryset
-        mock_get_articles.return_value = mock_queryset
-
         # Create a tag with mixed case
-        tag = Tag.objects.create(name="Test Case", slug="test-case")
-
-        try:
+        Tag.objects.create(name="Test Case", slug="test-case")
+
+        # Stub get_articles_for_tag with an empty News queryset
+        with _swap_attr(
+            Tag.objects,
+            "get_articles_for_tag",
+            lambda *args, **kwargs: _EMPTY_NEWS_QS,
+        ):
             # Test with correct case
             response = self.client.get(
                 reverse("news:tag_detail", kwargs={"tag_slug": "test-case"})
@@ -130,56 +156,27 @@ class TagViewTests(TestCase):
             )
             self.assertEqual(response.status_code, 404)
 
-        finally:
-            # Clean up
-            tag.delete()
-
     def test_tags_index_filters_tags_with_more_than_2_articles(self) -> None:
         """Test that tags index only shows tags with more than 2 articles."""
-        from news.models import News
-
-        # Create News articles with different tag combinations
+        # Create News articles with different tag combinations in one INSERT:
         # Machine Learning: 3 articles (should show)
-        News.objects.create(
-            title="ML Article 1",
-            llm_tags=["Machine Learning"],
-            status="published",
-        )
-        News.objects.create(
-            title="ML Article 2",
-            llm_tags=["Machine Learning"],
-            status="published",
-        )
-        News.objects.create(
-            title="ML Article 3",
-            llm_tags=["Machine Learning"],
-            status="published",
-        )
-
         # Artificial Intelligence: 2 articles (should be filtered out)
-        News.objects.create(
-            title="AI Article 1",
-            llm_tags=["Artificial Intelligence"],
-            status="published",
-        )
-        News.objects.create(
-            title="AI Article 2",
-            llm_tags=["Artificial Intelligence"],
-            status="published",
-        )
-
         # Deep Learning: 1 article (should be filtered out)
-        News.objects.create(
-            title="DL Article 1",
-            llm_tags=["Deep Learning"],
-            status="published",
+        # Python / JavaScript: 0 articles (should be filtered out)
+        News.objects.bulk_create(
+            News(title=f"{tag} Article {i}", llm_tags=[tag], status="published")
+            for tag, count in [
+                ("Machine Learning", 3),
+                ("Artificial Intelligence", 2),
+                ("Deep Learning", 1),
+            ]
+            for i in range(count)
         )
 
-        # Python: 0 articles (should be filtered out)
-        # JavaScript: 0 articles (should be filtered out)
-
-        # Make request to tags_index view
-        response = self.client.get(reverse("news:tags_index"))
+        # The view aggregates in two fixed queries (llm_tags arrays + tags),
+        # regardless of tag count — guard against an N+1 regression
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("news:tags_index"))
 
         # Assert response is successful
         self.assertEqual(response.status_code, 200)
@@ -196,8 +193,6 @@ class TagViewTests(TestCase):
 
     def test_tags_index_boundary_filtering(self) -> None:
         """Test boundary condition: tags with exactly 2 articles should not show, 3+ should show."""
-        from news.models import News
-
         # Create tags for testing boundary conditions
         Tag.objects.create(name="Zero Articles", slug="zero-articles")
         Tag.objects.create(name="One Article", slug="one-article")
@@ -205,39 +200,23 @@ class TagViewTests(TestCase):
         Tag.objects.create(name="Three Articles", slug="three-articles")
         Tag.objects.create(name="Four Articles", slug="four-articles")
 
-        # Create 0 articles for "Zero Articles" tag (should not show)
-
-        # Create 1 article for "One Article" tag (should not show)
-        News.objects.create(
-            title="Article for One",
-            llm_tags=["One Article"],
-            status="published",
+        # One INSERT covering every boundary:
+        # 0 articles for "Zero Articles" (should not show)
+        # 1 article for "One Article" (should not show)
+        # 2 articles for "Two Articles" (should not show - boundary)
+        # 3 articles for "Three Articles" (should show - boundary)
+        # 4 articles for "Four Articles" (should show)
+        News.objects.bulk_create(
+            News(title=f"Article for {tag} {i}", llm_tags=[tag], status="published")
+            for tag, count in [
+                ("One Article", 1),
+                ("Two Articles", 2),
+                ("Three Articles", 3),
+                ("Four Articles", 4),
+            ]
+            for i in range(count)
         )
 
-        # Create 2 articles for "Two Articles" tag (should not show - boundary)
-        for i in range(2):
-            News.objects.create(
-                title=f"Article for Two {i}",
-                llm_tags=["Two Articles"],
-                status="published",
-            )
-
-        # Create 3 articles for "Three Articles" tag (should show - boundary)
-        for i in range(3):
-            News.objects.create(
-                title=f"Article for Three {i}",
-                llm_tags=["Three Articles"],
-                status="published",
-            )
-
-        # Create 4 articles for "Four Articles" tag (should show)
-        for i in range(4):
-            News.objects.create(
-                title=f"Article for Four {i}",
-                llm_tags=["Four Articles"],
-                status="published",
-            )
-
         # Make request to tags_index view
         response = self.client.get(reverse("news:tags_index"))
         tags_in_context = response.context["tags"]
@@ -5,217 +5,185 @@ Tests validate URL resolution, URL generation (reverse), slug handling,
 and redirect behavior.
 """
 
-from django.test import TestCase
-from django.urls import resolve, reverse
+from django.test import SimpleTestCase, TestCase
+from django.urls import get_resolver, reverse
 
 from news.models import News
 
+# Warm the URL resolver once at import and bind its resolve method directly,
+# skipping the per-call get_resolver() lookup inside django.urls.resolve.
+_resolve = get_resolver().resolve
 
-class NewsUrlResolutionTests(TestCase):
-    """Test cases for news URL resolution."""
 
-    def test_news_list_resolves(self) -> None:
-        """Test that news:list resolves to /."""
-        url = reverse("news:list")
-        self.assertEqual(url, "/")
+class UrlResolutionTests(SimpleTestCase):
+    """Test cases for news and tag URL resolution."""
 
-    def test_news_detail_resolves(self) -> None:
-        """Test that news:detail resolves to /{id}/{slug}."""
-        url = reverse("news:detail", kwargs={"news_id": 1, "slug": "test-slug"})
-        self.assertEqual(url, "/1/test-slug")
+    def test_named_urls_reverse_to_expected_paths(self) -> None:
+        """Test that every named URL reverses to its expected path."""
+        cases: list[tuple[str, dict[str, object], str]] = [
+            ("news:list", {}, "/"),
+            ("news:detail", {"news_id": 1, "slug": "test-slug"}, "/1/test-slug"),
+            ("news:detail_redirect", {"news_id": 1}, "/1"),
+            ("news:search", {}, "/search"),
+            ("news:tags_index", {}, "/tags"),
+            ("news:tag_detail", {"tag_slug": "python"}, "/tag/python"),
+        ]
 
-    def test_news_detail_redirect_resolves(self) -> None:
-        """Test that news:detail_redirect resolves to /{id}/."""
-        url = reverse("news:detail_redirect", kwargs={"news_id": 1})
-        self.assertEqual(url, "/1")
+        for name, kwargs, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(reverse(name, kwargs=kwargs), expected)
 
-    def test_news_search_resolves(self) -> None:
-        """Test that news:search resolves to /search/."""
-        url = reverse("news:search")
-        self.assertEqual(url, "/search")
 
+class SeoUrlResolutionTests(SimpleTestCase):
+    """Test cases for SEO URL resolution.
 
-class TagUrlResolutionTests(TestCase):
-    """Test cases for tag URL resolution."""
-
-    def test_tags_index_resolves(self) -> None:
-        """Test that news:tags_index resolves to /tags/."""
-        url = reverse("news:tags_index")
-        self.assertEqual(url, "/tags")
-
-    def test_tag_detail_resolves(self) -> None:
-        """Test that news:tag_detail resolves to /tag/{slug}/."""
-        url = reverse("news:tag_detail", kwargs={"tag_slug": "python"})
-        self.assertEqual(url, "/tag/python")
-
-
-class SeoUrlResolutionTests(TestCase):
-    """Test cases for SEO URL resolution."""
+    Routing checks only — response content for both URLs is covered by
+    test_seo.SitemapXmlTests and test_seo.RobotsTxtTests.
+    """
 
     def test_sitemap_resolves(self) -> None:
         """Test that sitemap resolves to /sitemap.xml."""
-        url = "/sitemap.xml"
-        # Verify the URL is accessible
-        from django.test import Client
-
-        client = Client()
-        response = client.get(url)
-        self.assertEqual(response.status_code, 200)
+        self.assertEqual(_resolve("/sitemap.xml").url_name, "sitemap")
 
     def test_robots_txt_resolves(self) -> None:
         """Test that robots.txt resolves to /robots.txt."""
-        url = "/robots.txt"
-        # Verify the URL is accessible
-        from django.test import Client
-
-        client = Client()
-        response = client.get(url)
-        self.assertEqual(response.status_code, 200)
-
-
-class UrlGenerationTests(TestCase):
-    """Test cases for URL generation with reverse()."""
-
-    def test_reverse_news_list(self) -> None:
-        """Test reverse() for news list."""
-        url = reverse("news:list")
-        self.assertEqual(url, "/")
-
-    def test_reverse_news_detail(self) -> None:
-        """Test reverse() for news detail with ID and slug."""
-        url = reverse("news:detail", args=[123, "test-slug"])
-        self.assertEqual(url, "/123/test-slug")
-
-    def test_reverse_tag_detail(self) -> None:
-        """Test reverse() for tag detail."""
-        url = reverse("news:tag_detail", args=["machine-learning"])
-        self.assertEqual(url, "/tag/machine-learning")
-
-
-class SlugHandlingTests(TestCase):
-    """Test cases for slug handling in URLs."""
+        self.assertEqual(_resolve("/robots.txt").url_name, "robots_txt")
+
+
+class UrlGenerationTests(SimpleTestCase):
+    """Test cases for URL generation with reverse() and positional args."""
+
+    def test_reverse_with_positional_args(self) -> None:
+        """Test reverse() with positional args for each parameterized URL."""
+        cases: list[tuple[str, list[object], str]] = [
+            ("news:detail", [123, "test-slug"], "/123/test-slug"),
+            ("news:tag_detail", ["machine-learning"], "/tag/machine-learning"),
+        ]
+
+        for name, args, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(reverse(name, args=args), expected)
+
+
+class SlugHandlingTests(SimpleTestCase):
+    """Test cases for slug handling in URLs.
+
+    News.slug is a cached_property computed in Python from the headline or
+    title, so the fixtures are unsaved instances built once for the class
+    and addressed by key — no database rows are needed.
+    """
+
+    articles: dict[str, News]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.articles = {
+            key: News(title=title)
+            for key, title in [
+                ("uppercase", "TEST ARTICLE"),
+                ("spaces", "Test Article Title"),
+                ("special", "Test @ Article: with (special) [chars]!"),
+                ("unicode", "Test Article café"),
+                ("long", "This is an extremely long article title " * 10),
+                ("consecutive", "Test    Article    Title"),
+                ("padded", "  Test Article  "),
+            ]
+        }
 
     def test_slugs_are_lowercase(self) -> None:
         """Test that slugs are lowercase."""
-        article = News.objects.create(
-            title="TEST ARTICLE",
-            status="published",
-            deleted_at=None,
-        )
-        self.assertTrue(article.slug.islower())
+        self.assertTrue(self.articles["uppercase"].slug.islower())
 
     def test_slugs_use_hyphens(self) -> None:
         """Test that slugs use hyphens for spaces."""
-        article = News.objects.create(
-            title="Test Article Title",
-            status="published",
-            deleted_at=None,
-        )
-        self.assertIn("-", article.slug)
-        self.assertNotIn(" ", article.slug)
+        slug = self.articles["spaces"].slug
+        self.assertIn("-", slug)
+        self.assertNotIn(" ", slug)
 
     def test_slugs_are_url_safe(self) -> None:
         """Test that slugs don't contain unsafe characters."""
-        article = News.objects.create(
-            title="Test @ Article: with (special) [chars]!",
-            status="published",
-            deleted_at=None,
-        )
+        slug = self.articles["special"].slug
 
         # URL-unsafe characters should be removed or converted
         unsafe_chars = ["@", ":", "(", ")", "[", "]", "!"]
         for char in unsafe_chars:
-            self.assertNotIn(char, article.slug)
+            self.assertNotIn(char, slug)
 
     def test_slugs_handle_unicode(self) -> None:
         """Test that slugs handle unicode characters appropriately."""
-        article = News.objects.create(
-            title="Test Article café",
-            status="published",
-            deleted_at=None,
-        )
+        slug = self.articles["unicode"].slug
 
         # Should generate a valid slug
-        self.assertIsNotNone(article.slug)
-        self.assertTrue(len(article.slug) > 0)
+        self.assertIsNotNone(slug)
+        self.assertTrue(len(slug) > 0)
 
     def test_very_long_slug(self) -> None:
         """Test that very long titles generate valid slugs."""
-        long_title = "This is an extremely long article title " * 10
-        article = News.objects.create(
-            title=long_title,
-            status="published",
-            deleted_at=None,
-        )
+        slug = self.articles["long"].slug
 
         # Should generate a slug (may be truncated)
-        self.assertIsNotNone(article.slug)
-        self.assertTrue(len(article.slug) > 0)
+        self.assertIsNotNone(slug)
+        self.assertTrue(len(slug) > 0)
 
     def test_slug_with_consecutive_hyphens(self) -> None:
         """Test slug generation with multiple consecutive spaces."""
-        article = News.objects.create(
-            title="Test    Article    Title",
-            status="published",
-            deleted_at=None,
-        )
-
         # Should not have consecutive hyphens
-        self.assertNotIn("--", article.slug)
+        self.assertNotIn("--", self.articles["consecutive"].slug)
 
     def test_slug_doesnt_start_or_end_with_hyphen(self) -> None:
         """Test that slugs don't start or end with hyphens."""
-        article = News.objects.create(
-            title="  Test Article  ",
-            status="published",
-            deleted_at=None,
-        )
+        slug = self.articles["padded"].slug
 
-        self.assertFalse(article.slug.startswith("-"))
-        self.assertFalse(article.slug.endswith("-"))
+        self.assertFalse(slug.startswith("-"))
+        self.assertFalse(slug.endswith("-"))
 
 
 class RedirectTests(TestCase):
     """Test cases for URL redirects."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        from django.test import Client
+    article: News
+    redirect_url: str
+    detail_url: str
 
-        self.client = Client()
-        self.article = News.objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the whole class."""
+        # None of the tests mutate the article, so one shared row suffices
+        cls.article = News.objects.create(
             title="Test Article",
             status="published",
             deleted_at=None,
         )
+        # Reverse once here instead of walking the URL resolver in every test
+        cls.redirect_url = reverse(
+            "news:detail_redirect", kwargs={"news_id": cls.article.id}
+        )
+        cls.detail_url = reverse(
+            "news:detail",
+            kwargs={"news_id": cls.article.id, "slug": cls.article.slug},
+        )
 
     def test_legacy_url_without_slug_redirects(self) -> None:
         """Test that legacy URL without slug redirects to URL with slug."""
-        url = reverse("news:detail_redirect", kwargs={"news_id": self.article.id})
-        response = self.client.get(url)
+        response = self.client.get(self.redirect_url)
 
         # Should be a permanent redirect
         self.assertEqual(response.status_code, 301)
 
     def test_redirect_is_permanent(self) -> None:
         """Test that redirects are permanent (HTTP 301)."""
-        url = reverse("news:detail_redirect", kwargs={"news_id": self.article.id})
-        response = self.client.get(url)
+        response = self.client.get(self.redirect_url)
 
         self.assertEqual(response.status_code, 301)
 
     def test_redirect_uses_correct_slug(self) -> None:
         """Test that redirect uses the correct slug from article."""
-        url = reverse("news:detail_redirect", kwargs={"news_id": self.article.id})
-        response = self.client.get(url)
+        response = self.client.get(self.redirect_url)
 
         # Should redirect to URL with correct slug
-        expected_url = reverse(
-            "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
-        )
         self.assertTrue(hasattr(response, "url"))  # Type guard
-        self.assertIn(expected_url, response.url)  # type: ignore[attr-defined]
+        self.assertIn(self.detail_url, response.url)  # type: ignore[attr-defined]
 
     def test_wrong_slug_redirects_to_correct_slug(self) -> None:
         """Test that wrong slug redirects to correct slug."""
@@ -228,21 +196,17 @@ class RedirectTests(TestCase):
         self.assertEqual(response.status_code, 301)
 
         # Should redirect to correct slug
-        expected_url = reverse(
-            "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
-        )
         self.assertTrue(hasattr(response, "url"))  # Type guard
-        self.assertIn(expected_url, response.url)  # type: ignore[attr-defined]
+        self.assertIn(self.detail_url, response.url)  # type: ignore[attr-defined]
 
 
-class UrlPatternTests(TestCase):
+class UrlPatternTests(SimpleTestCase):
     """Test cases for URL pattern matching."""
 
     def test_news_detail_url_pattern(self) -> None:
         """Test that news detail URL pattern matches correctly."""
         url = "/123/test-slug"
-        match = resolve(url)
+        match = _resolve(url)
 
         self.assertEqual(match.url_name, "detail")
         self.assertEqual(match.kwargs["news_id"], 123)
@@ -251,7 +215,7 @@ class UrlPatternTests(TestCase):
     def test_tag_detail_url_pattern(self) -> None:
         """Test that tag detail URL pattern matches correctly."""
         url = "/tag/python"
-        match = resolve(url)
+        match = _resolve(url)
 
         # Note: URL without trailing slash hits the redirect, so check for that
         self.assertIn(match.url_name, ["tag_detail", "tag_detail_slash_redirect"])
@@ -260,14 +224,14 @@ class UrlPatternTests(TestCase):
     def test_news_list_url_pattern(self) -> None:
         """Test that news list URL pattern matches correctly."""
         url = "/"
-        match = resolve(url)
+        match = _resolve(url)
 
         self.assertEqual(match.url_name, "list")
 
     def test_search_url_pattern(self) -> None:
         """Test that search URL pattern matches correctly."""
         url = "/search"
-        match = resolve(url)
+        match = _resolve(url)
 
         # Note: URL without trailing slash might hit redirect
         self.assertIn(match.url_name, ["search", "search_slash_redirect"])
@@ -3,25 +3,54 @@ Test cases for News views.
 
 Tests validate HTTP responses, templates, context data, pagination,
 filtering, navigation, and user experience.
+
+Pass --keepdb for faster iteration: the test database (and its
+migrations) survive between runs. Use --create-db style recreation
+(drop the flag) after changing models.py.
 """
 
+import tempfile
 from datetime import timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from django.test import Client, TestCase, override_settings
+from django.http import HttpRequest, HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
 from news.models import News, Tag
 
+# Built once at import: .none() never touches the DB, and the stubbed
+# tag_detail tests all hand the same empty queryset to the mock.
+_EMPTY_NEWS_QS = News.objects.none()
+
+
+def _render_status_only(
+    request: HttpRequest,
+    template_name: str,
+    context: dict[str, object] | None = None,
+    status: int | None = None,
+) -> HttpResponse:
+    """Stand-in for render() in tests that assert only the status code.
+
+    The rate-limit tests issue 100+ requests each; skipping the template
+    render removes the dominant per-request cost without touching the
+    view logic under test.
+    """
+    return HttpResponse(status=status or 200)
+
 
 class NewsListViewTests(TestCase):
     """Test cases for news list view."""
 
-    def setUp(self) -> None:
-        """Set up test client and data."""
-        self.client = Client()
-        self.url = reverse("news:list")
+    url: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Reverse once per class instead of walking the resolver per test
+        cls.url = reverse("news:list")
 
     def test_returns_200_for_get_request(self) -> None:
         """Test that news list view returns HTTP 200."""
@@ -36,49 +65,10 @@ class NewsListViewTests(TestCase):
     def test_context_contains_required_data(self) -> None:
         """Test that context contains news_articles and page_obj."""
         response = self.client.get(self.url)
-        self.assertIn("news_articles", response.context)
-        self.assertIn("page_obj", response.context)
-        self.assertIn("total_count", response.context)
-
-    def test_pagination_shows_10_per_page(self) -> None:
-        """Test that pagination shows 10 articles per page."""
-        # Create 25 published articles
-        categories = ["Technology", "Science", "Business", "Health", "Sports"]
-        for i in range(25):
-            category = categories[i % len(categories)]
-            News.objects.create(
-                title=f"{category} News: Update {i}",
-                llm_headline=f"{category} Headlines",
-                llm_summary=f"Latest {category} developments and insights.",
-                llm_bullets=[f"Point {i}.1", f"Point {i}.2", f"Point {i}.3"],
-                llm_tags=[category, "News", "Updates"],
-                status="published",
-                deleted_at=None,
-                article_date=timezone.now() - timedelta(days=i),
-            )
-
-        response = self.client.get(self.url)
-        self.assertEqual(len(response.context["news_articles"]), 10)
-
-    def test_pagination_page_2_shows_next_articles(self) -> None:
-        """Test that page 2 shows the next set of articles."""
-        # Create 25 published articles
-        categories = ["Technology", "Science", "Business", "Health", "Sports"]
-        for i in range(25):
-            category = categories[i % len(categories)]
-            News.objects.create(
-                title=f"{category} News: Article {i}",
-                llm_headline=f"{category} Latest",
-                llm_summary=f"Important {category} news and updates.",
-                llm_bullets=[f"Detail {i}.1", f"Detail {i}.2", f"Detail {i}.3"],
-                llm_tags=[category, "Breaking", "Updates"],
-                status="published",
-                deleted_at=None,
-                article_date=timezone.now() - timedelta(days=i),
-            )
-
-        response = self.client.get(self.url + "?page=2")
-        self.assertEqual(len(response.context["news_articles"]), 10)
+        context = response.context
+        self.assertIn("news_articles", context)
+        self.assertIn("page_obj", context)
+        self.assertIn("total_count", context)
 
     def test_invalid_page_number_defaults_to_page_1(self) -> None:
         """Test that invalid page numbers default to page 1."""
@@ -86,49 +76,20 @@ class NewsListViewTests(TestCase):
             title="Pagination Test Article",
             llm_headline="Testing Pagination Handling",
             llm_summary="Article for testing invalid page number handling",
-            llm_bullets=[
-                "Test pagination",
-                "Invalid page handling",
-                "Default behavior",
-            ],
-            llm_tags=["Testing", "Pagination"],
             status="published",
             deleted_at=None,
         )
 
-        response = self.client.get(self.url + "?page=abc")
+        response = self.client.get(self.url, {"page": "abc"})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["page_obj"].number, 1)
 
-    def test_page_out_of_range_shows_last_page(self) -> None:
-        """Test that page numbers beyond range show last page."""
-        # Create 25 articles (2 pages)
-        topics = ["Technology", "Science", "Business", "Health", "Sports"]
-        for i in range(25):
-            topic = topics[i % len(topics)]
-            News.objects.create(
-                title=f"{topic} Article {i}",
-                llm_headline=f"{topic} Update",
-                llm_summary=f"Latest {topic} news and developments",
-                llm_bullets=[f"Point {i}.1", f"Point {i}.2", f"Point {i}.3"],
-                llm_tags=[topic, "News"],
-                status="published",
-                deleted_at=None,
-                article_date=timezone.now() - timedelta(days=i),
-            )
-
-        response = self.client.get(self.url + "?page=999")
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.context["page_obj"].number, 3)
-
     def test_only_shows_published_articles(self) -> None:
         """Test that only published articles are shown."""
         published = News.objects.create(
             title="Published Article",
             llm_headline="Published Content",
             llm_summary="This article is published and visible",
-            llm_bullets=["Published status", "Publicly visible", "In production"],
-            llm_tags=["Published", "Live"],
             status="published",
             deleted_at=None,
         )
@@ -136,8 +97,6 @@ class NewsListViewTests(TestCase):
             title="Unpublished Draft",
             llm_headline="Draft Content",
             llm_summary="This article is in draft status",
-            llm_bullets=["Draft status", "Not visible", "Under review"],
-            llm_tags=["Draft"],
             status="draft",
             deleted_at=None,
         )
@@ -154,8 +113,6 @@ class NewsListViewTests(TestCase):
             title="Active Article",
             llm_headline="Active Content",
             llm_summary="This article is active and available",
-            llm_bullets=["Active status", "Available to users", "Not deleted"],
-            llm_tags=["Active", "Live"],
             status="published",
             deleted_at=None,
         )
@@ -163,8 +120,6 @@ class NewsListViewTests(TestCase):
             title="Deleted Article",
             llm_headline="Deleted Content",
             llm_summary="This article has been deleted",
-            llm_bullets=["Deleted status", "Not available", "Removed"],
-            llm_tags=["Deleted"],
             status="published",
             deleted_at=timezone.now(),
         )
@@ -181,8 +136,6 @@ class NewsListViewTests(TestCase):
             title="Older Article from Last Week",
             llm_headline="Old News",
             llm_summary="This is an older article from 10 days ago",
-            llm_bullets=["Older content", "Published last week", "Historical"],
-            llm_tags=["Archive", "Old"],
             status="published",
             deleted_at=None,
             article_date=timezone.now() - timedelta(days=10),
@@ -191,8 +144,6 @@ class NewsListViewTests(TestCase):
             title="Latest Breaking News",
             llm_headline="Fresh News",
             llm_summary="This is the latest article published today",
-            llm_bullets=["Breaking news", "Just published", "Current"],
-            llm_tags=["Breaking", "Latest"],
             status="published",
             deleted_at=None,
             article_date=timezone.now(),
@@ -210,47 +161,89 @@ class NewsListViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["news_articles"]), 0)
 
-    def test_exactly_20_articles_shows_pagination(self) -> None:
-        """Test that exactly 20 articles shows two pages with 10 per page."""
-        for i in range(20):
-            News.objects.create(
-                title=f"Article {i}",
-                status="published",
-                deleted_at=None,
-            )
+    def test_pagination_boundaries(self) -> None:
+        """Test page counts at exactly 20 articles and just past it at 21."""
+        News.objects.bulk_create(
+            News(title=f"Article {i}", status="published", deleted_at=None)
+            for i in range(20)
+        )
 
         response = self.client.get(self.url)
         self.assertEqual(response.context["page_obj"].paginator.num_pages, 2)
 
-    def test_21_articles_shows_pagination(self) -> None:
-        """Test that 21 articles creates 3 pages with 10 per page."""
-        for i in range(21):
-            News.objects.create(
+        # One more article tips the paginator into a third page
+        News.objects.create(title="Article 20", status="published", deleted_at=None)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.context["page_obj"].paginator.num_pages, 3)
+
+
+class NewsListPaginationTests(TestCase):
+    """Test cases for news list pagination against a shared 25-article set."""
+
+    url: str
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the 25 published articles once for the whole class."""
+        now = timezone.now()
+        News.objects.bulk_create(
+            News(
                 title=f"Article {i}",
                 status="published",
                 deleted_at=None,
+                article_date=now - timedelta(days=i),
             )
+            for i in range(25)
+        )
+        cls.url = reverse("news:list")
 
-        response = self.client.get(self.url)
-        self.assertEqual(response.context["page_obj"].paginator.num_pages, 3)
+    def test_pagination_shows_10_per_page(self) -> None:
+        """Test that pagination shows 10 articles per page."""
+        # Query budget: the conditional-GET MAX aggregate, the paginator
+        # COUNT (reused for total_count), and the page slice. A per-article
+        # lookup in the template would blow it.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context["news_articles"]), 10)
+
+    def test_pagination_page_2_shows_next_articles(self) -> None:
+        """Test that page 2 shows the next set of articles."""
+        response = self.client.get(self.url, {"page": "2"})
+        self.assertEqual(len(response.context["news_articles"]), 10)
+
+    def test_page_out_of_range_shows_last_page(self) -> None:
+        """Test that page numbers beyond range show last page."""
+        response = self.client.get(self.url, {"page": "999"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].number, 3)
+
+    def test_page_below_range_shows_last_page(self) -> None:
+        """Test that pages below 1 show the last page, like EmptyPage did."""
+        response = self.client.get(self.url, {"page": "-1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["page_obj"].number, 3)
 
 
 class NewsDetailViewTests(TestCase):
     """Test cases for news detail view."""
 
-    def setUp(self) -> None:
-        """Set up test client and data."""
-        self.client = Client()
-        self.article = News.objects.create(
+    article: News
+    url: str
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the whole class."""
+        cls.article = News.objects.create(
             title="Test Article",
             status="published",
             deleted_at=None,
             llm_bullets=["Key point 1", "Key point 2", "Key point 3"],
             llm_tags=["Test", "News"],
         )
-        self.url = reverse(
+        cls.url = reverse(
             "news:detail",
-            kwargs={"news_id": self.article.id, "slug": self.article.slug},
+            kwargs={"news_id": cls.article.id, "slug": cls.article.slug},
         )
 
     def test_returns_200_for_valid_article(self) -> None:
@@ -314,35 +307,36 @@ class NewsDetailViewTests(TestCase):
         self.assertEqual(response.status_code, 301)  # Permanent redirect
         self.assertTrue(hasattr(response, "url"))  # Type guard
 
-    def test_preserves_from_page_navigation(self) -> None:
-        """Test that from_page parameter is preserved in context."""
-        response = self.client.get(self.url + "?from_page=2")
-        self.assertEqual(response.context["from_page"], "2")
-
-    def test_preserves_search_context(self) -> None:
-        """Test that search context is preserved."""
-        response = self.client.get(self.url + "?from_search=1&q=test&type=vector")
-        self.assertEqual(response.context["from_search"], "1")
-        self.assertEqual(response.context["search_query"], "test")
-        self.assertEqual(response.context["search_type"], "vector")
-
-    def test_preserves_tag_context(self) -> None:
-        """Test that tag context is preserved."""
-        response = self.client.get(
-            self.url + "?from_tag=1&tag_slug=python&tag_name=Python"
-        )
-        self.assertEqual(response.context["from_tag"], "1")
-        self.assertEqual(response.context["tag_slug"], "python")
-        self.assertEqual(response.context["tag_name"], "Python")
+    def test_preserves_navigation_context(self) -> None:
+        """Test that pagination, search, and tag context are preserved."""
+        cases = [
+            ({"from_page": "2"}, {"from_page": "2"}),
+            (
+                {"from_search": "1", "q": "test", "type": "vector"},
+                {"from_search": "1", "search_query": "test", "search_type": "vector"},
+            ),
+            (
+                {"from_tag": "1", "tag_slug": "python", "tag_name": "Python"},
+                {"from_tag": "1", "tag_slug": "python", "tag_name": "Python"},
+            ),
+        ]
+
+        for params, expected in cases:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                for key, value in expected.items():
+                    self.assertEqual(response.context[key], value)
 
 
 class NewsDetailRedirectViewTests(TestCase):
     """Test cases for news detail redirect views."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.article = News.objects.create(
+    article: News
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the whole class."""
+        cls.article = News.objects.create(
             title="Test Article",
             status="published",
             deleted_at=None,
@@ -371,13 +365,17 @@ class NewsDetailRedirectViewTests(TestCase):
 class NewsSearchViewTests(TestCase):
     """Test cases for news search view."""
 
-    def setUp(self) -> None:
-        """Set up test client and data."""
-        self.client = Client()
-        self.url = reverse("news:search")
+    url: str
+    article1: News
+    article2: News
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test data once for the whole class."""
+        cls.url = reverse("news:search")
 
         # Create some test articles
-        self.article1 = News.objects.create(
+        cls.article1 = News.objects.create(
             title="AI and Machine Learning Advances",
             llm_headline="AI Breaking New Ground",
             llm_summary="An article about artificial intelligence and recent machine learning breakthroughs",
@@ -390,7 +388,7 @@ class NewsSearchViewTests(TestCase):
             status="published",
             deleted_at=None,
         )
-        self.article2 = News.objects.create(
+        cls.article2 = News.objects.create(
             title="Python Programming Best Practices",
             llm_headline="Python Development Guide",
             llm_summary="An article about Python programming techniques and best practices",
@@ -416,41 +414,44 @@ class NewsSearchViewTests(TestCase):
 
     def test_context_contains_search_data(self) -> None:
         """Test that context contains query, search_type, and results."""
-        response = self.client.get(self.url + "?q=test&type=text")
-        self.assertIn("query", response.context)
-        self.assertIn("search_type", response.context)
-        self.assertIn("news_articles", response.context)
-        self.assertIn("total_count", response.context)
+        response = self.client.get(self.url, {"q": "test", "type": "text"})
+        context = response.context
+        self.assertIn("query", context)
+        self.assertIn("search_type", context)
+        self.assertIn("news_articles", context)
+        self.assertIn("total_count", context)
 
     def test_empty_query_returns_no_results(self) -> None:
         """Test that empty query returns no results."""
-        response = self.client.get(self.url + "?q=")
+        response = self.client.get(self.url, {"q": ""})
         self.assertEqual(response.context["total_count"], 0)
 
     def test_whitespace_only_query_returns_no_results(self) -> None:
         """Test that whitespace-only query returns no results."""
-        response = self.client.get(self.url + "?q=%20%20%20")
+        response = self.client.get(self.url, {"q": "   "})
         self.assertEqual(response.context["total_count"], 0)
 
     def test_query_preserved_in_context(self) -> None:
         """Test that query is preserved in context for display."""
-        response = self.client.get(self.url + "?q=test+query")
+        response = self.client.get(self.url, {"q": "test query"})
         self.assertIn("test query", response.context["query"])
 
-    def test_search_type_preserved_in_context(self) -> None:
-        """Test that search type is preserved in context."""
-        response = self.client.get(self.url + "?q=test&type=vector")
-        self.assertEqual(response.context["search_type"], "vector")
-
-    def test_defaults_to_hybrid_search(self) -> None:
-        """Test that search defaults to hybrid when type not specified."""
-        response = self.client.get(self.url + "?q=test")
-        self.assertEqual(response.context["search_type"], "hybrid")
-
-    def test_invalid_search_type_defaults_to_hybrid(self) -> None:
-        """Test that invalid search type defaults to hybrid."""
-        response = self.client.get(self.url + "?q=test&type=invalid")
-        self.assertEqual(response.context["search_type"], "hybrid")
+    def test_search_type_normalization(self) -> None:
+        """Test that valid types are preserved and others default to hybrid."""
+        cases = [
+            (None, "hybrid"),  # type omitted
+            ("invalid", "hybrid"),
+            ("vector", "vector"),
+            ("text", "text"),
+        ]
+
+        for search_type, expected in cases:
+            with self.subTest(type=search_type):
+                params = {"q": "test"}
+                if search_type is not None:
+                    params["type"] = search_type
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.context["search_type"], expected)
 
     def test_only_returns_published_articles(self) -> None:
         """Test that search only returns published articles."""
@@ -460,7 +461,7 @@ class NewsSearchViewTests(TestCase):
             deleted_at=None,
         )
 
-        response = self.client.get(self.url + "?q=AI&type=text")
+        response = self.client.get(self.url, {"q": "AI", "type": "text"})
         results = list(response.context["news_articles"])
 
         self.assertNotIn(unpublished, results)
@@ -473,12 +474,13 @@ class NewsSearchViewTests(TestCase):
             deleted_at=timezone.now(),
         )
 
-        response = self.client.get(self.url + "?q=AI&type=text")
+        response = self.client.get(self.url, {"q": "AI", "type": "text"})
         results = list(response.context["news_articles"])
 
         self.assertNotIn(deleted, results)
 
     @override_settings(RATELIMIT_ENABLE=True)
+    @patch("news.views.search_views.render", new=_render_status_only)
     def test_rate_limiting_allows_first_100_searches(self) -> None:
         """Test that first 100 searches within an hour succeed."""
         # Clear cache to ensure clean state
@@ -488,7 +490,7 @@ class NewsSearchViewTests(TestCase):
 
         # Make 100 requests
         for i in range(100):
-            response = self.client.get(self.url + f"?q=test{i}&type=text")
+            response = self.client.get(self.url, {"q": f"test{i}", "type": "text"})
             self.assertEqual(response.status_code, 200)
 
     @override_settings(
@@ -500,6 +502,7 @@ class NewsSearchViewTests(TestCase):
             }
         },
     )
+    @patch("news.views.search_views.render", new=_render_status_only)
     def test_rate_limiting_blocks_101st_search(self) -> None:
         """Test that 101st search within the same hour is blocked."""
         # Clear cache to ensure clean state
@@ -509,7 +512,7 @@ class NewsSearchViewTests(TestCase):
 
         # Make 101 requests
         for i in range(101):
-            response = self.client.get(self.url + f"?q=test{i}&type=text")
+            response = self.client.get(self.url, {"q": f"test{i}", "type": "text"})
 
         # 101st request should be rate limited
         self.assertEqual(response.status_code, 429)
@@ -532,78 +535,66 @@ class NewsSearchViewTests(TestCase):
 
         # Make 101 requests to trigger rate limit
         for i in range(101):
-            response = self.client.get(self.url + f"?q=test{i}&type=text")
+            response = self.client.get(self.url, {"q": f"test{i}", "type": "text"})
 
         # Check for rate limit context
-        self.assertIn("rate_limited", response.context)
-        self.assertTrue(response.context["rate_limited"])
+        context = response.context
+        self.assertIn("rate_limited", context)
+        self.assertTrue(context["rate_limited"])
 
 
 class TagViewsTests(TestCase):
     """Test cases for tag-related views."""
 
     def setUp(self) -> None:
-        """Set up test client and data."""
-        self.client = Client()
+        """Set up test data."""
         self.tag1 = Tag.objects.create(name="Python", slug="python")
         self.tag2 = Tag.objects.create(name="JavaScript", slug="javascript")
 
     def test_tags_index_returns_200(self) -> None:
         """Test that tags index returns HTTP 200."""
         # Create some news articles so tags have counts
-        for i in range(3):
-            News.objects.create(
-                title=f"Python Article {i}",
-                llm_tags=["Python"],
-                status="published",
-            )
+        News.objects.bulk_create(
+            News(title=f"Python Article {i}", llm_tags=["Python"], status="published")
+            for i in range(3)
+        )
         response = self.client.get(reverse("news:tags_index"))
         self.assertEqual(response.status_code, 200)
 
     def test_tags_index_uses_correct_template(self) -> None:
         """Test that tags index uses correct template."""
         # Create some news articles so tags have counts
-        for i in range(3):
-            News.objects.create(
-                title=f"Python Article {i}",
-                llm_tags=["Python"],
-                status="published",
-            )
+        News.objects.bulk_create(
+            News(title=f"Python Article {i}", llm_tags=["Python"], status="published")
+            for i in range(3)
+        )
         response = self.client.get(reverse("news:tags_index"))
         self.assertTemplateUsed(response, "news/tags_index.html")
 
     def test_tags_index_context_contains_tags(self) -> None:
         """Test that tags index context contains tags list."""
         # Create some news articles so tags have counts
-        for i in range(3):
-            News.objects.create(
-                title=f"Python Article {i}",
-                llm_tags=["Python"],
-                status="published",
-            )
+        News.objects.bulk_create(
+            News(title=f"Python Article {i}", llm_tags=["Python"], status="published")
+            for i in range(3)
+        )
         response = self.client.get(reverse("news:tags_index"))
         self.assertIn("tags", response.context)
 
     def test_tags_index_only_shows_tags_with_more_than_2_articles(self) -> None:
         """Test that tags index only shows tags with >2 articles."""
 
-        # JavaScript: 2 articles (should be filtered out)
-        for i in range(2):
-            News.objects.create(
-                title=f"JS Article {i}",
-                llm_tags=["JavaScript"],
-                status="published",
-            )
-
-        # Python: 3 articles (should appear)
-        for i in range(3):
-            News.objects.create(
-                title=f"Python Article {i}",
-                llm_tags=["Python"],
-                status="published",
-            )
+        # JavaScript: 2 articles (filtered out); Python: 3 articles (appears)
+        News.objects.bulk_create(
+            News(title=f"{tag} Article {i}", llm_tags=[tag], status="published")
+            for tag, count in [("JavaScript", 2), ("Python", 3)]
+            for i in range(count)
+        )
 
-        response = self.client.get(reverse("news:tags_index"))
+        # The view counts tags in two fixed queries however many tags exist;
+        # a per-tag lookup creeping in would break this budget
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("news:tags_index"))
         tags = response.context["tags"]
 
         self.assertEqual(len(tags), 1)
@@ -615,13 +606,13 @@ class TagViewsTests(TestCase):
         Tag.objects.create(name="Apple", slug="apple")
 
         # Create news articles for all tags (>2 each so they appear)
-        for tag_name in ["Python", "JavaScript", "Zebra", "Apple"]:
-            for i in range(3):
-                News.objects.create(
-                    title=f"{tag_name} Article {i}",
-                    llm_tags=[tag_name],
-                    status="published",
-                )
+        News.objects.bulk_create(
+            News(
+                title=f"{tag_name} Article {i}", llm_tags=[tag_name], status="published"
+            )
+            for tag_name in ["Python", "JavaScript", "Zebra", "Apple"]
+            for i in range(3)
+        )
 
         response = self.client.get(reverse("news:tags_index"))
         tags = response.context["tags"]
@@ -634,9 +625,7 @@ class TagViewsTests(TestCase):
         self, mock_get_articles: MagicMock
     ) -> None:
         """Test that tag detail returns 200 for valid tag slug."""
-        from django.db.models import QuerySet
-
-        mock_get_articles.return_value = QuerySet(model=News).none()
+        mock_get_articles.return_value = _EMPTY_NEWS_QS
 
         url = reverse("news:tag_detail", kwargs={"tag_slug": "python"})
         response = self.client.get(url)
@@ -653,9 +642,7 @@ class TagViewsTests(TestCase):
         self, mock_get_articles: MagicMock
     ) -> None:
         """Test that tag detail uses correct template."""
-        from django.db.models import QuerySet
-
-        mock_get_articles.return_value = QuerySet(model=News).none()
+        mock_get_articles.return_value = _EMPTY_NEWS_QS
 
         url = reverse("news:tag_detail", kwargs={"tag_slug": "python"})
         response = self.client.get(url)
@@ -666,9 +653,7 @@ class TagViewsTests(TestCase):
         self, mock_get_articles: MagicMock
     ) -> None:
         """Test that tag detail context contains tag and articles."""
-        from django.db.models import QuerySet
-
-        mock_get_articles.return_value = QuerySet(model=News).none()
+        mock_get_articles.return_value = _EMPTY_NEWS_QS
 
         url = reverse("news:tag_detail", kwargs={"tag_slug": "python"})
         response = self.client.get(url)
@@ -677,13 +662,10 @@ class TagViewsTests(TestCase):
         self.assertIn("articles", response.context)
 
 
-class RobotsTxtViewTests(TestCase):
+class RobotsTxtViewTests(SimpleTestCase):
     """Test cases for robots.txt view."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-        self.url = "/robots.txt"
+    url = "/robots.txt"
 
     def test_returns_200(self) -> None:
         """Test that robots.txt returns HTTP 200."""
@@ -695,81 +677,40 @@ class RobotsTxtViewTests(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response["Content-Type"], "text/plain")
 
-    def test_contains_user_agent(self) -> None:
-        """Test that robots.txt contains User-agent directive."""
+    def test_contains_expected_directives(self) -> None:
+        """Test that robots.txt contains its User-agent/Allow/Sitemap lines."""
         response = self.client.get(self.url)
-        self.assertIn(b"User-agent:", response.content)
+        for directive in ("User-agent:", "Allow:", "Sitemap:"):
+            with self.subTest(directive=directive):
+                self.assertContains(response, directive)
 
-    def test_contains_allow_directive(self) -> None:
-        """Test that robots.txt contains Allow directive."""
-        response = self.client.get(self.url)
-        self.assertIn(b"Allow:", response.content)
-
-    def test_contains_sitemap_reference(self) -> None:
-        """Test that robots.txt contains Sitemap reference."""
-        response = self.client.get(self.url)
-        self.assertIn(b"Sitemap:", response.content)
 
+class KeybaseTxtViewTests(SimpleTestCase):
+    """Test cases for keybase.txt view. Filesystem only — no DB involved."""
 
-class KeybaseTxtViewTests(TestCase):
-    """Test cases for keybase.txt view."""
+    url = "/keybase.txt"
 
     def setUp(self) -> None:
-        """Set up test client."""
-        self.client = Client()
-        self.url = "/keybase.txt"
+        """Point BASE_DIR at a temp directory so tests never touch the repo."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_dir = Path(tmp.name)
+        override = override_settings(BASE_DIR=self.base_dir)
+        override.enable()
+        self.addCleanup(override.disable)
 
     def test_returns_404_when_file_not_found(self) -> None:
         """Test that keybase.txt returns HTTP 404 when file doesn't exist."""
-        from django.conf import settings
-
-        keybase_path = settings.BASE_DIR / "keybase.txt"
-        temp_file_path = None
-
-        try:
-            # Backup existing file if it exists
-            if keybase_path.exists():
-                temp_file_path = keybase_path.with_suffix(".bak")
-                keybase_path.rename(temp_file_path)
-
-            # Test the response when file doesn't exist
-            response = self.client.get(self.url)
-            self.assertEqual(response.status_code, 404)
-            self.assertIn(b"keybase.txt not found", response.content)
-
-        finally:
-            # Restore original file if it existed
-            if temp_file_path and temp_file_path.exists():
-                temp_file_path.rename(keybase_path)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.assertIn(b"keybase.txt not found", response.content)
 
     def test_content_type_is_text_plain(self) -> None:
         """Test that keybase.txt has correct content type when file exists."""
-        from django.conf import settings
-
         test_content = "test keybase content"
-        keybase_path = settings.BASE_DIR / "keybase.txt"
-        temp_file_path = None
+        (self.base_dir / "keybase.txt").write_text(test_content)
 
-        try:
-            # Backup existing file if it exists
-            if keybase_path.exists():
-                temp_file_path = keybase_path.with_suffix(".bak")
-                keybase_path.rename(temp_file_path)
-
-            # Write test content to keybase.txt
-            with open(keybase_path, "w") as f:
-                f.write(test_content)
-
-            # Test the response
-            response = self.client.get(self.url)
-            self.assertEqual(response.status_code, 200)
-            self.assertEqual(response["Content-Type"], "text/plain")
-            self.assertEqual(response.content.decode(), test_content)
-
-        finally:
-            # Clean up the test file
-            if keybase_path.exists():
-                keybase_path.unlink()
-            # Restore original file if it existed
-            if temp_file_path and temp_file_path.exists():
-                temp_file_path.rename(keybase_path)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/plain")
+        self.assertEqual(response.content.decode(), test_content)
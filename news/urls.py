@@ -1,36 +1,68 @@
-from django.shortcuts import redirect
-from django.urls import path
+from django.urls import include, path
+from django.views.generic import RedirectView
 
 from . import views
 
 app_name = "news"
 
-urlpatterns = [
-    path("", views.news_list, name="list"),
-    # Legacy URL redirect (old site used /latest-headlines)
-    path("latest-headlines", lambda request: redirect("news:list", permanent=True)),
-    path("latest-headlines/", lambda request: redirect("news:list", permanent=True)),
-    path("<int:news_id>/<slug:slug>", views.news_detail, name="detail"),
+# Grouped by prefix so the resolver only walks a subtree once its prefix
+# matches, instead of testing every flat pattern in order. Most-hit prefixes
+# (article detail, then tag browsing) come first. Redirect targets are spelled
+# as literal paths (interpolated from the captured kwargs where needed) so the
+# redirects skip a reverse() walk on every hit; they mirror the patterns below.
+detail_patterns = [
+    path("<slug:slug>", views.news_detail, name="detail"),
     path(
-        "<int:news_id>/<slug:slug>/",
-        views.news_detail_slash_redirect,
+        "<slug:slug>/",
+        RedirectView.as_view(url="/%(news_id)s/%(slug)s", permanent=True),
         name="detail_slash_redirect",
     ),
+]
+
+tag_patterns = [
+    path("<slug:tag_slug>", views.tag_detail, name="tag_detail"),
+    path(
+        "<slug:tag_slug>/",
+        RedirectView.as_view(url="/tag/%(tag_slug)s", permanent=True),
+        name="tag_detail_slash_redirect",
+    ),
+]
+
+urlpatterns = [
+    path("", views.news_list, name="list"),
+    path("<int:news_id>/", include(detail_patterns)),
     path("<int:news_id>", views.news_detail_redirect, name="detail_redirect"),
-    path("search", views.news_search, name="search"),
-    path("search/", views.news_search_slash_redirect, name="search_slash_redirect"),
-    # Tag browsing URLs
+    path("tag/", include(tag_patterns)),
     path("tags", views.tags_index, name="tags_index"),
-    path("tags/", views.tags_index_slash_redirect, name="tags_index_slash_redirect"),
-    path("tag/<slug:tag_slug>", views.tag_detail, name="tag_detail"),
     path(
-        "tag/<slug:tag_slug>/",
-        views.tag_detail_slash_redirect,
-        name="tag_detail_slash_redirect",
+        "tags/",
+        RedirectView.as_view(url="/tags", permanent=True),
+        name="tags_index_slash_redirect",
+    ),
+    path("search", views.news_search, name="search"),
+    path(
+        "search/",
+        RedirectView.as_view(url="/search", permanent=True, query_string=True),
+        name="search_slash_redirect",
     ),
     # Legal pages
     path("privacy", views.privacy_policy, name="privacy_policy"),
-    path("privacy/", lambda request: redirect("news:privacy_policy", permanent=True)),
+    path(
+        "privacy/",
+        RedirectView.as_view(url="/privacy", permanent=True),
+    ),
     path("terms", views.terms_conditions, name="terms_conditions"),
-    path("terms/", lambda request: redirect("news:terms_conditions", permanent=True)),
+    path(
+        "terms/",
+        RedirectView.as_view(url="/terms", permanent=True),
+    ),
+    # Legacy URL redirect (old site used /latest-headlines)
+    path(
+        "latest-headlines",
+        RedirectView.as_view(url="/", permanent=True),
+    ),
+    path(
+        "latest-headlines/",
+        RedirectView.as_view(url="/", permanent=True),
+    ),
 ]
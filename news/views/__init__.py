@@ -10,20 +10,17 @@ from .article_views import (
     get_client_ip,
     news_detail,
     news_detail_redirect,
-    news_detail_slash_redirect,
     news_list,
 )
 
 # Search views
-from .search_views import news_search, news_search_slash_redirect
+from .search_views import news_search
 
 # Tag views
 from .tag_views import (
     category_detail,
     tag_detail,
-    tag_detail_slash_redirect,
     tags_index,
-    tags_index_slash_redirect,
 )
 
 # Utility views
@@ -39,17 +36,13 @@ __all__ = [
     "news_list",
     "news_detail",
     "news_detail_redirect",
-    "news_detail_slash_redirect",
     "get_client_ip",
     # Search views
     "news_search",
-    "news_search_slash_redirect",
     # Tag views
     "tag_detail",
     "tags_index",
     "category_detail",
-    "tag_detail_slash_redirect",
-    "tags_index_slash_redirect",
     # Utility views
     "RobotsTxtView",
     "KeybaseTxtView",
@@ -2,13 +2,35 @@
 Article-related views for listing and displaying news articles.
 """
 
+import json
+from datetime import datetime
+from typing import Optional
+
 from django.conf import settings
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.paginator import Paginator
+from django.db.models import Max
 from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
-from django.views.decorators.cache import cache_control, cache_page
+from django.templatetags.static import static
+from django.utils import timezone
+from django.utils.safestring import SafeString, mark_safe
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 
 from ..models import News
+from .view_cache import cached_view
+
+# Detail-page navigation context: (context key, query parameter, default),
+# frozen once at import instead of seven GET lookups spelled out per render
+_NAV_PARAMS = (
+    ("from_search", "from_search", ""),
+    ("from_tag", "from_tag", ""),
+    ("from_page", "from_page", "1"),
+    ("tag_slug", "tag_slug", ""),
+    ("tag_name", "tag_name", ""),
+    ("search_query", "q", ""),
+    ("search_type", "type", "hybrid"),
+)
 
 
 def get_client_ip(group: str, request: HttpRequest) -> str:
@@ -23,18 +45,129 @@ def get_client_ip(group: str, request: HttpRequest) -> str:
     Returns:
         Client IP address string
     """
+    # Memoized per request: ratelimit calls this on every search hit, and
+    # anything else needing the client IP reuses the cached value
+    cached = getattr(request, "_client_ip", None)
+    if cached is not None:
+        return cached  # type: ignore[no-any-return]
+
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
     if x_forwarded_for:
         # X-Forwarded-For can contain multiple IPs: "client, proxy1, proxy2"
-        # The first IP is the original client
-        ip = x_forwarded_for.split(",")[0].strip()
-        return ip
-    # Fallback to REMOTE_ADDR (used in local dev without proxy)
-    ip = request.META.get("REMOTE_ADDR")
-    return ip if ip else ""
+        # The first IP is the original client; partition avoids building the
+        # full list that split() would allocate
+        ip = x_forwarded_for.partition(",")[0].strip()
+    else:
+        # Fallback to REMOTE_ADDR (used in local dev without proxy)
+        ip = request.META.get("REMOTE_ADDR") or ""
+    request._client_ip = ip  # type: ignore[attr-defined]
+    return ip
+
+
+def page_number(request: HttpRequest, paginator: Paginator) -> int:
+    """
+    Parse the page query parameter once, clamped to the paginator's range.
+
+    Non-integer values fall back to the first page and out-of-range values
+    clamp to the last, matching the old PageNotAnInteger/EmptyPage handling
+    without exception-driven control flow on every paginated request. Pages
+    below 1 count as out of range — Paginator raises EmptyPage for them, so
+    the old handler served the last page, not the first.
+
+    Args:
+        request: HTTP request object
+        paginator: Paginator the page number is for
+
+    Returns:
+        A page number paginator.page() will accept without raising
+    """
+    try:
+        number = int(request.GET.get("page", "1"))
+    except ValueError:
+        return 1
+    if number < 1:
+        return paginator.num_pages or 1
+    return min(number, paginator.num_pages or 1)
+
+
+def _iso8601(value: Optional[datetime]) -> str:
+    """Format a datetime for JSON-LD, or return an empty string."""
+    if value is None:
+        return ""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _build_json_ld(request: HttpRequest, news_article: News) -> SafeString:
+    """
+    Serialize the NewsArticle JSON-LD payload for the detail template.
+
+    A single json.dumps call replaces the dozen template filter invocations
+    the structured_data block used to run, and the compact separators drop
+    the whitespace the old markup carried.
+
+    Args:
+        request: HTTP request object
+        news_article: Article being rendered
+
+    Returns:
+        Safe, compact JSON string for the ld+json script tag
+    """
+    if news_article.image_url:
+        image = news_article.image_url
+    else:
+        image = request.build_absolute_uri(
+            static("assets/images/android-chrome-512x512.png")
+        )
+
+    absolute_url = request.build_absolute_uri(news_article.get_absolute_url())
+    organization = {
+        "@type": "Organization",
+        "name": news_article.site_name or "MTA Demo",
+        "url": f"{request.scheme}://{request.get_host()}",
+    }
+
+    data = {
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": news_article.display_title,
+        "description": news_article.display_summary,
+        "image": [image],
+        "datePublished": _iso8601(news_article.article_date),
+        "dateModified": _iso8601(news_article.updated_at or news_article.article_date),
+        "url": absolute_url,
+        "mainEntityOfPage": {"@type": "WebPage", "@id": absolute_url},
+        "publisher": organization,
+        "author": organization,
+        "keywords": ", ".join(news_article.llm_tags or []) or "news",
+        "articleSection": (news_article.llm_tags or ["General"])[0],
+        "isAccessibleForFree": True,
+    }
+
+    # Escape "<" so article text can never close the surrounding script tag.
+    serialized = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return mark_safe(serialized.replace("<", "\\u003c"))
+
+
+def _news_list_last_modified(request: HttpRequest) -> Optional[datetime]:
+    """
+    Return the newest change date across published articles for conditional GET.
+
+    Any publish or edit bumps one of these maxima, so revalidating clients
+    get a body-less 304 until the listing actually changes.
+    """
+    newest = News.objects.filter(status="published", deleted_at__isnull=True).aggregate(
+        updated=Max("updated_at"),
+        published=Max("article_date"),
+        created=Max("created_at"),
+    )
+    candidates = [value for value in newest.values() if value is not None]
+    return max(candidates) if candidates else None
 
 
-@cache_page(settings.CACHE_TTL)
+@condition(last_modified_func=_news_list_last_modified)
+@cached_view(settings.CACHE_TTL, params=("page",))
 @cache_control(max_age=300, public=True)
 def news_list(request: HttpRequest) -> HttpResponse:
     """
@@ -56,27 +189,43 @@ def news_list(request: HttpRequest) -> HttpResponse:
 
     # Paginate results
     paginator = Paginator(news_queryset, settings.PAGINATION_PAGE_SIZE)
-    page = request.GET.get("page", 1)
-
-    try:
-        paginated_articles = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page
-        paginated_articles = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page
-        paginated_articles = paginator.page(paginator.num_pages)
+    paginated_articles = paginator.page(page_number(request, paginator))
 
     context = {
         "news_articles": paginated_articles,
-        "total_count": news_queryset.count(),
+        # Paginator already counted the queryset; reuse its cached result
+        "total_count": paginator.count,
         "page_obj": paginated_articles,  # For pagination template tags
     }
 
     return render(request, "news/news_list.html", context)
 
 
-@cache_page(settings.CACHE_TTL)
+def _news_detail_last_modified(
+    request: HttpRequest, news_id: int, slug: str
+) -> Optional[datetime]:
+    """
+    Return the article's last change date for conditional GET.
+
+    Returns None (no 304 short-circuit) when the article is missing or the
+    slug does not match, so the view can 404 or redirect as usual.
+    """
+    try:
+        article = News.objects.only(
+            "llm_headline", "title", "updated_at", "article_date", "created_at"
+        ).get(id=news_id, status="published", deleted_at__isnull=True)
+    except News.DoesNotExist:
+        return None
+    if article.slug != slug:
+        return None
+    return article.updated_at or article.article_date or article.created_at
+
+
+@condition(last_modified_func=_news_detail_last_modified)
+@cached_view(
+    settings.CACHE_TTL,
+    params=tuple(param for _key, param, _default in _NAV_PARAMS),
+)
 @cache_control(max_age=300, public=True)
 def news_detail(request: HttpRequest, news_id: int, slug: str) -> HttpResponse:
     """
@@ -95,7 +244,9 @@ def news_detail(request: HttpRequest, news_id: int, slug: str) -> HttpResponse:
         Rendered news detail template or redirect if slug doesn't match
     """
     try:
-        news_article = News.objects.get(
+        # Skip the 768-dim embedding and concatenated content_text — the
+        # template and JSON-LD only read the display/metadata columns
+        news_article = News.objects.defer("content_text", "content_embedding").get(
             id=news_id, deleted_at__isnull=True, status="published"
         )
     except News.DoesNotExist:
@@ -107,25 +258,12 @@ def news_detail(request: HttpRequest, news_id: int, slug: str) -> HttpResponse:
             "news:detail", news_id=news_id, slug=news_article.slug, permanent=True
         )
 
-    # Get navigation context for back links
-    from_search = request.GET.get("from_search", "")
-    from_tag = request.GET.get("from_tag", "")
-    from_page = request.GET.get("from_page", "1")
-    tag_slug = request.GET.get("tag_slug", "")
-    tag_name = request.GET.get("tag_name", "")
-    search_query = request.GET.get("q", "")
-    search_type = request.GET.get("type", "hybrid")
-
     context = {
         "news_article": news_article,
+        "json_ld": _build_json_ld(request, news_article),
         "article_id": news_article.id,
-        "from_search": from_search,
-        "from_tag": from_tag,
-        "from_page": from_page,
-        "tag_slug": tag_slug,
-        "tag_name": tag_name,
-        "search_query": search_query,
-        "search_type": search_type,
+        # Navigation context for back links
+        **{key: request.GET.get(param, default) for key, param, default in _NAV_PARAMS},
     }
 
     return render(request, "news/news_detail.html", context)
@@ -152,20 +290,3 @@ def news_detail_redirect(request: HttpRequest, news_id: int) -> HttpResponse:
         )
     except News.DoesNotExist:
         raise Http404("News article not found")
-
-
-def news_detail_slash_redirect(
-    request: HttpRequest, news_id: int, slug: str
-) -> HttpResponse:
-    """
-    Redirect URLs with trailing slashes to the version without trailing slash.
-
-    Args:
-        request: HTTP request object
-        news_id: News article ID
-        slug: URL slug
-
-    Returns:
-        Redirect to URL without trailing slash
-    """
-    return redirect("news:detail", news_id=news_id, slug=slug, permanent=True)
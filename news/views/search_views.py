@@ -2,16 +2,46 @@
 Search-related views for news articles.
 """
 
+import hashlib
+
 from django.conf import settings
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import redirect, render
+from django.shortcuts import render
 from django_ratelimit.decorators import ratelimit
 
 from ..models import News
 from ..services import SearchService
-from .article_views import get_client_ip
+from .article_views import get_client_ip, page_number
+
+# Built once at import; membership checks against a frozenset skip the
+# per-request list construction
+_VALID_SEARCH_TYPES = frozenset(("vector", "text", "hybrid"))
+
+
+def _search_result_ids(query: str, search_type: str) -> list[int]:
+    """
+    Run the requested search and return the ranked article ids.
+
+    Ids (not querysets) are what news_search caches: they are small, safe to
+    serialize, and rehydrating the visible page is a cheap primary-key fetch.
+    """
+    search_service = SearchService()
+
+    news_articles: QuerySet[News]
+    if search_type == "vector":
+        # Pure vector similarity search - limit to top 100 results
+        news_articles = search_service.vector_search(query, limit=100)
+    elif search_type == "text":
+        # Traditional text search - limit to 100 results
+        news_articles = search_service.text_search(query, limit=100)
+    else:
+        # Hybrid search (default): combine vector and text search - limit to 100 results
+        news_articles = search_service.hybrid_search(query, limit=100)
+
+    return list(news_articles.values_list("id", flat=True))
 
 
 @ratelimit(
@@ -43,63 +73,61 @@ def news_search(request: HttpRequest) -> HttpResponse:
     search_type = request.GET.get("type", "hybrid")  # hybrid, vector, text
 
     # Normalize search_type to valid values
-    if search_type not in ["vector", "text", "hybrid"]:
+    if search_type not in _VALID_SEARCH_TYPES:
         search_type = "hybrid"
 
-    news_articles: QuerySet[News] = News.objects.none()
-
-    if query:
-        # Create search service instance
-        search_service = SearchService()
-
-        if search_type == "vector":
-            # Pure vector similarity search - limit to top 100 results
-            news_articles = search_service.vector_search(query, limit=100)
-        elif search_type == "text":
-            # Traditional text search - limit to 100 results
-            news_articles = search_service.text_search(query, limit=100)
-        else:
-            # Hybrid search (default): combine vector and text search - limit to 100 results
-            news_articles = search_service.hybrid_search(query, limit=100)
-
-    # Get total count before pagination
-    total_count = news_articles.count()
-
-    # Paginate results
-    paginator = Paginator(news_articles, settings.PAGINATION_PAGE_SIZE)
-    page = request.GET.get("page", 1)
-
-    try:
-        paginated_articles = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page
-        paginated_articles = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page
-        paginated_articles = paginator.page(paginator.num_pages)
+    if not query:
+        # Nothing to search: render the empty state without building a
+        # queryset or paginating
+        context = {
+            "news_articles": [],
+            "query": query,
+            "search_type": search_type,
+            "total_count": 0,
+            "page_obj": None,
+        }
+        return render(request, "news/news_search.html", context)
+
+    # Embedding generation plus the ranking SQL is the most expensive work
+    # in the app, and trending queries repeat — cache the ranked id list
+    # briefly, keyed on the normalized query and search type
+    key = "search:{}:{}".format(
+        hashlib.blake2b(query.lower().encode(), digest_size=12).hexdigest(),
+        search_type,
+    )
+    article_ids = (
+        cache.get_or_set(
+            key,
+            lambda: _search_result_ids(query, search_type),
+            settings.SEARCH_CACHE_TTL,
+        )
+        or []
+    )
+
+    # Paginate the id list, then hydrate only the visible page
+    paginator = Paginator(article_ids, settings.PAGINATION_PAGE_SIZE)
+    paginated_articles = paginator.page(page_number(request, paginator))
+
+    # Restore the ranking order the id list carries. The id list can outlive
+    # the articles it names (an article may be unpublished or soft-deleted
+    # within SEARCH_CACHE_TTL), so the hydration query re-applies the
+    # published filters rather than trusting the cached ids. The heavy
+    # columns are deferred — the results template renders summaries, not
+    # full article text or embeddings.
+    position = {pk: index for index, pk in enumerate(paginated_articles.object_list)}
+    page_articles = sorted(
+        News.objects.filter(
+            id__in=position, status="published", deleted_at__isnull=True
+        ).defer("content_text", "content_embedding"),
+        key=lambda article: position[article.id],
+    )
 
     context = {
-        "news_articles": paginated_articles,
+        "news_articles": page_articles,
         "query": query,
         "search_type": search_type,
-        "total_count": total_count,
+        "total_count": paginator.count,
         "page_obj": paginated_articles,  # For pagination template tags
     }
 
     return render(request, "news/news_search.html", context)
-
-
-def news_search_slash_redirect(request: HttpRequest) -> HttpResponse:
-    """
-    Redirect search URLs with trailing slashes to the version without trailing slash.
-
-    Args:
-        request: HTTP request object
-
-    Returns:
-        Redirect to search URL without trailing slash
-    """
-    query_string = request.META.get("QUERY_STRING", "")
-    if query_string:
-        return redirect(f"/search?{query_string}", permanent=True)
-    return redirect("news:search", permanent=True)
@@ -2,16 +2,52 @@
 Tag browsing and categorization views.
 """
 
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
 from django.conf import settings
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Count, Max
 from django.http import Http404, HttpRequest, HttpResponse
-from django.shortcuts import redirect, render
-from django.views.decorators.cache import cache_control, cache_page
+from django.shortcuts import render
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 
 from ..models import News, Tag
+from .article_views import page_number
+from .view_cache import cached_view
+
 
+def _tag_detail_last_modified(
+    request: HttpRequest, tag_slug: str
+) -> Optional[datetime]:
+    """
+    Return the newest change date across the tag's articles for conditional GET.
 
-@cache_page(settings.CACHE_TTL)
+    Returns None (no 304 short-circuit) for unknown slugs so the view can
+    404 as usual.
+    """
+    tag = Tag.objects.filter(slug=tag_slug).first()
+    if tag is None:
+        return None
+    # Stash the row for the view so a cache-miss render doesn't re-fetch it
+    request._tag_detail_tag = tag  # type: ignore[attr-defined]
+    newest = Tag.objects.get_articles_for_tag(tag).aggregate(
+        updated=Max("updated_at"),
+        published=Max("article_date"),
+        created=Max("created_at"),
+    )
+    candidates = [value for value in newest.values() if value is not None]
+    return max(candidates) if candidates else None
+
+
+@condition(last_modified_func=_tag_detail_last_modified)
+@cached_view(
+    settings.CACHE_TTL,
+    params=("page", "from_page", "highlight_article", "from"),
+)
 @cache_control(max_age=300, public=True)
 def tag_detail(request: HttpRequest, tag_slug: str) -> HttpResponse:
     """
@@ -28,11 +64,14 @@ def tag_detail(request: HttpRequest, tag_slug: str) -> HttpResponse:
     Returns:
         Rendered tag detail template
     """
-    try:
-        # Look up the tag by slug
-        tag = Tag.objects.get(slug=tag_slug)
-    except Tag.DoesNotExist:
-        raise Http404(f"Tag not found: {tag_slug}")
+    # Reuse the Tag row the conditional-GET check already fetched, falling
+    # back to a lookup when the view is called without that decorator pass
+    tag = getattr(request, "_tag_detail_tag", None)
+    if tag is None:
+        try:
+            tag = Tag.objects.get(slug=tag_slug)
+        except Tag.DoesNotExist:
+            raise Http404(f"Tag not found: {tag_slug}")
 
     # Get all articles for this tag and its descendants using the TagManager
     articles = Tag.objects.get_articles_for_tag(tag).order_by(
@@ -46,25 +85,17 @@ def tag_detail(request: HttpRequest, tag_slug: str) -> HttpResponse:
 
     # Paginate results
     paginator = Paginator(articles, settings.PAGINATION_PAGE_SIZE)
-    page = request.GET.get("page", 1)
-
-    try:
-        paginated_articles = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page
-        paginated_articles = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page
-        paginated_articles = paginator.page(paginator.num_pages)
+    paginated_articles = paginator.page(page_number(request, paginator))
 
     context = {
         "tag": tag,
         "tag_name": tag.name,
         "tag_slug": tag_slug,
         "hierarchy_path": tag.hierarchy_path,
-        "hierarchy_parts": tag.hierarchy_path.split(" > "),
+        "hierarchy_parts": tag.hierarchy_parts,
         "articles": paginated_articles,
-        "total_count": articles.count(),
+        # Paginator already counted the queryset; reuse its cached result
+        "total_count": paginator.count,
         "page_obj": paginated_articles,  # For pagination template tags
         "from_page": from_page,
         "highlight_article": highlight_article,
@@ -74,7 +105,7 @@ def tag_detail(request: HttpRequest, tag_slug: str) -> HttpResponse:
     return render(request, "news/tag_detail.html", context)
 
 
-@cache_page(settings.CACHE_TTL)
+@cached_view(settings.CACHE_TTL)
 @cache_control(max_age=300, public=True)
 def tags_index(request: HttpRequest) -> HttpResponse:
     """
@@ -89,30 +120,41 @@ def tags_index(request: HttpRequest) -> HttpResponse:
     Returns:
         Rendered tags index template
     """
-    # Get all published news articles with their tags in a single query
-    published_news = News.objects.filter(
-        status="published", deleted_at__isnull=True
-    ).values_list("llm_tags", flat=True)
-
-    # Count tag occurrences
-    tag_counts: dict[str, int] = {}
-    for tags_array in published_news:
-        if tags_array:  # Skip None/empty arrays
-            for tag_name in tags_array:
-                tag_counts[tag_name] = tag_counts.get(tag_name, 0) + 1
-
-    # Get all tags and attach their counts
-    tags = Tag.objects.all().order_by("name")
-    tags_with_counts = []
-    for tag in tags:
-        article_count = tag_counts.get(tag.name, 0)
-        if article_count > 2:  # Only show tags with more than 2 articles
-            tags_with_counts.append(
-                {
-                    "tag": tag,
-                    "article_count": article_count,
-                }
-            )
+    if connection.vendor == "postgresql":
+        # Aggregate in the database: unnest each llm_tags array and count
+        # occurrences per tag, keeping the "more than 2 articles" threshold
+        # in SQL so tags below it never cross the process boundary
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT tag, COUNT(*) AS frequency
+                FROM (
+                  SELECT unnest(llm_tags) AS tag
+                  FROM news
+                  WHERE status = 'published'
+                    AND deleted_at IS NULL
+                    AND llm_tags IS NOT NULL
+                ) AS tags
+                GROUP BY tag
+                HAVING COUNT(*) > 2;
+            """)
+            tag_counts = {row[0]: row[1] for row in cursor.fetchall()}
+    else:
+        # SQLite has no unnest(); tally the arrays in Python instead
+        published_news = News.objects.filter(
+            status="published", deleted_at__isnull=True
+        ).values_list("llm_tags", flat=True)
+
+        counter: Counter[str] = Counter()
+        for tags_array in published_news:
+            if tags_array:  # Skip None/empty arrays
+                counter.update(tags_array)
+        tag_counts = {name: count for name, count in counter.items() if count > 2}
+
+    # Fetch only the qualifying tags and attach their counts
+    tags_with_counts = [
+        {"tag": tag, "article_count": tag_counts[tag.name]}
+        for tag in Tag.objects.filter(name__in=tag_counts).order_by("name")
+    ]
 
     context = {
         "tags": tags_with_counts,
@@ -138,64 +180,73 @@ def category_detail(request: HttpRequest, category_slug: str) -> HttpResponse:
     except Tag.DoesNotExist:
         raise Http404(f"Category not found: {category_slug}")
 
-    # Get all direct children (subcategories and tags)
-    subcategories = category.children.all().prefetch_related("children")
-
-    # Separate subcategories from direct tags
-    subcategory_data = []
-    direct_tags = []
-
-    for child in subcategories:
-        if child.children.exists():
-            # This is a subcategory with its own children
-            subcategory_data.append(
-                {
-                    "tag": child,
-                    "article_count": child.get_news_count(),
-                    "child_count": child.children.count(),
-                }
-            )
-        else:
-            # This is a direct tag under the category
-            direct_tags.append(
-                {
-                    "tag": child,
-                    "article_count": child.get_news_count(),
-                }
+    # Get all direct children with their grandchild counts in one query
+    subcategories = list(
+        category.children.annotate(num_children=Count("children", distinct=True))
+    )
+
+    # Batch the article counts: one unnest + GROUP BY aggregate over the
+    # category and all of its children, instead of a get_news_count() query
+    # per tag (there is no FK from news to tags, so Count("news") can't be
+    # annotated — the relation is tag names inside the llm_tags array)
+    names = [category.name] + [child.name for child in subcategories]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT tag, COUNT(*) AS frequency
+                FROM (
+                  SELECT unnest(llm_tags) AS tag
+                  FROM news
+                  WHERE status = 'published'
+                    AND deleted_at IS NULL
+                    AND llm_tags && %s::varchar[]
+                ) AS tags
+                WHERE tag = ANY(%s)
+                GROUP BY tag;
+            """,
+                [names, names],
             )
+            article_counts = {row[0]: row[1] for row in cursor.fetchall()}
+    else:
+        # SQLite has no unnest(); tally the arrays in Python instead, as
+        # tags_index does
+        published_tags = News.objects.filter(
+            status="published", deleted_at__isnull=True
+        ).values_list("llm_tags", flat=True)
+
+        wanted = set(names)
+        counter: Counter[str] = Counter()
+        for tags_array in published_tags:
+            if tags_array:  # Skip None/empty arrays
+                counter.update(name for name in tags_array if name in wanted)
+        article_counts = dict(counter)
+
+    # Partition on the annotated grandchild count: children with their own
+    # children are subcategories, the rest are direct tags
+    subcategory_data = [
+        {
+            "tag": child,
+            "article_count": article_counts.get(child.name, 0),
+            "child_count": child.num_children,
+        }
+        for child in subcategories
+        if child.num_children > 0
+    ]
+    direct_tags = [
+        {
+            "tag": child,
+            "article_count": article_counts.get(child.name, 0),
+        }
+        for child in subcategories
+        if child.num_children == 0
+    ]
 
     context = {
         "category": category,
         "subcategories": subcategory_data,
         "direct_tags": direct_tags,
-        "total_article_count": category.get_news_count(),
+        "total_article_count": article_counts.get(category.name, 0),
     }
 
     return render(request, "news/category_detail.html", context)
-
-
-def tag_detail_slash_redirect(request: HttpRequest, tag_slug: str) -> HttpResponse:
-    """
-    Redirect tag detail URLs with trailing slashes to the version without trailing slash.
-
-    Args:
-        request: HTTP request object
-        tag_slug: URL slug for the tag
-
-    Returns:
-        Redirect to URL without trailing slash
-    """
-    return redirect("news:tag_detail", tag_slug=tag_slug, permanent=True)
-
-
-def tags_index_slash_redirect(request: HttpRequest) -> HttpResponse:
-    """
-    Redirect tags index URLs with trailing slashes to the version without trailing slash.
-
-    Args:
-        request: HTTP request object
-
-    Returns:
-        Redirect to URL without trailing slash
-    """
-    return redirect("news:tags_index", permanent=True)
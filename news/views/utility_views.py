@@ -2,11 +2,27 @@
 Utility views for robots.txt, keybase.txt, and legal pages.
 """
 
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.views import View
-from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.cache import cache_control
+
+from .view_cache import cached_view
+
+# Body assembled once at import; only the host is filled in per request so
+# the file stays correct across environments without a SITE_URL setting.
+ROBOTS_TXT_TEMPLATE = "User-agent: *\nAllow: /\n\nSitemap: https://{host}/sitemap.xml"
+
+
+@lru_cache(maxsize=8)
+def _robots_body(host: str) -> bytes:
+    """Format the robots.txt body once per host a deployment actually serves."""
+    return ROBOTS_TXT_TEMPLATE.format(host=host).encode()
 
 
 class RobotsTxtView(View):
@@ -24,13 +40,26 @@ class RobotsTxtView(View):
         Returns:
             Plain text robots.txt response
         """
-        lines = [
-            "User-agent: *",
-            "Allow: /",
-            "",
-            "Sitemap: https://{}{}".format(request.get_host(), "/sitemap.xml"),
-        ]
-        return HttpResponse("\n".join(lines), content_type="text/plain")
+        response = HttpResponse(
+            _robots_body(request.get_host()), content_type="text/plain"
+        )
+        response["Cache-Control"] = "public, max-age=86400"
+        return response
+
+
+@lru_cache(maxsize=2)
+def _keybase_body(path: str) -> Optional[bytes]:
+    """
+    Read keybase.txt once per process and path.
+
+    The file is immutable within a deploy, so caching by path drops the
+    per-request open() syscall while still letting tests point BASE_DIR
+    at their own directories.
+    """
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
 
 
 class KeybaseTxtView(View):
@@ -48,17 +77,15 @@ class KeybaseTxtView(View):
         Returns:
             Plain text keybase.txt response or 404 if not found
         """
-        try:
-            with open(settings.BASE_DIR / "keybase.txt", "r") as f:
-                content = f.read()
-            return HttpResponse(content, content_type="text/plain")
-        except FileNotFoundError:
+        body = _keybase_body(str(settings.BASE_DIR / "keybase.txt"))
+        if body is None:
             return HttpResponse(
                 "keybase.txt not found", status=404, content_type="text/plain"
             )
+        return HttpResponse(body, content_type="text/plain")
 
 
-@cache_page(settings.CACHE_TTL)
+@cached_view(settings.CACHE_TTL)
 @cache_control(max_age=300, public=True)
 def privacy_policy(request: HttpRequest) -> HttpResponse:
     """
@@ -76,7 +103,7 @@ def privacy_policy(request: HttpRequest) -> HttpResponse:
     return render(request, "news/privacy_policy.html")
 
 
-@cache_page(settings.CACHE_TTL)
+@cached_view(settings.CACHE_TTL)
 @cache_control(max_age=300, public=True)
 def terms_conditions(request: HttpRequest) -> HttpResponse:
     """
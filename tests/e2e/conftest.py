@@ -5,12 +5,37 @@ This module provides fixtures for running E2E tests against a live Django server
 """
 
 import os
+import socket
 import subprocess
 import time
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page
+from playwright.sync_api import Browser, BrowserContext, Page, expect
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _tight_expect_timeout() -> None:
+    """
+    Lower the global expect timeout from Playwright's 5s default to 2s.
+
+    Against a localhost server every assertion either settles in
+    milliseconds or is genuinely failing, so a failing expect aborts 3s
+    sooner. Assertions that intentionally probe optional elements already
+    pass their own shorter timeout explicitly.
+    """
+    expect.set_options(timeout=2000)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Mark every test in this directory as e2e.
+
+    The marker lets CI shards and local runs select or exclude the whole
+    browser suite with -m e2e / -m "not e2e" without per-file decorators.
+    """
+    for item in items:
+        item.add_marker(pytest.mark.e2e)
 
 
 @pytest.fixture(scope="session")
@@ -21,10 +46,18 @@ def django_server() -> Generator[str, None, None]:
     Note: Uses port 8301 (not 8300) so it doesn't conflict with 'make run'.
     This allows developers to keep their dev server running while testing.
 
+    Under pytest-xdist each worker process gets its own session-scoped copy
+    of this fixture, so each worker starts its own server on 8301 + worker
+    index (gw0 → 8301, gw1 → 8302, ...). Workers never share a server, so
+    there is no cross-worker startup or teardown coordination to get wrong.
+
     Returns:
         str: The base URL of the running server (http://localhost:8301)
     """
-    base_url = "http://localhost:8301"
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    offset = int(worker[2:]) if worker.startswith("gw") else 0
+    port = 8301 + offset
+    base_url = f"http://localhost:{port}"
 
     # Set environment variables for test server
     env = os.environ.copy()
@@ -32,44 +65,51 @@ def django_server() -> Generator[str, None, None]:
     env["DEBUG"] = "False"  # Use production-like settings (shows 404 template)
     env["RATELIMIT_ENABLE"] = "False"  # Disable rate limiting for tests
 
-    # Clear cache before starting test server
-    subprocess.run(
-        [
-            "uv",
-            "run",
-            "python",
-            "manage.py",
-            "shell",
-            "-c",
-            "from django.core.cache import cache; cache.clear()",
-        ],
-        env=env,
-        check=False,  # Don't fail if cache clear fails
-    )
+    # Clear cache before starting the test server. The shared cache (Redis
+    # or the server's own locmem) only needs clearing once per run, so only
+    # the first worker pays the full manage.py boot this subprocess costs —
+    # under -n 4 the other three workers skip it, and no worker wipes
+    # entries another worker's tests already warmed.
+    if offset == 0:
+        subprocess.run(
+            [
+                "uv",
+                "run",
+                "python",
+                "manage.py",
+                "shell",
+                "-c",
+                "from django.core.cache import cache; cache.clear()",
+            ],
+            env=env,
+            check=False,  # Don't fail if cache clear fails
+        )
 
-    # Start Django server on port 8301 (not 8300, to avoid conflicts with dev server)
+    # Start Django server on the worker's port (not 8300, to avoid conflicts
+    # with dev server)
     process = subprocess.Popen(
-        ["uv", "run", "python", "manage.py", "runserver", "8301", "--noreload"],
+        ["uv", "run", "python", "manage.py", "runserver", str(port), "--noreload"],
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
 
-    # Wait for server to be ready
-    max_retries = 30
+    # Wait for server to be ready. A TCP connect is enough to know the
+    # server is accepting requests — no need to issue a full HTTP GET (which
+    # renders the whole news list before the first test even starts). The
+    # short timeout and sleep keep the probe tight, so the session begins
+    # almost as soon as runserver binds the port.
+    max_retries = 150
     for _ in range(max_retries):
         try:
-            import requests
-
-            response = requests.get(base_url, timeout=1)
-            if response.status_code:
-                break
-        except (requests.ConnectionError, requests.Timeout):
-            time.sleep(0.5)
+            socket.create_connection(("localhost", port), timeout=0.2).close()
+            break
+        except OSError:
+            time.sleep(0.1)
     else:
         process.kill()
         raise RuntimeError(
-            "Django server failed to start. Check if port 8301 is available."
+            f"Django server failed to start. Check if port {port} is available."
         )
 
     yield base_url
@@ -79,6 +119,27 @@ def django_server() -> Generator[str, None, None]:
     process.wait(timeout=5)
 
 
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args: dict) -> dict:
+    """
+    Configure browser launch arguments.
+
+    --disable-dev-shm-usage makes Chromium use /tmp instead of /dev/shm for
+    its shared memory; CI containers often mount /dev/shm too small, and
+    exhausting it crashes the renderer mid-suite. Harmless locally.
+
+    Args:
+        browser_type_launch_args: Default browser launch arguments
+
+    Returns:
+        dict: Updated launch arguments with custom settings
+    """
+    return {
+        **browser_type_launch_args,
+        "args": ["--disable-dev-shm-usage"],
+    }
+
+
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args: dict) -> dict:
     """
@@ -95,22 +156,33 @@ def browser_context_args(browser_context_args: dict) -> dict:
         "viewport": {"width": 1920, "height": 1080},
         "locale": "en-US",
         "timezone_id": "America/New_York",
+        # No test exercises a service worker; blocking them avoids background
+        # fetch/registration work in every page
+        "service_workers": "block",
+        # Skip decorative CSS animations so state assertions settle sooner
+        "reduced_motion": "reduce",
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def context(
     browser: Browser, browser_context_args: dict
 ) -> Generator[BrowserContext, None, None]:
     """
-    Create a new browser context for each test.
+    Create one browser context shared by every test in the session.
+
+    Each test still gets its own page, but the context — and with it the
+    HTTP cache — is reused, so repeat navigations to "/" pay a warm render
+    instead of a full asset load on all ~30 tests. Tests that assert on
+    client-side state the context would carry over (e.g. localStorage)
+    should use the fresh_page fixture instead.
 
     Args:
         browser: Playwright browser instance
         browser_context_args: Browser context configuration
 
     Yields:
-        BrowserContext: Fresh browser context for the test
+        BrowserContext: Browser context shared across the session
     """
     context = browser.new_context(**browser_context_args)
     yield context
@@ -146,21 +218,147 @@ def page(context: BrowserContext, base_url: str) -> Generator[Page, None, None]:
         Page: Fresh page for the test
     """
     page = context.new_page()
+    # Local server: anything slower than 5s is a hang, not a slow page
+    page.set_default_timeout(5000)
+    page.set_default_navigation_timeout(5000)
     yield page
     page.close()
 
 
+# Fixture HTML for backend-independent structure tests: enough markup to
+# exercise the search form and article-card click paths, served straight
+# from the route handler with no DB query or template render behind it.
+_FIXTURE_SEARCH_HTML = """<!DOCTYPE html>
+<html><head><title>Search News Articles</title></head>
+<body>
+<h1>Search News Articles</h1>
+<form action="/search" method="get">
+  <input name="q" type="text" />
+  <button type="submit">Search</button>
+</form>
+<article id="article-9999991">
+  <h2>Fixture result</h2>
+  <a href="/9999991/fixture-article">Fixture result</a>
+</article>
+</body></html>"""
+
+_FIXTURE_ARTICLE_HTML = """<!DOCTYPE html>
+<html><head><title>Fixture Article</title></head>
+<body><h1>Fixture Article</h1><p>Static body for structure-only tests.</p></body>
+</html>"""
+
+
 @pytest.fixture
-def mobile_page(browser: Browser, base_url: str) -> Generator[Page, None, None]:
+def mocked_page(page: Page) -> Page:
     """
-    Create a mobile viewport page for responsive testing.
+    Page whose search and fixture-article responses are served from memory.
+
+    Search is the most expensive backend path (embedding round trip plus
+    ranking SQL). Tests that assert URL and DOM structure — not real
+    content — intercept it with static fixture HTML, so the assertion cost
+    is the navigation alone. True end-to-end journeys keep the plain page
+    fixture and the real backend.
+
+    Args:
+        page: Function-scoped page from the shared context
+
+    Returns:
+        Page: The same page with fixture routes installed
+    """
+    page.route(
+        "**/search**",
+        lambda route: route.fulfill(
+            body=_FIXTURE_SEARCH_HTML, content_type="text/html"
+        ),
+    )
+    page.route(
+        "**/9999991/**",
+        lambda route: route.fulfill(
+            body=_FIXTURE_ARTICLE_HTML, content_type="text/html"
+        ),
+    )
+    return page
+
+
+@pytest.fixture(scope="session")
+def first_article_url(browser: Browser, browser_context_args: dict) -> str:
+    """
+    Resolve the first article's detail URL once per session.
+
+    Several tests only need to land on an article page and don't validate
+    the homepage-click path; resolving the href once lets them do a single
+    page.goto(first_article_url) instead of goto("/") + locate + click on
+    every test. The URL is stable within a run because the server's list
+    page is cached.
+
+    Args:
+        browser: Playwright browser instance
+        browser_context_args: Browser context configuration
+
+    Returns:
+        str: href of the first article on the homepage
+    """
+    context = browser.new_context(**browser_context_args)
+    try:
+        page = context.new_page()
+        page.goto("/")
+        first_link = page.locator("article a").first
+        try:
+            expect(first_link).to_be_visible(timeout=1000)
+        except AssertionError:
+            pytest.skip("No articles available")
+        href = first_link.get_attribute("href")
+    finally:
+        context.close()
+    if not href:
+        pytest.skip("No articles available")
+    return href
+
+
+@pytest.fixture
+def fresh_page(
+    browser: Browser, browser_context_args: dict
+) -> Generator[Page, None, None]:
+    """
+    Create a page in its own throwaway context for a clean client-side slate.
+
+    The shared session context carries localStorage and cookies between
+    tests; tests that assert on that state (e.g. the back-scroll highlight
+    key) use this fixture so nothing written by earlier tests leaks in.
+
+    Args:
+        browser: Playwright browser instance
+        browser_context_args: Browser context configuration
+
+    Yields:
+        Page: Page in a context private to the test
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    # Same budgets as the shared page fixture
+    page.set_default_timeout(5000)
+    page.set_default_navigation_timeout(5000)
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def mobile_context(
+    browser: Browser, base_url: str
+) -> Generator[BrowserContext, None, None]:
+    """
+    Create one mobile-emulation context shared by every mobile test.
+
+    Device emulation is fixed at context creation, so mobile tests skip the
+    per-test set_viewport_size re-layout, get a consistent device profile,
+    and share a warm HTTP cache like the desktop context does.
 
     Args:
         browser: Playwright browser instance
         base_url: Base URL of the running Django server
 
     Yields:
-        Page: Mobile viewport page for the test
+        BrowserContext: Mobile emulation context shared across the session
     """
     context = browser.new_context(
         viewport={"width": 375, "height": 812},  # iPhone X dimensions
@@ -168,7 +366,27 @@ def mobile_page(browser: Browser, base_url: str) -> Generator[Page, None, None]:
         has_touch=True,
         is_mobile=True,
         base_url=base_url,  # Add base_url to context
+        service_workers="block",  # same rationale as the desktop context
+        reduced_motion="reduce",
     )
-    page = context.new_page()
-    yield page
+    yield context
     context.close()
+
+
+@pytest.fixture
+def mobile_page(mobile_context: BrowserContext) -> Generator[Page, None, None]:
+    """
+    Create a mobile viewport page for responsive testing.
+
+    Args:
+        mobile_context: Shared mobile emulation context
+
+    Yields:
+        Page: Mobile viewport page for the test
+    """
+    page = mobile_context.new_page()
+    # Local server: anything slower than 5s is a hang, not a slow page
+    page.set_default_timeout(5000)
+    page.set_default_navigation_timeout(5000)
+    yield page
+    page.close()
@@ -5,9 +5,19 @@ These tests validate the complete user experience from homepage to article detai
 and back, including context preservation for pagination.
 """
 
+from pathlib import Path
+
+import imagehash
 import pytest
+from PIL import Image
 from playwright.sync_api import Page, expect
 
+# Visual regression baseline: a 64-bit perceptual hash of the article
+# element, not a PNG. Hashes within this Hamming distance are considered
+# the same layout; minor anti-aliasing/rendering jitter lands well below it.
+_VISUAL_BASELINE = Path("tests/e2e/baselines/article-detail.phash")
+_MAX_HAMMING_DISTANCE = 5
+
 
 @pytest.mark.navigation
 def test_homepage_to_article_and_back(page: Page) -> None:
@@ -22,7 +32,7 @@ def test_homepage_to_article_and_back(page: Page) -> None:
     5. Verify returned to homepage
     """
     # Navigate to homepage
-    page.goto("/")
+    page.goto("/", wait_until="domcontentloaded")
 
     # Verify homepage loaded
     expect(page).to_have_title("Latest News - HINO9")
@@ -32,16 +42,17 @@ def test_homepage_to_article_and_back(page: Page) -> None:
     first_article = page.locator("article").first
     article_title = first_article.locator("h2").inner_text()
 
-    # Click on first article
-    first_article.locator("a").first.click()
+    # Click on first article (single combined locator: one CDP query)
+    page.locator("article a").first.click()
 
     # Verify article detail page
     expect(page.locator("h1")).to_contain_text(article_title)
 
-    # Find and click back link (could be "Back to Homepage" or "Back to page X")
-    back_link = page.locator("a").filter(has_text="Back")
-    expect(back_link.first).to_be_visible()
-    back_link.first.click()
+    # Find and click back link — the test id is a direct attribute lookup,
+    # not a text scan over every anchor on the page
+    back_link = page.get_by_test_id("back-link")
+    expect(back_link).to_be_visible()
+    back_link.click()
 
     # Verify back on homepage (might be page 1 instead of /)
     expect(page.locator("h1")).to_contain_text("Latest News")
@@ -60,17 +71,16 @@ def test_pagination_context_preservation(page: Page) -> None:
     5. Verify returned to correct page with from_page parameter
     """
     # Navigate to homepage
-    page.goto("/")
+    page.goto("/", wait_until="domcontentloaded")
 
     # Click "Next" or "Page 2" if pagination exists
     # Use get_by_role to be more specific and avoid matching article text
     next_button = page.get_by_role("link", name="Next")
 
-    try:
-        next_button.wait_for(state="visible", timeout=1000)
-        is_visible = True
-    except Exception:
-        is_visible = False
+    # The page is already loaded, so the link either exists or it doesn't —
+    # an immediate state check replaces the 1s wait_for burned on every run
+    # without pagination
+    is_visible = next_button.count() > 0 and next_button.is_visible()
 
     if is_visible:
         next_button.click()
@@ -79,13 +89,12 @@ def test_pagination_context_preservation(page: Page) -> None:
         assert "page=2" in page.url
 
         # Click on first article on page 2
-        first_article = page.locator("article").first
-        first_article.locator("a").first.click()
+        page.locator("article a").first.click()
 
-        # Verify the back link has "Back" (might say "page 2" or just "Back")
-        back_link = page.locator("a").filter(has_text="Back")
-        expect(back_link.first).to_be_visible()
-        back_link.first.click()
+        # Find and click the back link via its stable test id
+        back_link = page.get_by_test_id("back-link")
+        expect(back_link).to_be_visible()
+        back_link.click()
 
         # Verify returned to page 2
         assert "page=2" in page.url
@@ -95,7 +104,9 @@ def test_pagination_context_preservation(page: Page) -> None:
 
 
 @pytest.mark.navigation
-def test_article_detail_displays_all_content(page: Page) -> None:
+def test_article_detail_displays_all_content(
+    page: Page, first_article_url: str
+) -> None:
     """
     Test: Verify article detail page displays all expected content.
 
@@ -107,33 +118,30 @@ def test_article_detail_displays_all_content(page: Page) -> None:
     - Tags
     - Source link
     """
-    # Navigate to homepage and click first article
-    page.goto("/")
-    page.locator("article").first.locator("a").first.click()
+    # Land on the first article directly; the homepage-click path is covered
+    # by test_homepage_to_article_and_back
+    page.goto(first_article_url, wait_until="domcontentloaded")
 
     # Verify core content elements
     expect(page.locator("h1")).to_be_visible()
 
-    # Check for article image (may not always exist)
-    article_image = page.locator("img.article-image")
-    if article_image.count() > 0:
-        expect(article_image.first).to_be_visible()
-
-    # Verify summary or content exists
-    if page.locator("p").count() > 0:
-        expect(page.locator("p").first).to_be_visible()
+    # Check for article image (genuinely optional — not every article has
+    # one, so a short-timeout expect replaces the synchronous count() probe)
+    try:
+        expect(page.locator("img.article-image").first).to_be_visible(timeout=500)
+    except AssertionError:
+        pass  # Article has no image
 
-    # Verify tags (if present)
-    if (
-        page.locator("a").filter(has_text="tag").count() > 0
-        or page.locator(".tag").count() > 0
-    ):
-        # Tags exist, good
-        pass
+    # Verify summary content exists — every published article renders at
+    # least one paragraph, so assert it unconditionally and let the
+    # retrying expect handle timing instead of a count() branch
+    expect(page.locator("p").first).to_be_visible()
 
 
 @pytest.mark.mobile
-def test_article_navigation_on_mobile(mobile_page: Page) -> None:
+def test_article_navigation_on_mobile(
+    mobile_page: Page, first_article_url: str
+) -> None:
     """
     Test: Verify article navigation works on mobile viewport.
 
@@ -144,13 +152,14 @@ def test_article_navigation_on_mobile(mobile_page: Page) -> None:
     4. Navigate back using browser back button (back link is hidden on mobile)
     """
     # Navigate to homepage
-    mobile_page.goto("/")
+    mobile_page.goto("/", wait_until="domcontentloaded")
 
     # Verify mobile layout
     expect(mobile_page.locator("h1")).to_be_visible()
 
-    # Click first article
-    mobile_page.locator("article").first.locator("a").first.click()
+    # Go straight to the pre-resolved article URL — the goto still pushes a
+    # history entry, so the back-button assertion below is unchanged
+    mobile_page.goto(first_article_url, wait_until="domcontentloaded")
 
     # Verify article displays on mobile
     expect(mobile_page.locator("h1")).to_be_visible()
@@ -163,21 +172,39 @@ def test_article_navigation_on_mobile(mobile_page: Page) -> None:
 
 
 @pytest.mark.visual
-def test_article_page_visual_regression(page: Page) -> None:
+def test_article_page_visual_regression(page: Page, first_article_url: str) -> None:
     """
-    Test: Capture screenshot of article detail page for visual regression testing.
+    Test: Compare the article detail layout against a perceptual-hash baseline.
 
-    This test captures a screenshot that can be compared against baseline
-    to detect unintended visual changes.
+    Screenshots only the article element (not the full scrolled document) and
+    compares a 64-bit perceptual hash against the committed baseline instead
+    of a multi-MB golden PNG. Hashing tolerates minor rendering jitter while
+    still flagging real layout changes.
     """
-    # Navigate to first article
-    page.goto("/")
-    page.locator("article").first.locator("a").first.click()
+    # Navigate to the first article directly. Keep the default "load" wait
+    # here: the screenshot needs images and fonts, not just the DOM.
+    page.goto(first_article_url)
 
     # Wait for page to fully load
     expect(page.locator("h1")).to_be_visible()
 
-    # Take screenshot
-    page.screenshot(
-        path="tests/e2e/test-results/article-detail-page.png", full_page=True
+    # Screenshot just the article element — no full-page rasterize/scroll
+    screenshot_path = "tests/e2e/test-results/article-detail-page.png"
+    page.locator("article, main").first.screenshot(path=screenshot_path)
+
+    candidate = imagehash.phash(Image.open(screenshot_path))
+
+    if not _VISUAL_BASELINE.exists():
+        # First run on this machine: record the baseline and pass
+        _VISUAL_BASELINE.parent.mkdir(parents=True, exist_ok=True)
+        _VISUAL_BASELINE.write_text(f"{candidate}\n")
+        return
+
+    baseline = imagehash.hex_to_hash(_VISUAL_BASELINE.read_text().strip())
+    distance = candidate - baseline
+    assert distance <= _MAX_HAMMING_DISTANCE, (
+        f"Article page layout drifted from baseline "
+        f"(Hamming distance {distance} > {_MAX_HAMMING_DISTANCE}). "
+        f"If the change is intentional, delete {_VISUAL_BASELINE} and rerun "
+        f"to record a new baseline."
     )
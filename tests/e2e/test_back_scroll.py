@@ -5,49 +5,85 @@ These tests validate that when users click "Back" from an article detail page,
 the page scrolls to show the article they came from.
 """
 
+from urllib.parse import urlsplit
+
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 
 
-@pytest.mark.navigation
-def test_back_scrolls_to_article_on_news_list(page: Page) -> None:
-    """
-    Test: Click article from news list, browser back - should scroll to article.
+def _local_storage_item(page: Page, name: str) -> str | None:
+    """Read a localStorage value from Playwright's cached storage state.
 
-    User Journey:
-    1. Click article from homepage
-    2. Use browser back button
-    3. Verify page scrolls to show the article
+    context.storage_state() answers from state Playwright already tracks,
+    so the readback skips the CDP evaluate round-trip into the page.
     """
-    page.goto("/")
-
-    # Click first article
-    first_article = page.locator("article[id^='article-']").first
-    if not first_article.is_visible():
+    parts = urlsplit(page.url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    for entry in page.context.storage_state().get("origins", []):
+        if entry["origin"] == origin:
+            for item in entry.get("localStorage", []):
+                if item["name"] == name:
+                    return item["value"]
+    return None
+
+
+def _click_first_article_and_go_back(page: Page) -> None:
+    """Click the first article card, then navigate back once it registers.
+
+    Shared journey core for the back-scroll tests: waits for the click
+    handler to write the highlight key, goes back, and verifies the key
+    survived — callers only add their own start URL and post-back checks.
+    """
+    # One polling assertion both waits for the list to render and skips if
+    # it's empty, instead of a separate is_visible RPC
+    articles = page.locator("article[id^='article-']")
+    try:
+        expect(articles.first).to_be_visible(timeout=1000)
+    except AssertionError:
         pytest.skip("No articles available")
 
-    first_article.locator("a").first.click()
+    page.locator("article a").first.click()
 
-    # Wait for localStorage to be set
-    page.wait_for_timeout(100)
+    # Wait for the click handler to write localStorage — polling the actual
+    # state is faster than a fixed delay and doesn't flake under load
+    page.wait_for_function(
+        "() => localStorage.getItem('article_highlight') !== null", timeout=2000
+    )
 
     # Use browser back navigation
     page.go_back()
 
-    # Verify returned to homepage
-    assert page.url.endswith("/") or "?page=" in page.url
-
     # Verify localStorage has article ID (indicates scroll behavior will work)
-    local_storage_value = page.evaluate(
-        "() => localStorage.getItem('article_highlight')"
-    )
     assert (
-        local_storage_value is not None
+        _local_storage_item(page, "article_highlight") is not None
     ), "localStorage should have article ID for scrolling"
 
 
 @pytest.mark.navigation
-def test_back_scrolls_to_article_on_search_results(page: Page) -> None:
+# Precondition via the session-scoped fixture: if the dataset has no
+# articles, the skip fires at fixture setup — before this test pays for a
+# fresh context and navigation. Resolved once per session, so later tests
+# skip instantly.
+@pytest.mark.usefixtures("first_article_url")
+def test_back_scrolls_to_article_on_news_list(fresh_page: Page) -> None:
+    """
+    Test: Click article from news list, browser back - should scroll to article.
+
+    User Journey:
+    1. Click article from homepage
+    2. Use browser back button
+    3. Verify page scrolls to show the article
+    """
+    fresh_page.goto("/", wait_until="domcontentloaded")
+
+    _click_first_article_and_go_back(fresh_page)
+
+    # Verify returned to homepage
+    assert fresh_page.url.endswith("/") or "?page=" in fresh_page.url
+
+
+@pytest.mark.navigation
+def test_back_scrolls_to_article_on_search_results(fresh_page: Page) -> None:
     """
     Test: Click article from search results, browser back - should scroll to article.
 
@@ -57,33 +93,13 @@ def test_back_scrolls_to_article_on_search_results(page: Page) -> None:
     3. Use browser back button
     4. Verify page scrolls to show the article in search results
     """
-    page.goto("/search/")
-    search_input = page.locator("input[name='q']")
+    fresh_page.goto("/search/", wait_until="domcontentloaded")
+    search_input = fresh_page.locator("input[name='q']")
     search_input.fill("test")
-    page.locator("button[type='submit']").filter(has_text="Search").click()
-
-    # Click first article if available
-    articles = page.locator("article[id^='article-']")
-    if articles.count() < 1:
-        pytest.skip("No search results")
-
-    first_article = articles.first
-    first_article.locator("a").first.click()
-
-    # Wait for localStorage to be set
-    page.wait_for_timeout(100)
+    fresh_page.get_by_role("button", name="Search Articles").click()
 
-    # Use browser back navigation
-    page.go_back()
+    _click_first_article_and_go_back(fresh_page)
 
     # Verify on search results page
-    assert "/search" in page.url
-    assert "q=test" in page.url
-
-    # Verify localStorage has article ID (indicates scroll behavior will work)
-    local_storage_value = page.evaluate(
-        "() => localStorage.getItem('article_highlight')"
-    )
-    assert (
-        local_storage_value is not None
-    ), "localStorage should have article ID for scrolling"
+    assert "/search" in fresh_page.url
+    assert "q=test" in fresh_page.url
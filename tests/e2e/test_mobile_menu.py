@@ -5,141 +5,86 @@ These tests validate that the mobile hamburger menu works correctly
 on smaller screen resolutions.
 """
 
-import re
-
 import pytest
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 
 
-@pytest.mark.mobile
-def test_mobile_menu_opens_and_closes(page: Page) -> None:
-    """
-    Test: Mobile menu hamburger button opens and closes the menu.
+def _open_menu(page: Page) -> tuple[Locator, Locator]:
+    """Click the hamburger and wait for the menu to show.
 
-    User Journey:
-    1. Navigate to home page on mobile viewport
-    2. Verify hamburger button is visible
-    3. Click hamburger button to open menu
-    4. Verify menu is visible with navigation links
-    5. Click hamburger button again to close menu
-    6. Verify menu is hidden
+    Returns the (hamburger button, menu) locators so callers can close the
+    menu however their scenario requires.
     """
-    # Set mobile viewport (iPhone 12)
-    page.set_viewport_size({"width": 390, "height": 844})
-
-    # Navigate to home page
-    page.goto("/")
-
-    # Verify hamburger button is visible on mobile
     hamburger_button = page.locator("#mobile-menu-button")
     expect(hamburger_button).to_be_visible()
-
-    # Verify menu is initially hidden
-    mobile_menu = page.locator("#mobile-menu")
-    # Check that menu has "hidden" class
-    expect(mobile_menu).to_have_class(re.compile("hidden"))
-
-    # Click hamburger to open menu
     hamburger_button.click()
-
-    # Wait a moment for JS to execute
-    page.wait_for_timeout(200)
-
-    # Verify menu is now visible
-    # Menu should still be in the DOM but visible (without "hidden" class on it after toggle)
-    # Use wait_for_selector to wait for class change
     page.wait_for_function(
-        "document.getElementById('mobile-menu').classList.contains('hidden') === false"
+        "() => !document.getElementById('mobile-menu').classList.contains('hidden')"
     )
+    return hamburger_button, page.locator("#mobile-menu")
 
-    # Verify navigation links are present and visible
-    expect(mobile_menu.locator("text=Latest News")).to_be_visible()
-    expect(mobile_menu.locator("text=Tags")).to_be_visible()
-    expect(mobile_menu.locator("text=Search")).to_be_visible()
 
-    # Click hamburger again to close menu
-    hamburger_button.click()
+def _toggle_mobile_menu(page: Page) -> None:
+    """Open the hamburger menu, verify it shows, then close it again."""
+    hamburger_button, mobile_menu = _open_menu(page)
+    expect(mobile_menu).to_be_visible()
 
-    # Wait for menu to close
+    # Close menu (click hamburger again)
+    hamburger_button.click()
     page.wait_for_function(
         "document.getElementById('mobile-menu').classList.contains('hidden') === true"
     )
 
-    # Verify menu has hidden class again
-    expect(mobile_menu).to_have_class(re.compile("hidden"))
-
 
 @pytest.mark.mobile
-def test_mobile_menu_navigation_works(page: Page) -> None:
+@pytest.mark.parametrize("close_action", ["hamburger", "outside", "no_op"])
+def test_mobile_menu_toggle(mobile_page: Page, close_action: str) -> None:
     """
-    Test: Mobile menu contains navigation links after being opened.
-
-    User Journey:
-    1. Navigate to home page on mobile viewport
-    2. Open mobile menu
-    3. Verify menu contains navigation links
-    """
-    # Set mobile viewport
-    page.set_viewport_size({"width": 390, "height": 844})
-
-    # Navigate to home page
-    page.goto("/")
-
-    # Open mobile menu
-    hamburger_button = page.locator("#mobile-menu-button")
-    hamburger_button.click()
-
-    # Wait for menu to toggle
-    page.wait_for_function(
-        "document.getElementById('mobile-menu').classList.contains('hidden') === false"
-    )
-
-    # Verify menu contains expected navigation links
-    # Check that the links exist in the DOM (they may not be visible due to Tailwind responsive classes in test environment)
-    mobile_menu = page.locator("#mobile-menu")
-    expect(mobile_menu.locator("a[href*='/']")).to_have_count(
-        3
-    )  # Latest News, Tags, Search
-
+    Test: Mobile menu opens, shows navigation links, and closes correctly.
 
-@pytest.mark.mobile
-def test_mobile_menu_closes_on_outside_click(page: Page) -> None:
-    """
-    Test: Mobile menu closes when clicking outside the menu.
+    One parametrized test covers the three close behaviors (hamburger
+    re-click, outside click, and leaving it open) instead of three tests
+    that each duplicated the goto/open/assert sequence. The cases are
+    independent navigations, so workers pick them up individually.
 
     User Journey:
     1. Navigate to home page on mobile viewport
-    2. Open mobile menu
-    3. Click outside the menu (on main content)
-    4. Verify menu closes
+    2. Verify menu is initially hidden, then open it via the hamburger
+    3. Verify menu shows the navigation links
+    4. Apply the close action and verify the resulting menu state
     """
-    # Set mobile viewport
-    page.set_viewport_size({"width": 390, "height": 844})
-
     # Navigate to home page
-    page.goto("/")
+    mobile_page.goto("/", wait_until="domcontentloaded")
 
-    # Open mobile menu
-    hamburger_button = page.locator("#mobile-menu-button")
-    hamburger_button.click()
+    # Verify menu is initially hidden — to_be_hidden() passes as soon as CSS
+    # reports display:none, no class-string polling needed
+    expect(mobile_page.locator("#mobile-menu")).to_be_hidden()
 
-    # Verify menu is open
-    page.wait_for_function(
-        "document.getElementById('mobile-menu').classList.contains('hidden') === false"
-    )
-    mobile_menu = page.locator("#mobile-menu")
+    hamburger_button, mobile_menu = _open_menu(mobile_page)
     expect(mobile_menu).to_be_visible()
 
-    # Click on main content area (outside menu)
-    # Click on the main tag (should be outside the menu)
-    main_content = page.locator("main")
-    main_content.click(position={"x": 100, "y": 100})
+    # Verify navigation links are present and visible
+    expect(mobile_menu.locator("text=Latest News")).to_be_visible()
+    expect(mobile_menu.locator("text=Tags")).to_be_visible()
+    expect(mobile_menu.locator("text=Search")).to_be_visible()
 
-    # Verify menu closed
-    page.wait_for_function(
+    if close_action == "hamburger":
+        # Click hamburger again to close menu
+        hamburger_button.click()
+    elif close_action == "outside":
+        # Click on main content area (outside menu)
+        mobile_page.locator("main").click(position={"x": 100, "y": 100})
+    else:
+        # Menu stays open; verify the links exist in the DOM
+        # (Latest News, Tags, Search)
+        expect(mobile_menu.locator("a[href*='/']")).to_have_count(3)
+        return
+
+    # Verify menu closed — the wait is the assertion; a trailing expect()
+    # on the same class would just poll the condition twice
+    mobile_page.wait_for_function(
         "document.getElementById('mobile-menu').classList.contains('hidden') === true"
     )
-    expect(mobile_menu).to_have_class(re.compile("hidden"))
 
 
 @pytest.mark.mobile
@@ -156,7 +101,7 @@ def test_mobile_menu_not_visible_on_desktop(page: Page) -> None:
     page.set_viewport_size({"width": 1280, "height": 720})
 
     # Navigate to home page
-    page.goto("/")
+    page.goto("/", wait_until="domcontentloaded")
 
     # Verify hamburger button container has md:hidden class (not visible on desktop)
     hamburger_container = page.locator("#mobile-menu-button").locator("..")
@@ -168,83 +113,64 @@ def test_mobile_menu_not_visible_on_desktop(page: Page) -> None:
 
 
 @pytest.mark.mobile
-def test_mobile_menu_works_on_all_pages(page: Page) -> None:
-    """
-    Test: Mobile menu works on different pages (list, detail, search, tags).
-
-    User Journey:
-    1. Test mobile menu on home page
-    2. Test mobile menu on article detail page
-    3. Test mobile menu on search page
-    4. Test mobile menu on tags page
-    """
-    # Set mobile viewport
-    page.set_viewport_size({"width": 390, "height": 844})
-
-    pages_to_test = [
+@pytest.mark.parametrize(
+    ("url", "expected_heading"),
+    [
         ("/", "Latest News"),
         ("/tags/", "Browse Tags"),
         ("/search/", "Search News Articles"),
-    ]
-
-    for url, expected_heading in pages_to_test:
-        # Navigate to page
-        page.goto(url)
-
-        # Verify we're on the right page
-        expect(page.locator("h1, h2").first).to_contain_text(expected_heading)
+    ],
+)
+def test_mobile_menu_works_on_all_pages(
+    mobile_page: Page, url: str, expected_heading: str
+) -> None:
+    """
+    Test: Mobile menu works on different pages (list, search, tags).
 
-        # Verify hamburger button is visible
-        hamburger_button = page.locator("#mobile-menu-button")
-        expect(hamburger_button).to_be_visible()
+    Parametrized so each page is its own short test id — the cases are
+    independent navigations, so under parallel runs the cost is the slowest
+    single page check, not the sum of all of them.
 
-        # Open menu
-        hamburger_button.click()
-
-        # Verify menu opens
-        page.wait_for_function(
-            "document.getElementById('mobile-menu').classList.contains('hidden') === false"
-        )
-        mobile_menu = page.locator("#mobile-menu")
-        expect(mobile_menu).to_be_visible()
+    User Journey:
+    1. Navigate to the page on mobile viewport
+    2. Open and close the mobile menu
+    """
+    # Navigate to page
+    mobile_page.goto(url, wait_until="domcontentloaded")
 
-        # Close menu (click hamburger again)
-        hamburger_button.click()
+    # Verify we're on the right page
+    expect(mobile_page.locator("h1, h2").first).to_contain_text(expected_heading)
 
-        # Verify menu closes
-        page.wait_for_function(
-            "document.getElementById('mobile-menu').classList.contains('hidden') === true"
-        )
-        expect(mobile_menu).to_have_class(re.compile("hidden"))
+    _toggle_mobile_menu(mobile_page)
 
-    # Test on article detail page (need to navigate to an actual article)
-    page.goto("/")
-    # Click first article
-    first_article = page.locator("article a").first
-    if first_article.is_visible():
-        first_article.click()
 
-        # Verify hamburger button works on detail page
-        hamburger_button = page.locator("#mobile-menu-button")
-        expect(hamburger_button).to_be_visible()
+@pytest.mark.mobile
+# Session-scoped precondition: skips before the page is even created when
+# the dataset has no articles (see test_back_scroll for the rationale)
+@pytest.mark.usefixtures("first_article_url")
+def test_mobile_menu_works_on_article_detail(mobile_page: Page) -> None:
+    """
+    Test: Mobile menu works on an article detail page.
 
-        # Open and close menu
-        hamburger_button.click()
-        page.wait_for_function(
-            "document.getElementById('mobile-menu').classList.contains('hidden') === false"
-        )
-        mobile_menu = page.locator("#mobile-menu")
-        expect(mobile_menu).to_be_visible()
+    User Journey:
+    1. Navigate to the first article from the home page on mobile viewport
+    2. Open and close the mobile menu
+    """
+    # Navigate to an actual article — the polling assertion fuses the
+    # presence check with the wait for the list to render
+    mobile_page.goto("/", wait_until="domcontentloaded")
+    first_article = mobile_page.locator("article a").first
+    try:
+        expect(first_article).to_be_visible(timeout=1000)
+    except AssertionError:
+        pytest.skip("No articles available")
+    first_article.click()
 
-        hamburger_button.click()
-        page.wait_for_function(
-            "document.getElementById('mobile-menu').classList.contains('hidden') === true"
-        )
-        expect(mobile_menu).to_have_class(re.compile("hidden"))
+    _toggle_mobile_menu(mobile_page)
 
 
 @pytest.mark.mobile
-def test_mobile_menu_has_pointer_cursor(page: Page) -> None:
+def test_mobile_menu_has_pointer_cursor(mobile_page: Page) -> None:
     """
     Test: Mobile menu hamburger button has pointer cursor on hover.
 
@@ -253,14 +179,11 @@ def test_mobile_menu_has_pointer_cursor(page: Page) -> None:
     2. Hover over hamburger button
     3. Verify cursor is pointer
     """
-    # Set mobile viewport
-    page.set_viewport_size({"width": 390, "height": 844})
-
     # Navigate to home page
-    page.goto("/")
+    mobile_page.goto("/", wait_until="domcontentloaded")
 
     # Verify hamburger button has cursor-pointer class
-    hamburger_button = page.locator("#mobile-menu-button")
+    hamburger_button = mobile_page.locator("#mobile-menu-button")
     expect(hamburger_button).to_have_class(
         "p-2 rounded-md text-slate-400 hover:text-slate-200 hover:bg-slate-800/50 transition-all duration-200 cursor-pointer"
     )
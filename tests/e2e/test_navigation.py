@@ -23,77 +23,87 @@ def test_tag_browsing_journey(page: Page) -> None:
     6. Navigate back to tags index
     """
     # Navigate to tags index
-    page.goto("/tags/")
+    page.goto("/tags/", wait_until="domcontentloaded")
 
     # Verify tags index loaded
     expect(page.locator("h1")).to_contain_text("Browse Tags")
 
-    # Click on first tag (extract tag name from h2, not the whole card)
+    # Click on first tag (extract tag name from h2, not the whole card).
+    # The polling assertion fuses the presence check with the wait for the
+    # tag grid to render, and skipping early keeps the journey unindented.
     first_tag_link = page.locator("a[href*='/tag/']").first
-    if first_tag_link.is_visible():
-        # Get tag name from the h2 element, not the whole card
-        tag_name = first_tag_link.locator("h2").inner_text()
-        first_tag_link.click()
+    try:
+        expect(first_tag_link).to_be_visible(timeout=1000)
+    except AssertionError:
+        pytest.skip("No tags available for browsing test")
 
-        # Verify on tag detail page (URL includes tag slug and query params)
-        assert "/tag/" in page.url
-        # h1 contains the tag name (and possibly article count like "Accessibility\n4 articles")
-        page_h1 = page.locator("h1").inner_text()
-        # Check tag name is in the h1 text (h1 might have additional text like article count)
-        assert tag_name.strip().lower() in page_h1.strip().lower()
+    # Get tag name from the h2 element, not the whole card
+    tag_name = first_tag_link.locator("h2").inner_text()
+    first_tag_link.click()
 
-        # Click on first article for this tag
-        first_article = page.locator("article").first
-        if first_article.is_visible():
-            first_article.locator("a").first.click()
+    # Verify on tag detail page (URL includes tag slug and query params)
+    assert "/tag/" in page.url
+    # h1 contains the tag name (and possibly article count like "Accessibility\n4 articles")
+    page_h1 = page.locator("h1").inner_text()
+    # Check tag name is in the h1 text (h1 might have additional text like article count)
+    assert tag_name.strip().lower() in page_h1.strip().lower()
 
-            # Verify on article detail page
-            expect(page.locator("h1")).to_be_visible()
+    # Click on first article for this tag
+    first_article = page.locator("article").first
+    try:
+        expect(first_article).to_be_visible(timeout=1000)
+    except AssertionError:
+        pytest.skip("No articles for this tag")
 
-            # Click back to tag
-            back_to_tag = page.get_by_text(f"← Back to {tag_name}", exact=False)
-            if back_to_tag.is_visible():
-                back_to_tag.click()
+    page.locator("article a").first.click()
 
-                # Verify back on tag page
-                assert "/tag/" in page.url
+    # Verify on article detail page
+    expect(page.locator("h1")).to_be_visible()
 
-                # Click back to tags index
-                back_to_index = page.get_by_text("← Back to all tags", exact=False)
-                if back_to_index.is_visible():
-                    back_to_index.click()
-                    expect(page).to_have_url("/tags/")
-    else:
-        pytest.skip("No tags available for browsing test")
+    # Click back to tag
+    back_to_tag = page.get_by_text(f"← Back to {tag_name}", exact=False)
+    if back_to_tag.is_visible():
+        back_to_tag.click()
+
+        # Verify back on tag page
+        assert "/tag/" in page.url
+
+        # Click back to tags index
+        back_to_index = page.get_by_text("← Back to all tags", exact=False)
+        if back_to_index.is_visible():
+            back_to_index.click()
+            expect(page).to_have_url("/tags/")
 
 
 @pytest.mark.navigation
-def test_navigation_clean_urls(page: Page) -> None:
+def test_navigation_clean_urls(mocked_page: Page) -> None:
     """
     Test: Verify article detail URLs are clean (no navigation context params).
 
     Validates that we use localStorage + browser back navigation instead of
-    complex URL parameters for navigation context.
+    complex URL parameters for navigation context. Only URL structure is
+    asserted, so the search leg runs against fixture HTML — no embedding
+    call or ranking SQL behind the navigation.
     """
-    # Test from news list page 2
-    page.goto("/?page=2")
-    if page.locator("article").first.is_visible():
-        page.locator("article").first.locator("a").first.click()
+    # Test from news list page 2 (real backend; the route only matches search)
+    mocked_page.goto("/?page=2", wait_until="domcontentloaded")
+    if mocked_page.locator("article").first.is_visible():
+        mocked_page.locator("article a").first.click()
 
         # Verify NO navigation context parameters in URL (clean URLs)
-        assert "from_page" not in page.url
-        assert "highlight_article" not in page.url
+        assert "from_page" not in mocked_page.url
+        assert "highlight_article" not in mocked_page.url
         # URL should just be clean article URL like /123/article-slug/ (no query params)
-        assert "?" not in page.url
+        assert "?" not in mocked_page.url
 
-    # Test from search results
-    page.goto("/search/?q=test&type=hybrid")
-    if page.locator("article").first.is_visible():
-        page.locator("article").first.locator("a").first.click()
+    # Test from search results (served from fixture HTML)
+    mocked_page.goto("/search/?q=test&type=hybrid", wait_until="domcontentloaded")
+    if mocked_page.locator("article").first.is_visible():
+        mocked_page.locator("article a").first.click()
 
         # Verify NO navigation context parameters (clean URLs)
-        assert "from_search" not in page.url
-        assert "highlight_article" not in page.url
+        assert "from_search" not in mocked_page.url
+        assert "highlight_article" not in mocked_page.url
         # Should have clean article URL, not search context params
 
 
@@ -110,7 +120,7 @@ def test_header_navigation(page: Page) -> None:
     5. Verify all navigation works
     """
     # Navigate to homepage
-    page.goto("/")
+    page.goto("/", wait_until="domcontentloaded")
 
     # Find and click home/logo link
     home_link = page.locator("a[href='/'], .logo, .site-title").first
@@ -124,20 +134,19 @@ def test_header_navigation(page: Page) -> None:
         expect(page).to_have_url("/tags/")
 
         # Navigate back to home
-        page.goto("/")
+        page.goto("/", wait_until="domcontentloaded")
         expect(page).to_have_url("/")
 
 
 @pytest.mark.navigation
-def test_breadcrumb_navigation(page: Page) -> None:
+def test_breadcrumb_navigation(page: Page, first_article_url: str) -> None:
     """
     Test: Verify breadcrumb navigation (if implemented).
 
     Validates that breadcrumbs display correctly and are clickable.
     """
-    # Navigate to article detail
-    page.goto("/")
-    page.locator("article").first.locator("a").first.click()
+    # Navigate to article detail directly
+    page.goto(first_article_url, wait_until="domcontentloaded")
 
     # Look for breadcrumbs
     breadcrumb = page.locator(".breadcrumb, .breadcrumbs, nav[aria-label='breadcrumb']")
@@ -164,7 +173,7 @@ def test_404_page_navigation(page: Page) -> None:
     3. Click link back to homepage
     """
     # Navigate to non-existent article
-    page.goto("/999999/nonexistent-article/")
+    page.goto("/999999/nonexistent-article/", wait_until="domcontentloaded")
 
     # Verify 404 page or error message
     # Django typically returns 404 status but page might still render
@@ -185,7 +194,7 @@ def test_keyboard_navigation(page: Page) -> None:
     Validates that users can navigate using Tab and Enter keys.
     """
     # Navigate to homepage
-    page.goto("/")
+    page.goto("/", wait_until="domcontentloaded")
 
     # Press Tab to focus on first interactive element
     page.keyboard.press("Tab")
@@ -201,10 +210,13 @@ def test_keyboard_navigation(page: Page) -> None:
     # Tab to first article link
     for _ in range(5):  # Tab a few times to reach article link
         page.keyboard.press("Tab")
-        focused = page.evaluate("document.activeElement")
-        if focused and "article" in page.evaluate(
-            "document.activeElement.closest('article') ? 'article' : ''"
-        ):
+        # One evaluate per Tab instead of two — each evaluate is a CDP
+        # round-trip, and a single call can answer both questions
+        active = page.evaluate(
+            "() => ({tag: document.activeElement.tagName,"
+            " inArticle: !!document.activeElement.closest('article')})"
+        )
+        if active["inArticle"]:
             # Press Enter to activate link
             page.keyboard.press("Enter")
             # Wait for navigation (use domcontentloaded instead of networkidle)
@@ -227,7 +239,7 @@ def test_mobile_navigation_menu(mobile_page: Page) -> None:
     4. Verify navigation works
     """
     # Navigate to homepage
-    mobile_page.goto("/")
+    mobile_page.goto("/", wait_until="domcontentloaded")
 
     # Look for mobile menu toggle (hamburger icon)
     menu_toggle = mobile_page.locator(
@@ -14,19 +14,32 @@ from playwright.sync_api import Page, expect
 
 
 @pytest.mark.search
-def test_basic_search_flow(page: Page) -> None:
+@pytest.mark.parametrize(
+    "page_fixture",
+    [
+        pytest.param("page", id="desktop"),
+        pytest.param("mobile_page", marks=pytest.mark.mobile, id="mobile"),
+    ],
+)
+def test_basic_search_flow(request: pytest.FixtureRequest, page_fixture: str) -> None:
     """
-    Test: User performs a basic search from homepage.
+    Test: User performs a basic search, on desktop and mobile viewports.
+
+    One body parametrized over the shared desktop and mobile page fixtures
+    replaces a near-duplicate mobile copy of this test; the two viewport
+    cases are independent navigations, so workers schedule them separately.
 
     User Journey:
-    1. Visit homepage
+    1. Visit search page
     2. Enter search query in search box
     3. Submit search
     4. Verify search results page displays
     5. Verify query is preserved in search box
     """
+    page: Page = request.getfixturevalue(page_fixture)
+
     # Navigate to search page (homepage doesn't have search box)
-    page.goto("/search/")
+    page.goto("/search/", wait_until="domcontentloaded")
 
     # Enter search query
     search_input = page.locator("input[name='q']")
@@ -34,8 +47,7 @@ def test_basic_search_flow(page: Page) -> None:
     search_input.fill("technology")
 
     # Submit search
-    search_button = page.locator("button[type='submit']").filter(has_text="Search")
-    search_button.click()
+    page.get_by_role("button", name="Search Articles").click()
 
     # Verify on search results page (type defaults to hybrid but isn't in URL if not explicitly selected)
     assert "/search" in page.url
@@ -46,6 +58,10 @@ def test_basic_search_flow(page: Page) -> None:
     # Verify query preserved in search box
     expect(page.locator("input[name='q']")).to_have_value("technology")
 
+    # Verify search type selector is accessible on either viewport (radio
+    # buttons exist, though hidden with sr-only)
+    expect(page.locator("input[type='radio'][value='hybrid']")).to_be_attached()
+
 
 @pytest.mark.search
 def test_search_type_switching(page: Page) -> None:
@@ -59,7 +75,7 @@ def test_search_type_switching(page: Page) -> None:
     4. Verify results update for each type
     """
     # Navigate to search page with explicit hybrid type
-    page.goto("/search/?q=AI&type=hybrid")
+    page.goto("/search/?q=AI&type=hybrid", wait_until="domcontentloaded")
 
     # Verify hybrid search is checked (only when explicitly in URL)
     hybrid_radio = page.locator("input[type='radio'][value='hybrid']")
@@ -70,7 +86,7 @@ def test_search_type_switching(page: Page) -> None:
     vector_radio.check(force=True)
 
     # Submit search with new type
-    page.locator("button[type='submit']").filter(has_text="Search").click()
+    page.get_by_role("button", name="Search Articles").click()
 
     # Verify URL updated to vector search (check params, not exact URL)
     assert "q=AI" in page.url
@@ -82,7 +98,7 @@ def test_search_type_switching(page: Page) -> None:
     text_radio.check(force=True)
 
     # Submit search
-    page.locator("button[type='submit']").filter(has_text="Search").click()
+    page.get_by_role("button", name="Search Articles").click()
 
     # Verify URL updated to text search (check params, not exact URL)
     assert "q=AI" in page.url
@@ -103,30 +119,32 @@ def test_search_to_article_preserves_context(page: Page) -> None:
     5. Verify search query and type preserved
     """
     # Perform search (use URL params that Django understands)
-    page.goto("/search?q=machine+learning&type=text")
+    page.goto("/search?q=machine+learning&type=text", wait_until="domcontentloaded")
 
-    # Click on first search result if available
+    # Click on first search result if available — the polling assertion
+    # fuses the presence check with the wait for results to render
     first_result = page.locator("article").first
+    try:
+        expect(first_result).to_be_visible(timeout=1000)
+    except AssertionError:
+        pytest.skip("No search results available for this test")
 
-    if first_result.is_visible():
-        first_result.locator("a").first.click()
+    page.locator("article a").first.click()
 
-        # Verify on article detail page
-        expect(page.locator("h1")).to_be_visible()
+    # Verify on article detail page
+    expect(page.locator("h1")).to_be_visible()
 
-        # Find back to search link (without arrow)
-        back_link = page.locator("a").filter(has_text="Back")
-        expect(back_link.first).to_be_visible()
-        back_link.first.click()
+    # Find the back link via its stable test id (no anchor text scan)
+    back_link = page.get_by_test_id("back-link")
+    expect(back_link).to_be_visible()
+    back_link.click()
 
-        # Verify returned to search with query preserved (check params, not exact URL)
-        assert "/search" in page.url
-        assert "machine" in page.url and "learning" in page.url
-        assert "type=text" in page.url
-        expect(page.locator("input[name='q']")).to_have_value("machine learning")
-        expect(page.locator("input[type='radio'][value='text']")).to_be_checked()
-    else:
-        pytest.skip("No search results available for this test")
+    # Verify returned to search with query preserved (check params, not exact URL)
+    assert "/search" in page.url
+    assert "machine" in page.url and "learning" in page.url
+    assert "type=text" in page.url
+    expect(page.locator("input[name='q']")).to_have_value("machine learning")
+    expect(page.locator("input[type='radio'][value='text']")).to_be_checked()
 
 
 @pytest.mark.search
@@ -140,10 +158,10 @@ def test_empty_search_shows_message(page: Page) -> None:
     3. Verify "no results" or "enter query" message
     """
     # Navigate to search page
-    page.goto("/search/")
+    page.goto("/search/", wait_until="domcontentloaded")
 
     # Submit empty search
-    page.locator("button[type='submit']").filter(has_text="Search").click()
+    page.get_by_role("button", name="Search Articles").click()
 
     # Verify still on search page (empty search doesn't add query params)
     assert "/search" in page.url
@@ -153,8 +171,10 @@ def test_empty_search_shows_message(page: Page) -> None:
     no_results = page.locator(".no-results, .empty-state, p").filter(
         has_text="no results"
     )
-    if no_results.count() > 0:
-        expect(no_results.first).to_be_visible()
+    try:
+        expect(no_results.first).to_be_visible(timeout=500)
+    except AssertionError:
+        pass  # Empty state not rendered with this markup
 
 
 @pytest.mark.search
@@ -169,26 +189,34 @@ def test_search_results_display_snippets(page: Page) -> None:
     - Tags (if visible)
     """
     # Perform search
-    page.goto("/search/?q=data&type=hybrid")
+    page.goto("/search/?q=data&type=hybrid", wait_until="domcontentloaded")
 
-    # Get first search result
+    # Get first search result — the polling assertion fuses the presence
+    # check with the wait for results to render
     first_result = page.locator("article").first
+    try:
+        expect(first_result).to_be_visible(timeout=1000)
+    except AssertionError:
+        pytest.skip("No search results available for this test")
 
-    if first_result.is_visible():
-        # Verify title/headline
-        expect(first_result.locator("h2, h3")).to_be_visible()
+    # Verify title/headline
+    expect(first_result.locator("h2, h3")).to_be_visible()
 
-        # Verify summary or snippet
-        summary = first_result.locator(".summary, .excerpt, p")
-        if summary.count() > 0:
-            expect(summary.first).to_be_visible()
+    # Verify summary or snippet (selector depends on card markup)
+    try:
+        expect(first_result.locator(".summary, .excerpt, p").first).to_be_visible(
+            timeout=500
+        )
+    except AssertionError:
+        pass  # No snippet in this card markup
 
-        # Verify date
-        date = first_result.locator(".date, time, .article-date")
-        if date.count() > 0:
-            expect(date.first).to_be_visible()
-    else:
-        pytest.skip("No search results available for this test")
+    # Verify date (selector depends on card markup)
+    try:
+        expect(first_result.locator(".date, time, .article-date").first).to_be_visible(
+            timeout=500
+        )
+    except AssertionError:
+        pass  # No date in this card markup
 
 
 @pytest.mark.search
@@ -200,61 +228,18 @@ def test_search_performance(page: Page) -> None:
     Validates that search completes within 2 seconds.
     """
     # Navigate to search page
-    page.goto("/search/")
+    page.goto("/search/", wait_until="domcontentloaded")
 
     # Fill search query
     search_input = page.locator("input[name='q']")
     search_input.fill("artificial intelligence")
 
-    # Measure search time
-    import time
-
-    start_time = time.time()
-
     # Submit search
-    page.locator("button[type='submit']").filter(has_text="Search").click()
+    page.get_by_role("button", name="Search Articles").click()
 
-    # Wait for results to load (check for search results header - use first h2)
+    # The expect timeout is the performance budget: if the results header
+    # isn't there within 2s, Playwright fails the test. Manual time.time()
+    # bracketing measured the same thing with added clock-skew flakiness.
     expect(page.locator("h2").first).to_contain_text(
         'Search Results for "artificial intelligence"', timeout=2000
     )
-
-    end_time = time.time()
-    search_time = end_time - start_time
-
-    # Assert search completed within 2 seconds
-    assert search_time < 2.0, f"Search took {search_time:.2f}s, expected < 2.0s"
-
-
-@pytest.mark.search
-@pytest.mark.mobile
-def test_search_on_mobile(mobile_page: Page) -> None:
-    """
-    Test: Verify search works on mobile viewport.
-
-    User Journey:
-    1. Open homepage on mobile
-    2. Enter search query
-    3. Submit search
-    4. Verify mobile-friendly results
-    """
-    # Navigate to search page
-    mobile_page.goto("/search/")
-
-    # Enter search query
-    search_input = mobile_page.locator("input[name='q']")
-    expect(search_input).to_be_visible()
-    search_input.fill("news")
-
-    # Submit search
-    mobile_page.locator("button[type='submit']").filter(has_text="Search").click()
-
-    # Verify on search results page (no type in URL when not explicitly selected)
-    assert "/search" in mobile_page.url
-    assert "q=news" in mobile_page.url
-
-    # Verify results display on mobile (use first h2 for results header)
-    expect(mobile_page.locator("h2").first).to_contain_text('Search Results for "news"')
-
-    # Verify search type selector is accessible (radio buttons exist, though hidden with sr-only)
-    expect(mobile_page.locator("input[type='radio'][value='hybrid']")).to_be_attached()
@@ -0,0 +1,112 @@
+"""
+Chunk-based screenshot comparison for visual regression.
+
+Pixel-equal comparison of two screenshots false-positives on any
+dynamic content (timestamps, rotating articles) and anti-aliasing
+jitter. Comparing fixed-size chunks by mean absolute difference instead
+tolerates that noise while still localizing real layout changes to a
+grid cell. Everything is vectorized NumPy — one reshape and one
+reduction, no per-pixel Python loop.
+
+Typical use alongside the perceptual-hash gate in the visual test: when
+the hash drifts, a chunk diff of the saved screenshots pinpoints which
+regions actually changed.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+# 40px squares: small enough to localize a change to one card or byline,
+# large enough that sub-pixel rendering jitter averages out
+DEFAULT_CHUNK_SIZE = 40
+
+# Mean absolute per-channel difference (0-255 scale) above which a chunk
+# counts as changed
+DEFAULT_THRESHOLD = 8.0
+
+
+def _load_chunks(path: Path, chunk_size: int) -> np.ndarray:
+    """
+    Load an image as a (rows, cols) grid of chunk_size² RGB chunks.
+
+    The image is cropped to the largest multiple of chunk_size in each
+    dimension so the reshape is exact; edge slivers smaller than a chunk
+    carry no layout information worth comparing.
+    """
+    pixels = np.asarray(Image.open(path).convert("RGB"), dtype=np.float32)
+    rows = pixels.shape[0] // chunk_size
+    cols = pixels.shape[1] // chunk_size
+    pixels = pixels[: rows * chunk_size, : cols * chunk_size]
+    return pixels.reshape(rows, chunk_size, cols, chunk_size, 3)
+
+
+def _chunk_means(chunks_a: np.ndarray, chunks_b: np.ndarray) -> np.ndarray:
+    """Return the per-chunk mean absolute difference between two chunk grids."""
+    return np.abs(chunks_a - chunks_b).mean(axis=(1, 3, 4))
+
+
+def changed_chunks(
+    baseline_path: Path,
+    candidate_path: Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    threshold: float = DEFAULT_THRESHOLD,
+    control_path: Optional[Path] = None,
+) -> list[tuple[int, int]]:
+    """
+    Return the (row, col) grid cells where candidate differs from baseline.
+
+    A control screenshot — a second capture of the baseline page — marks
+    the naturally varying regions: any chunk that differs between baseline
+    and control (dates, rotating content) is excluded from the comparison,
+    so only chunks that are stable in the baseline can flag a regression.
+
+    Args:
+        baseline_path: Golden screenshot
+        candidate_path: Screenshot from the current run
+        chunk_size: Square chunk edge in pixels
+        threshold: Mean absolute difference above which a chunk is changed
+        control_path: Optional second capture of the baseline page
+
+    Returns:
+        Grid coordinates of changed chunks, row-major
+    """
+    baseline = _load_chunks(baseline_path, chunk_size)
+    candidate = _load_chunks(candidate_path, chunk_size)
+
+    # Compare only the grid both images cover
+    rows = min(baseline.shape[0], candidate.shape[0])
+    cols = min(baseline.shape[2], candidate.shape[2])
+    baseline = baseline[:rows, :, :cols]
+    candidate = candidate[:rows, :, :cols]
+
+    changed = _chunk_means(baseline, candidate) > threshold
+
+    if control_path is not None:
+        control = _load_chunks(control_path, chunk_size)[:rows, :, :cols]
+        naturally_varying = _chunk_means(baseline, control) > threshold
+        changed &= ~naturally_varying
+
+    coordinates = np.argwhere(changed)
+    return [(int(row), int(col)) for row, col in coordinates]
+
+
+def images_match(
+    baseline_path: Path,
+    candidate_path: Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    threshold: float = DEFAULT_THRESHOLD,
+    control_path: Optional[Path] = None,
+) -> bool:
+    """Return True when no chunk differs beyond the threshold."""
+    return not changed_chunks(
+        baseline_path,
+        candidate_path,
+        chunk_size=chunk_size,
+        threshold=threshold,
+        control_path=control_path,
+    )
@@ -1,5 +1,17 @@
+from typing import TYPE_CHECKING, Optional
+
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render
+from django.template.loader import get_template, render_to_string
+
+if TYPE_CHECKING:
+    from django.template.backends.base import _EngineTemplate
+
+# Compiled 404 template, loaded once per process. Crawler-driven 404s can be
+# a hot path, so the handler skips the per-request loader lookup entirely
+# instead of relying on the production cached loader to make it cheap.
+# Typed as the engine-agnostic template protocol get_template returns, not
+# the Django-backend class it happens to be at runtime.
+_template_404: Optional["_EngineTemplate"] = None
 
 
 def handler404(request: HttpRequest, exception: Exception) -> HttpResponse:
@@ -7,20 +19,33 @@ def handler404(request: HttpRequest, exception: Exception) -> HttpResponse:
     Custom 404 error handler.
     Only used when DEBUG=False in production.
     """
-    return render(
-        request,
-        "404.html",
-        {
-            "exception": exception,
-        },
+    global _template_404
+    if _template_404 is None:
+        _template_404 = get_template("404.html")
+    return HttpResponse(
+        _template_404.render({"exception": exception}, request),
         status=404,
     )
 
 
+# 500.html rendered once per process, without a request. If the original
+# error came from a context processor (auth, DB), rendering with the request
+# would re-trigger it and cascade; the static body sidesteps the template
+# engine and every processor on the error path. Rendered lazily rather than
+# at import so the URLconf the template's {% url %} tags need is loaded.
+_rendered_500: Optional[bytes] = None
+
+
 def handler500(request: HttpRequest) -> HttpResponse:
     """
     Custom 500 error handler.
     Only used when DEBUG=False in production.
-    Note: In 500 errors, context may be limited to avoid additional errors.
+    Serves a body pre-rendered without request context, so the handler can't
+    cascade into a second error if a context processor caused the first one.
     """
-    return render(request, "500.html", status=500)
+    global _rendered_500
+    if _rendered_500 is None:
+        _rendered_500 = render_to_string("500.html").encode("utf-8")
+    return HttpResponse(
+        _rendered_500, status=500, content_type="text/html; charset=utf-8"
+    )